@@ -0,0 +1 @@
+"""Benchmarks for python-toon (not shipped with the package)."""
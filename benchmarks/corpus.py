@@ -0,0 +1,160 @@
+"""Seeded synthetic corpora for TOON benchmarks.
+
+Every generator takes a ``size`` and a ``seed`` and returns the same value for
+the same arguments, so results are comparable across runs and versions.
+"""
+
+import random
+import string
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_SEED = 1234
+
+_WORDS = [
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
+]
+_STATUSES = ["pending", "shipped", "delivered", "cancelled", "returned"]
+_REGIONS = ["eu-west", "eu-central", "us-east", "us-west", "ap-south"]
+
+
+def _word(rng: random.Random) -> str:
+    return rng.choice(_WORDS)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(_word(rng) for _ in range(words))
+
+
+def wide_table(size: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Uniform rows with 20 primitive columns (tabular arrays)."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(size):
+        row: Dict[str, Any] = {
+            "id": i,
+            "status": rng.choice(_STATUSES),
+            "region": rng.choice(_REGIONS),
+        }
+        for c in range(5):
+            row[f"int_{c}"] = rng.randint(-10_000, 10_000)
+        for c in range(5):
+            row[f"float_{c}"] = round(rng.uniform(-1000, 1000), 3)
+        for c in range(4):
+            row[f"label_{c}"] = _word(rng)
+        row["active"] = rng.random() < 0.5
+        row["note"] = None if rng.random() < 0.3 else _sentence(rng, 3)
+        row["sku"] = "".join(rng.choices(string.ascii_uppercase + string.digits, k=8))
+        rows.append(row)
+    return {"rows": rows}
+
+
+def deep_nesting(size: int, seed: int = DEFAULT_SEED, depth: int = 12) -> Dict[str, Any]:
+    """``size`` leaves spread over chains of nested objects ``depth`` levels deep."""
+    rng = random.Random(seed)
+    root: Dict[str, Any] = {}
+    for i in range(max(1, size // depth)):
+        node = root.setdefault(f"branch_{i}", {})
+        for level in range(depth - 1):
+            node[f"value_{level}"] = rng.randint(0, 1000)
+            node = node.setdefault(f"level_{level}", {})
+        node["leaf"] = _word(rng)
+    return root
+
+
+def long_strings(size: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Long text fields full of quotes, backslashes, newlines and delimiters."""
+    rng = random.Random(seed)
+    specials = ['"', "\\", "\n", "\t", ",", ":", "|", "[", "]"]
+    entries = []
+    for i in range(size):
+        parts = []
+        for _ in range(rng.randint(10, 40)):
+            parts.append(_word(rng))
+            if rng.random() < 0.3:
+                parts.append(rng.choice(specials))
+        entries.append({"id": i, "title": _sentence(rng, 4), "body": " ".join(parts)})
+    return {"logs": entries}
+
+
+def mixed_arrays(size: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Non-uniform arrays that fall back to list format."""
+    rng = random.Random(seed)
+    items: List[Any] = []
+    for i in range(size):
+        kind = rng.randint(0, 4)
+        if kind == 0:
+            items.append(rng.randint(0, 1000))
+        elif kind == 1:
+            items.append(_sentence(rng, 2))
+        elif kind == 2:
+            items.append({"id": i, "tags": [_word(rng) for _ in range(3)]})
+        elif kind == 3:
+            items.append({"id": i, "meta": {"owner": _word(rng), "score": rng.random()}})
+        else:
+            items.append([rng.randint(0, 9) for _ in range(4)])
+    return {"items": items}
+
+
+def numeric_matrix(size: int, seed: int = DEFAULT_SEED, columns: int = 16) -> Dict[str, Any]:
+    """A ``size`` x ``columns`` matrix of floats (arrays of arrays)."""
+    rng = random.Random(seed)
+    return {"matrix": [[round(rng.gauss(0, 100), 4) for _ in range(columns)] for _ in range(size)]}
+
+
+def pydantic_models(size: int, seed: int = DEFAULT_SEED) -> Optional[List[Any]]:
+    """A list of Pydantic models with descriptions, or None without pydantic."""
+    try:
+        from pydantic import BaseModel, Field
+    except ImportError:
+        return None
+
+    class Order(BaseModel):
+        id: int = Field(description="Order identifier")
+        status: str = Field(description="Fulfilment status")
+        region: str
+        total: float
+        express: bool
+
+    rng = random.Random(seed)
+    return [
+        Order(
+            id=i,
+            status=rng.choice(_STATUSES),
+            region=rng.choice(_REGIONS),
+            total=round(rng.uniform(1, 500), 2),
+            express=rng.random() < 0.2,
+        )
+        for i in range(size)
+    ]
+
+
+CORPORA: Dict[str, Callable[..., Any]] = {
+    "wide_table": wide_table,
+    "deep_nesting": deep_nesting,
+    "long_strings": long_strings,
+    "mixed_arrays": mixed_arrays,
+    "numeric_matrix": numeric_matrix,
+    "pydantic_models": pydantic_models,
+}
+
+
+def generate(name: str, size: int, seed: int = DEFAULT_SEED) -> Any:
+    """Generate a corpus by name.
+
+    Args:
+        name: Key of ``CORPORA``
+        size: Number of rows/items/leaves
+        seed: Random seed
+
+    Returns:
+        Generated value, or None if its optional dependency is missing
+    """
+    return CORPORA[name](size, seed)
+
+
+def to_json_compatible(value: Any) -> Any:
+    """Return a value ``json.dumps`` accepts (dumps Pydantic models)."""
+    if isinstance(value, list) and value and hasattr(value[0], "model_dump"):
+        return [item.model_dump() for item in value]
+    return value
@@ -0,0 +1,225 @@
+"""Encoder/decoder throughput benchmark with json as the baseline.
+
+Usage:
+    python -m benchmarks.throughput                       # run, print table
+    python -m benchmarks.throughput -o results.json       # also save results
+    python -m benchmarks.throughput --sizes 100 1000 10000 --corpus wide_table
+    python -m benchmarks.throughput --compare old.json new.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import toon
+from toon import DecodeOptions, decode, encode
+
+from .corpus import CORPORA, DEFAULT_SEED, generate, to_json_compatible
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+# Decoding our own encoder output needs no validation
+TRUSTED = DecodeOptions(trusted=True)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """Time a callable and measure its peak allocation.
+
+    Args:
+        func: Zero-argument callable to measure
+        repeat: Number of timed runs; the fastest one is reported
+
+    Returns:
+        Tuple of (best wall time in seconds, peak traced bytes)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    # Separate run: tracemalloc slows allocation-heavy code considerably
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run_case(name: str, size: int, seed: int, repeat: int) -> List[Dict[str, Any]]:
+    """Benchmark encode/decode of one corpus at one size against json."""
+    value = generate(name, size, seed)
+    if value is None:
+        print(f"skipping {name}: optional dependency not installed", file=sys.stderr)
+        return []
+
+    plain = to_json_compatible(value)
+    toon_text = encode(value)
+    json_text = json.dumps(plain)
+    toon_bytes = len(toon_text.encode("utf-8"))
+    json_bytes = len(json_text.encode("utf-8"))
+
+    cases = [
+        ("encode", "toon", lambda: encode(value), toon_bytes),
+        ("encode", "json", lambda: json.dumps(plain), json_bytes),
+        ("decode", "toon", lambda: decode(toon_text), toon_bytes),
+        ("decode", "trusted", lambda: decode(toon_text, TRUSTED), toon_bytes),
+        ("decode", "json", lambda: json.loads(json_text), json_bytes),
+    ]
+
+    results = []
+    for operation, impl, func, text_bytes in cases:
+        seconds, peak = measure(func, repeat)
+        results.append(
+            {
+                "corpus": name,
+                "size": size,
+                "operation": operation,
+                "impl": impl,
+                "seconds": seconds,
+                "mb_per_s": text_bytes / seconds / 1e6 if seconds else None,
+                "text_bytes": text_bytes,
+                "peak_bytes": peak,
+            }
+        )
+    return results
+
+
+def run(corpora: List[str], sizes: List[int], seed: int, repeat: int) -> Dict[str, Any]:
+    """Run the full benchmark matrix.
+
+    Returns:
+        JSON-serializable results with environment metadata
+    """
+    results = []
+    for name in corpora:
+        for size in sizes:
+            results.extend(run_case(name, size, seed, repeat))
+    return {
+        "meta": {
+            "toon_version": toon.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def format_results(report: Dict[str, Any]) -> str:
+    """Render results as a table with the toon/json time ratio.
+
+    Trusted decoding (``DecodeOptions(trusted=True)``) is listed as its own
+    ``decode:trusted`` row.
+    """
+    results = report["results"]
+    by_key = {(r["corpus"], r["size"], r["operation"], r["impl"]): r for r in results}
+    lines = [
+        f"{'corpus':<16} {'size':>7} {'op':<14} {'toon ms':>10} {'json ms':>10} "
+        f"{'ratio':>7} {'toon MB/s':>10} {'toon peak KB':>13} {'json peak KB':>13}"
+    ]
+    for r in results:
+        if r["impl"] == "json":
+            continue
+        base = by_key.get((r["corpus"], r["size"], r["operation"], "json"))
+        if base is None:
+            continue
+        op = r["operation"] if r["impl"] == "toon" else f"{r['operation']}:{r['impl']}"
+        lines.append(
+            f"{r['corpus']:<16} {r['size']:>7} {op:<14} "
+            f"{r['seconds'] * 1e3:>10.2f} {base['seconds'] * 1e3:>10.2f} "
+            f"{r['seconds'] / base['seconds']:>7.1f} {r['mb_per_s'] or 0:>10.2f} "
+            f"{r['peak_bytes'] / 1024:>13.0f} {base['peak_bytes'] / 1024:>13.0f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> Tuple[str, int]:
+    """Compare two saved result files.
+
+    Args:
+        old: Baseline results
+        new: Candidate results
+        threshold: Relative slowdown (or memory growth) reported as a regression
+
+    Returns:
+        Tuple of (report text, number of regressions)
+    """
+    old_by_key = {
+        (r["corpus"], r["size"], r["operation"], r["impl"]): r for r in old["results"]
+    }
+    lines = [
+        f"{'corpus':<16} {'size':>7} {'op':<7} {'impl':<7} {'time':>8} {'peak':>8}",
+    ]
+    regressions = 0
+    for r in new["results"]:
+        key = (r["corpus"], r["size"], r["operation"], r["impl"])
+        base = old_by_key.get(key)
+        if base is None:
+            continue
+        time_ratio = r["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        peak_ratio = r["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else 1.0
+        flag = ""
+        if r["impl"] != "json" and (time_ratio > 1 + threshold or peak_ratio > 1 + threshold):
+            flag = "  REGRESSION"
+            regressions += 1
+        lines.append(
+            f"{r['corpus']:<16} {r['size']:>7} {r['operation']:<7} {r['impl']:<7} "
+            f"{time_ratio:>7.2f}x {peak_ratio:>7.2f}x{flag}"
+        )
+    header = (
+        f"old: toon {old['meta']['toon_version']} (python {old['meta']['python']})  "
+        f"new: toon {new['meta']['toon_version']} (python {new['meta']['python']})"
+    )
+    return "\n".join([header, *lines]), regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--corpus", nargs="+", choices=sorted(CORPORA), default=list(CORPORA))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (default: 5)")
+    parser.add_argument("-o", "--output", help="Write results as JSON to this path")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change reported as a regression by --compare (default: 0.10)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            new = json.load(f)
+        text, regressions = compare(old, new, args.threshold)
+        print(text)
+        return 1 if regressions else 0
+
+    report = run(args.corpus, args.sizes, args.seed, args.repeat)
+    print(format_results(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
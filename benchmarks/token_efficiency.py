@@ -0,0 +1,234 @@
+"""Token-efficiency benchmark: TOON option combinations vs JSON, compact JSON and CSV.
+
+Token counts use the built-in offline estimator (``toon.estimate_tokens``),
+so the benchmark needs no network access or tokenizer downloads. Absolute
+numbers differ per tokenizer; the relative ranking is what matters when
+picking options for an endpoint.
+
+Usage:
+    python -m benchmarks.token_efficiency
+    python -m benchmarks.token_efficiency --size 200 -o tokens.json
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import random
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from toon import encode, estimate_tokens
+
+from .corpus import (
+    DEFAULT_SEED,
+    deep_nesting,
+    long_strings,
+    mixed_arrays,
+    numeric_matrix,
+    to_json_compatible,
+    wide_table,
+)
+
+_NAMES = ["Alice", "Bob", "Charlie", "Dana", "Eve", "Frank", "Grace", "Heidi"]
+_CITIES = ["Berlin", "Madrid", "Paris", "Tokyo", "Toronto", "Sydney"]
+
+
+def users(size: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Flat user records, the typical tabular API payload."""
+    rng = random.Random(seed)
+    return {
+        "users": [
+            {
+                "id": i,
+                "name": rng.choice(_NAMES),
+                "email": f"user{i}@example.com",
+                "age": rng.randint(18, 90),
+                "city": rng.choice(_CITIES),
+                "active": rng.random() < 0.8,
+            }
+            for i in range(size)
+        ]
+    }
+
+
+def orders(size: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Orders with a nested customer and a list of line items."""
+    rng = random.Random(seed)
+    return {
+        "orders": [
+            {
+                "id": f"ORD-{i:05d}",
+                "customer": {"name": rng.choice(_NAMES), "city": rng.choice(_CITIES)},
+                "items": [
+                    {
+                        "sku": f"SKU-{rng.randint(100, 999)}",
+                        "qty": rng.randint(1, 5),
+                        "price": round(rng.uniform(1, 99), 2),
+                    }
+                    for _ in range(rng.randint(1, 4))
+                ],
+                "status": rng.choice(["paid", "shipped", "refunded"]),
+            }
+            for i in range(size)
+        ]
+    }
+
+
+def time_series(size: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Analytics metrics per day."""
+    rng = random.Random(seed)
+    return {
+        "metrics": [
+            {
+                "date": f"2025-{1 + i // 28 % 12:02d}-{1 + i % 28:02d}",
+                "views": rng.randint(1000, 9000),
+                "clicks": rng.randint(10, 900),
+                "conversions": rng.randint(0, 60),
+                "revenue": round(rng.uniform(0, 5000), 2),
+            }
+            for i in range(size)
+        ]
+    }
+
+
+def config(size: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """A nested settings document with tags."""
+    return deep_nesting(size, seed, depth=4)
+
+
+CORPORA: Dict[str, Callable[..., Any]] = {
+    "users": users,
+    "orders": orders,
+    "time_series": time_series,
+    "wide_table": wide_table,
+    "config": config,
+    "long_strings": long_strings,
+    "mixed_arrays": mixed_arrays,
+    "numeric_matrix": numeric_matrix,
+}
+
+DELIMITERS = {"comma": ",", "tab": "\t", "pipe": "|"}
+INDENTS = [2, 1]
+LENGTH_MARKERS = [False, "#"]
+
+
+def toon_variants(value: Any) -> List[Tuple[str, str]]:
+    """Encode a value under every delimiter/indent/length-marker combination."""
+    variants = []
+    for (delimiter_name, delimiter), indent, marker in itertools.product(
+        DELIMITERS.items(), INDENTS, LENGTH_MARKERS
+    ):
+        label = f"toon[{delimiter_name},indent={indent}{',#' if marker else ''}]"
+        options = {"delimiter": delimiter, "indent": indent, "lengthMarker": marker}
+        variants.append((label, encode(value, options)))
+    return variants
+
+
+def to_csv(value: Any) -> Optional[str]:
+    """Render a single flat table as CSV, or None if the value is not one.
+
+    Accepts a list of flat dicts with identical keys, or a dict holding
+    exactly one such list.
+    """
+    rows = value
+    if isinstance(value, dict) and len(value) == 1:
+        rows = next(iter(value.values()))
+    if not isinstance(rows, list) or not rows or not all(isinstance(row, dict) for row in rows):
+        return None
+    fields = list(rows[0].keys())
+    for row in rows:
+        if list(row.keys()) != fields or any(isinstance(v, (dict, list)) for v in row.values()):
+            return None
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fields)
+    for row in rows:
+        writer.writerow([_csv_cell(row[f]) for f in fields])
+    return buffer.getvalue()
+
+
+def _csv_cell(value: Any) -> Any:
+    """Write null as an empty cell and booleans as JSON literals."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return json.dumps(value)
+    return value
+
+
+def measure_corpus(name: str, size: int, seed: int) -> List[Dict[str, Any]]:
+    """Measure bytes and estimated tokens of every format for one corpus."""
+    value = to_json_compatible(CORPORA[name](size, seed))
+    formats: List[Tuple[str, Optional[str]]] = [
+        ("json", json.dumps(value, indent=2)),
+        ("json_compact", json.dumps(value, separators=(",", ":"))),
+        ("csv", to_csv(value)),
+        *toon_variants(value),
+    ]
+
+    json_tokens = estimate_tokens(formats[0][1] or "")
+    compact_tokens = estimate_tokens(formats[1][1] or "")
+    results = []
+    for label, text in formats:
+        if text is None:
+            continue
+        tokens = estimate_tokens(text)
+        results.append(
+            {
+                "corpus": name,
+                "size": size,
+                "format": label,
+                "bytes": len(text.encode("utf-8")),
+                "tokens": tokens,
+                "vs_json": 1 - tokens / json_tokens if json_tokens else 0.0,
+                "vs_json_compact": 1 - tokens / compact_tokens if compact_tokens else 0.0,
+            }
+        )
+    return results
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """Render one block per corpus, best format first, with savings."""
+    lines = []
+    for name in dict.fromkeys(r["corpus"] for r in results):
+        rows = sorted((r for r in results if r["corpus"] == name), key=lambda r: r["tokens"])
+        lines.append(f"== {name} (size={rows[0]['size']}) ==")
+        lines.append(f"{'format':<28} {'bytes':>9} {'tokens':>8} {'vs json':>8} {'vs compact':>11}")
+        for r in rows:
+            lines.append(
+                f"{r['format']:<28} {r['bytes']:>9} {r['tokens']:>8} "
+                f"{r['vs_json'] * 100:>7.1f}% {r['vs_json_compact'] * 100:>10.1f}%"
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--corpus", nargs="+", choices=sorted(CORPORA), default=list(CORPORA))
+    parser.add_argument(
+        "--size", type=int, default=100, help="Rows/items per corpus (default: 100)"
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("-o", "--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.corpus:
+        results.extend(measure_corpus(name, args.size, args.seed))
+
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"size": args.size, "seed": args.seed, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
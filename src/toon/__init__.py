@@ -5,8 +5,42 @@ A compact data format optimized for transmitting structured information to LLMs
 with 30-60% fewer tokens than JSON.
 """
 
-from .encoder import encode
-from .types import Delimiter, DelimiterKey, EncodeOptions
+from .decoder import ToonDecodeError, TupleRows, decode, decode_file, decode_stream, row_class
+from .encoder import encode, encode_chunks, encode_with_stats
+from .events import iterparse
+from .incremental import ToonParser
+from .index import IndexEntry, ToonIndex, build_index
+from .lazy import LazyArray, LazyObject, decode_lazy
+from .profiling import Profiler
+from .stats import PathSize, SizeReport
+from .tokens import estimate_tokens
+from .types import DecodeOptions, Delimiter, DelimiterKey, EncodeOptions
 
 __version__ = "0.1.1"
-__all__ = ["encode", "Delimiter", "DelimiterKey", "EncodeOptions"]
+__all__ = [
+    "encode",
+    "encode_chunks",
+    "encode_with_stats",
+    "estimate_tokens",
+    "decode",
+    "decode_stream",
+    "decode_file",
+    "iterparse",
+    "ToonParser",
+    "decode_lazy",
+    "LazyObject",
+    "LazyArray",
+    "build_index",
+    "ToonIndex",
+    "IndexEntry",
+    "ToonDecodeError",
+    "TupleRows",
+    "row_class",
+    "Delimiter",
+    "DelimiterKey",
+    "EncodeOptions",
+    "DecodeOptions",
+    "SizeReport",
+    "PathSize",
+    "Profiler",
+]
@@ -4,13 +4,21 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 from . import decode, encode
+from .decoder import decode_file
+from .encoder import encode_with_stats
 from .types import DecodeOptions, EncodeOptions
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "stats":
+        return stats_main(argv[1:])
+
     parser = argparse.ArgumentParser(
         prog="toon",
         description="Convert between JSON and TOON formats",
@@ -70,28 +78,42 @@ def main() -> int:
         help="Disable strict validation when decoding",
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--trusted",
+        action="store_true",
+        help="Skip all validation when decoding output of the TOON encoder",
+    )
 
-    # Read input
-    try:
-        if args.input == "-":
-            input_text = sys.stdin.read()
-            input_path = None
-        else:
-            input_path = Path(args.input)
-            if not input_path.exists():
-                print(f"Error: Input file not found: {args.input}", file=sys.stderr)
-                return 1
-            input_text = input_path.read_text(encoding="utf-8")
-    except Exception as e:
-        print(f"Error reading input: {e}", file=sys.stderr)
-        return 1
+    args = parser.parse_args(argv)
 
-    # Determine operation mode
     if args.encode and args.decode:
         print("Error: Cannot specify both --encode and --decode", file=sys.stderr)
         return 1
 
+    # TOON files are decoded from a memory map instead of being read into a string
+    decode_input = args.decode or Path(args.input).suffix.lower() == ".toon"
+    if args.input != "-" and not args.encode and decode_input:
+        if not Path(args.input).exists():
+            print(f"Error: Input file not found: {args.input}", file=sys.stderr)
+            return 1
+        try:
+            options = DecodeOptions(
+                indent=args.indent, strict=not args.no_strict, trusted=args.trusted
+            )
+            data = decode_file(args.input, options)
+            output_text = json.dumps(data, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error during decode: {e}", file=sys.stderr)
+            return 1
+        return _write_output(output_text, args.output)
+
+    # Read input
+    input_text, input_path = _read_input(args.input)
+    if input_text is None:
+        return 1
+
+    # Determine operation mode
+
     if args.encode:
         mode = "encode"
     elif args.decode:
@@ -132,15 +154,107 @@ def main() -> int:
                 input_text,
                 indent=args.indent,
                 strict=not args.no_strict,
+                trusted=args.trusted,
             )
     except Exception as e:
         print(f"Error during {mode}: {e}", file=sys.stderr)
         return 1
 
-    # Write output
+    return _write_output(output_text, args.output)
+
+
+def stats_main(argv: List[str]) -> int:
+    """Entry point for ``toon stats``: report encoded size per key path."""
+    parser = argparse.ArgumentParser(
+        prog="toon stats",
+        description="Show which key paths dominate the size of the TOON encoding",
+    )
+
+    parser.add_argument(
+        "input",
+        type=str,
+        help="Input JSON or TOON file path (or - for stdin)",
+    )
+
+    parser.add_argument(
+        "--delimiter",
+        type=str,
+        choices=[",", "\t", "|"],
+        default=",",
+        help='Array delimiter: , (comma), \\t (tab), | (pipe) (default: ",")',
+    )
+
+    parser.add_argument(
+        "--indent",
+        type=int,
+        default=2,
+        help="Indentation size (default: 2)",
+    )
+
+    parser.add_argument(
+        "--length-marker",
+        action="store_true",
+        help="Add # prefix to array lengths (e.g., items[#3])",
+    )
+
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of paths to list (default: 20)",
+    )
+
+    parser.add_argument(
+        "--sort",
+        choices=["bytes", "tokens", "lines"],
+        default="bytes",
+        help="Sort paths by this measure (default: bytes)",
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the full report as JSON",
+    )
+
+    args = parser.parse_args(argv)
+
+    input_text, _ = _read_input(args.input)
+    if input_text is None:
+        return 1
+
+    try:
+        try:
+            data = json.loads(input_text)
+        except json.JSONDecodeError:
+            data = decode(input_text, DecodeOptions(indent=args.indent))
+
+        options: EncodeOptions = {
+            "indent": args.indent,
+            "delimiter": args.delimiter,
+            "lengthMarker": "#" if args.length_marker else False,
+        }
+        _, report = encode_with_stats(data, options)
+    except Exception as e:
+        print(f"Error during stats: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print(report.format(limit=args.top, by=args.sort))
+    return 0
+
+
+def _write_output(output_text: str, output: Optional[str]) -> int:
+    """Write CLI output to a file, or stdout if no path is given.
+
+    Returns:
+        Exit code
+    """
     try:
-        if args.output:
-            output_path = Path(args.output)
+        if output:
+            output_path = Path(output)
             output_path.write_text(output_text, encoding="utf-8")
         else:
             print(output_text)
@@ -151,6 +265,25 @@ def main() -> int:
     return 0
 
 
+def _read_input(source: str) -> Tuple[Optional[str], Optional[Path]]:
+    """Read CLI input from a file path or stdin ("-").
+
+    Returns:
+        Tuple of (text, path); text is None if reading failed
+    """
+    try:
+        if source == "-":
+            return sys.stdin.read(), None
+        input_path = Path(source)
+        if not input_path.exists():
+            print(f"Error: Input file not found: {source}", file=sys.stderr)
+            return None, None
+        return input_path.read_text(encoding="utf-8"), input_path
+    except Exception as e:
+        print(f"Error reading input: {e}", file=sys.stderr)
+        return None, None
+
+
 def encode_json_to_toon(
     json_text: str,
     delimiter: str = ",",
@@ -186,6 +319,7 @@ def decode_toon_to_json(
     toon_text: str,
     indent: int = 2,
     strict: bool = True,
+    trusted: bool = False,
 ) -> str:
     """Decode TOON text to JSON format.
 
@@ -193,6 +327,7 @@ def decode_toon_to_json(
         toon_text: TOON input string
         indent: Indentation size
         strict: Whether to use strict validation
+        trusted: Whether to skip all validation (input from the TOON encoder)
 
     Returns:
         JSON-formatted string
@@ -200,7 +335,7 @@ def decode_toon_to_json(
     Raises:
         ToonDecodeError: If TOON is invalid
     """
-    options = DecodeOptions(indent=indent, strict=strict)
+    options = DecodeOptions(indent=indent, strict=strict, trusted=trusted)
     data = decode(toon_text, options)
 
     return json.dumps(data, indent=2, ensure_ascii=False)
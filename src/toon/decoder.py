@@ -1,7 +1,14 @@
 """TOON decoder implementation following v1.2 spec."""
 
+import mmap as _mmap
+import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+import time
+from collections import namedtuple
+from functools import lru_cache
+from itertools import chain, islice, starmap
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .constants import (
     BACKSLASH,
@@ -21,6 +28,7 @@ from .constants import (
     TAB,
     TRUE_LITERAL,
 )
+from .profiling import Profiler, count_nodes
 from .types import DecodeOptions, JsonValue
 
 
@@ -29,14 +37,79 @@ class ToonDecodeError(Exception):
     pass
 
 
+# Line kinds produced by classify_line
+LINE_HEADER = 0  # (LINE_HEADER, header_info, inline_content)
+LINE_FIELD = 1  # (LINE_FIELD, parsed_key, value_str)
+LINE_ITEM = 2  # (LINE_ITEM, item_info or None for a bare "-", item_content)
+LINE_TEXT = 3  # (LINE_TEXT, None, None): primitive, tabular row or malformed
+
+LineInfo = Tuple[int, Any, Any]
+
+
 class Line:
-    """Represents a line in the TOON document."""
+    """Represents a line in the TOON document.
+
+    ``content`` is the stripped line, so a blank line has empty content.
+    """
+
+    __slots__ = ("content", "depth", "line_number", "is_blank", "_info")
 
     def __init__(self, content: str, depth: int, line_number: int):
         self.content = content
         self.depth = depth
         self.line_number = line_number
-        self.is_blank = not content.strip()
+        self.is_blank = not content
+        self._info: Optional[LineInfo] = None
+
+    def classify(self) -> LineInfo:
+        """Return ``classify_line(self.content)``, classifying it at most once."""
+        if self._info is None:
+            self._info = classify_line(self.content)
+        return self._info
+
+    def field_info(self) -> LineInfo:
+        """Classify the line as it reads in an object, where "-" is not a list marker."""
+        info = self.classify()
+        if info[0] == LINE_ITEM:
+            return classify_line(self.content, list_items=False)
+        return info
+
+    def header(self) -> Optional[Tuple[Optional[str], int, str, Optional[List[str]]]]:
+        """Return ``parse_header(self.content)``, parsing it at most once."""
+        info = self.field_info()
+        return info[1] if info[0] == LINE_HEADER else None
+
+
+def classify_line(content: str, list_items: bool = True) -> LineInfo:
+    """Classify a stripped line as an array header, field, list item or text.
+
+    The pieces each kind needs are parsed in the same pass and returned with
+    it, so callers never scan the line again.
+
+    Args:
+        content: Stripped line content
+        list_items: Whether a leading "-" marks a list item
+
+    Returns:
+        Tuple of (kind, first, second); see the ``LINE_*`` constants
+
+    Raises:
+        ToonDecodeError: If a header or quoted key is malformed
+    """
+    if list_items and content.startswith(LIST_ITEM_MARKER):
+        item_content = content[len(LIST_ITEM_MARKER):].strip()
+        item_info = classify_line(item_content, list_items=False) if item_content else None
+        return (LINE_ITEM, item_info, item_content)
+
+    header_info = parse_header(content)
+    if header_info is not None:
+        return (LINE_HEADER, header_info, _header_inline_content(content))
+
+    colon = _find_unquoted_colon(content)
+    if colon != -1:
+        return (LINE_FIELD, parse_key(content[:colon]), content[colon + 1:].strip())
+
+    return (LINE_TEXT, None, None)
 
 
 def compute_depth(line: str, indent_size: int, strict: bool) -> int:
@@ -63,6 +136,11 @@ def compute_depth(line: str, indent_size: int, strict: bool) -> int:
     if strict and '\t' in line[:leading_spaces]:
         raise ToonDecodeError("Tabs are not allowed in indentation")
 
+    return _depth_from_spaces(leading_spaces, indent_size, strict)
+
+
+def _depth_from_spaces(leading_spaces: int, indent_size: int, strict: bool) -> int:
+    """Convert a count of leading spaces to a depth (see compute_depth)."""
     # In strict mode, leading spaces must be exact multiple of indent_size
     if strict:
         if leading_spaces % indent_size != 0:
@@ -75,9 +153,33 @@ def compute_depth(line: str, indent_size: int, strict: bool) -> int:
         return leading_spaces // indent_size
 
 
+_ESCAPES = {
+    BACKSLASH + BACKSLASH: BACKSLASH,
+    BACKSLASH + DOUBLE_QUOTE: DOUBLE_QUOTE,
+    BACKSLASH + 'n': NEWLINE,
+    BACKSLASH + 'r': CARRIAGE_RETURN,
+    BACKSLASH + 't': TAB,
+}
+# A backslash and the character it escapes (none at the end of the string)
+_ESCAPE_SEQUENCE = re.compile(r'\\.?', re.DOTALL)
+
+
+def _unescape_match(match: "re.Match[str]") -> str:
+    sequence = match.group()
+    try:
+        return _ESCAPES[sequence]
+    except KeyError:
+        if len(sequence) == 1:
+            raise ToonDecodeError("Unterminated string: missing closing quote") from None
+        raise ToonDecodeError(f"Invalid escape sequence: {sequence}") from None
+
+
 def unescape_string(value: str) -> str:
     """Unescape a quoted string.
 
+    Strings without a backslash are returned as is; otherwise every escape
+    sequence is replaced in a single regex pass.
+
     Args:
         value: Escaped string (without surrounding quotes)
 
@@ -87,30 +189,9 @@ def unescape_string(value: str) -> str:
     Raises:
         ToonDecodeError: If escape sequence is invalid
     """
-    result = []
-    i = 0
-    while i < len(value):
-        if value[i] == BACKSLASH:
-            if i + 1 >= len(value):
-                raise ToonDecodeError("Unterminated string: missing closing quote")
-            next_char = value[i + 1]
-            if next_char == BACKSLASH:
-                result.append(BACKSLASH)
-            elif next_char == DOUBLE_QUOTE:
-                result.append(DOUBLE_QUOTE)
-            elif next_char == 'n':
-                result.append(NEWLINE)
-            elif next_char == 'r':
-                result.append(CARRIAGE_RETURN)
-            elif next_char == 't':
-                result.append(TAB)
-            else:
-                raise ToonDecodeError(f"Invalid escape sequence: \\{next_char}")
-            i += 2
-        else:
-            result.append(value[i])
-            i += 1
-    return ''.join(result)
+    if BACKSLASH not in value:
+        return value
+    return _ESCAPE_SEQUENCE.sub(_unescape_match, value)
 
 
 def parse_primitive(token: str) -> JsonValue:
@@ -163,6 +244,105 @@ def parse_primitive(token: str) -> JsonValue:
     return token
 
 
+# Tokens a specialised column converter handles; anything else falls back
+# to parse_primitive, so every converter returns what parse_primitive would
+_INT_TOKEN = re.compile(r'-?(?:0|[1-9][0-9]*)')
+_FLOAT_TOKEN = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+(?:[eE][+-]?[0-9]+)?|[eE][+-]?[0-9]+)')
+_PLAIN_TOKEN = re.compile(r'[A-Za-z_](?:.*\S)?', re.DOTALL)
+_BOOL_TOKENS = {TRUE_LITERAL: True, FALSE_LITERAL: False}
+
+# Leading rows of a table used to infer its column types
+INFERENCE_ROWS = 32
+
+# Rows of a table whose tokens are converted together, a column at a time
+TABLE_BATCH_ROWS = 4096
+
+
+def _convert_int(token: str) -> JsonValue:
+    if _INT_TOKEN.fullmatch(token):
+        return int(token)
+    return parse_primitive(token)
+
+
+def _convert_float(token: str) -> JsonValue:
+    if _FLOAT_TOKEN.fullmatch(token):
+        return float(token)
+    return parse_primitive(token)
+
+
+def _convert_bool(token: str) -> JsonValue:
+    value = _BOOL_TOKENS.get(token)
+    if value is not None:
+        return value
+    return parse_primitive(token)
+
+
+def _convert_string(token: str) -> JsonValue:
+    if _PLAIN_TOKEN.fullmatch(token) and token != NULL_LITERAL and token not in _BOOL_TOKENS:
+        return token
+    if len(token) >= 2 and token[0] == DOUBLE_QUOTE and token[-1] == DOUBLE_QUOTE:
+        return unescape_string(token[1:-1])
+    return parse_primitive(token)
+
+
+def _token_converter(token: str) -> Callable[[str], JsonValue]:
+    """Return the cheapest converter that handles ``token``."""
+    if token in _BOOL_TOKENS:
+        return _convert_bool
+    if _INT_TOKEN.fullmatch(token):
+        return _convert_int
+    if _FLOAT_TOKEN.fullmatch(token):
+        return _convert_float
+    if token.startswith(DOUBLE_QUOTE) or (token != NULL_LITERAL and _PLAIN_TOKEN.fullmatch(token)):
+        return _convert_string
+    return parse_primitive
+
+
+def _column_converters(
+    samples: List[List[str]], width: int, intern: Optional["InternTable"] = None
+) -> List[Callable[[str], JsonValue]]:
+    """Infer one converter per column from sample rows of tokens.
+
+    A column gets a specialised converter when all its sampled cells agree
+    on a type (nulls aside); otherwise it uses ``parse_primitive``. With
+    ``intern``, converters that can return strings share them through it.
+    """
+    converters = []
+    for j in range(width):
+        kinds = {
+            _token_converter(tokens[j])
+            for tokens in samples
+            if j < len(tokens) and tokens[j] != NULL_LITERAL
+        }
+        convert = kinds.pop() if len(kinds) == 1 else parse_primitive
+        if intern is not None and convert in (_convert_string, parse_primitive):
+            convert = _interning(convert, intern)
+        converters.append(convert)
+    return converters
+
+
+def _interning(
+    convert: Callable[[str], JsonValue], intern: "InternTable"
+) -> Callable[[str], JsonValue]:
+    return lambda token: intern(convert(token))
+
+
+# A quoted segment; an unterminated one runs to the end of the line
+_QUOTED_SEGMENT = re.compile(r'"(?:[^"\\]|\\.)*"?', re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _token_pattern(delimiter: str) -> "re.Pattern[str]":
+    """Compile the scanner for one delimiter: each match is one token.
+
+    A token starts at the beginning of the line or at a delimiter and runs
+    over unquoted characters and whole quoted segments up to the next
+    unquoted delimiter.
+    """
+    d = re.escape(delimiter)
+    return re.compile(f'(?:^|{d})((?:[^"{d}]|{_QUOTED_SEGMENT.pattern})*)', re.DOTALL)
+
+
 def parse_delimited_values(line: str, delimiter: str) -> List[str]:
     """Parse delimiter-separated values, respecting quotes.
 
@@ -173,37 +353,37 @@ def parse_delimited_values(line: str, delimiter: str) -> List[str]:
     Returns:
         List of token strings
     """
-    tokens = []
-    current = []
-    in_quotes = False
-    i = 0
+    if not line:
+        return []
+    if DOUBLE_QUOTE not in line:
+        return line.split(delimiter)
+    return _token_pattern(delimiter).findall(line)
 
-    while i < len(line):
-        char = line[i]
 
-        if char == DOUBLE_QUOTE:
-            in_quotes = not in_quotes
-            current.append(char)
-        elif char == BACKSLASH and i + 1 < len(line) and in_quotes:
-            # In quotes, consume escape sequence
-            current.append(char)
-            current.append(line[i + 1])
-            i += 1
-        elif char == delimiter and not in_quotes:
-            # Split on unquoted delimiter
-            tokens.append(''.join(current))
-            current = []
-            i += 1
-            continue
-        else:
-            current.append(char)
+def split_row(line: str, delimiter: str) -> Optional[List[str]]:
+    """Split a tabular row into tokens, or return None if it is a key-value line.
 
-        i += 1
+    Classification and splitting share one scan: a line is a row unless its
+    first token (everything before the first unquoted delimiter) contains an
+    unquoted colon. Lines without quotes are split with ``str.split``.
 
-    # Add final token
-    if current or tokens:  # Include empty final token if there was a delimiter
-        tokens.append(''.join(current))
+    Args:
+        line: Line content
+        delimiter: Active delimiter
 
+    Returns:
+        List of token strings, or None if the line is not a row
+    """
+    if DOUBLE_QUOTE not in line:
+        tokens = line.split(delimiter)
+        if COLON in tokens[0]:
+            return None
+        return tokens
+
+    tokens = _token_pattern(delimiter).findall(line)
+    first = tokens[0]
+    if COLON in first and COLON in _QUOTED_SEGMENT.sub('', first):
+        return None
     return tokens
 
 
@@ -288,6 +468,7 @@ def parse_header(line: str) -> Optional[Tuple[Optional[str], int, str, Optional[
     return (key, length, delimiter, fields)
 
 
+@lru_cache(maxsize=4096)
 def parse_key(key_str: str) -> str:
     """Parse a key (quoted or unquoted).
 
@@ -322,6 +503,21 @@ def split_key_value(line: str) -> Tuple[str, str]:
     Raises:
         ToonDecodeError: If no colon found
     """
+    colon = _find_unquoted_colon(line)
+    if colon == -1:
+        raise ToonDecodeError("Missing colon after key")
+    return (line[:colon].strip(), line[colon + 1:].strip())
+
+
+def _find_unquoted_colon(line: str) -> int:
+    """Return the index of the first colon outside quotes, or -1."""
+    colon = line.find(COLON)
+    if colon == -1:
+        return -1
+    # Fast path: no quote before the first colon
+    if line.find(DOUBLE_QUOTE, 0, colon) == -1:
+        return colon
+
     in_quotes = False
     i = 0
 
@@ -333,230 +529,776 @@ def split_key_value(line: str) -> Tuple[str, str]:
         elif char == BACKSLASH and i + 1 < len(line) and in_quotes:
             i += 1  # Skip next char
         elif char == COLON and not in_quotes:
-            key = line[:i].strip()
-            value = line[i + 1:].strip()
-            return (key, value)
+            return i
 
         i += 1
 
-    raise ToonDecodeError("Missing colon after key")
+    return -1
 
 
-def decode(input_str: str, options: Optional[DecodeOptions] = None) -> JsonValue:
+def decode(
+    input_str: str,
+    options: Optional[DecodeOptions] = None,
+    select: Optional[Iterable[str]] = None,
+    into: Any = None,
+    workers: Optional[int] = None,
+) -> JsonValue:
     """Decode a TOON-formatted string to a Python value.
 
     Args:
         input_str: TOON-formatted string
         options: Optional decoding options
+        select: Optional dotted paths to decode, e.g. ``["users[*].id",
+            "meta.version"]``; everything else is skipped (see
+            ``parse_selection``)
+        into: Optional target type, e.g. ``List[Order]`` or ``Config``;
+            objects are built as dataclasses or Pydantic models and values
+            are checked against the declared field types. Tabular arrays
+            of models are mapped column by column onto the model fields,
+            parsing each cell as its field's type. Pydantic models are
+            built with ``model_construct``, so their validators and field
+            constraints do not run.
+        workers: Optional number of processes; with more than one, the rows
+            of tabular arrays declaring at least ``PARALLEL_MIN_ROWS`` rows
+            are decoded in a process pool (see ``toon.parallel``). The
+            result is the same as without. Ignored with ``select`` or ``into``.
+
+    Returns:
+        Decoded Python value, or an instance of ``into``
+
+    Raises:
+        ToonDecodeError: If input is malformed, or does not match ``into``
+        ValueError: If ``options.tabular`` is not a known output, or
+            ``workers`` is less than 1
+        ImportError: If ``options.tabular`` needs NumPy or pandas and it is
+            not installed
+        TypeError: If ``into`` is not a supported target type
+    """
+    if options is None:
+        options = DecodeOptions()
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    strict = _validating(options)
+    lines = _iter_lines(_split_lines(input_str), options.indent, strict)
+    selection = parse_selection(select) if select is not None else None
+    if selection is not None:
+        return _decode_line_iterator(lines, options, "decode.select", selection, into)
+
+    if workers is not None and workers > 1 and into is None:
+        from .parallel import decode_parallel
+
+        return decode_parallel(input_str, options, workers)
+
+    if options.profiler is not None:
+        return _decode_profiled(input_str, lines, options, options.profiler, into)
+
+    context = DecodeContext.from_options(options, into)
+    reader = _text_reader(input_str, options, lines)
+    return context.finish(_decode_root(reader, strict, None, context))
+
+
+def _text_reader(input_str: str, options: DecodeOptions, lines: Iterator[Line]) -> "LineReader":
+    """Return the reader decode() builds over ``lines``, the lines of ``input_str``."""
+    if options.trusted:
+        return _TrustedLineReader(_split_lines(input_str), options.indent)
+    return LineReader(lines)
+
+
+def _validating(options: DecodeOptions) -> bool:
+    """Whether input is checked: in strict mode, unless it is trusted."""
+    return options.strict and not options.trusted
+
+
+def decode_stream(
+    source: Union[IO[str], IO[bytes], Iterable[Union[str, bytes]]],
+    options: Optional[DecodeOptions] = None,
+    select: Optional[Iterable[str]] = None,
+    into: Any = None,
+) -> JsonValue:
+    """Decode TOON from a file object or any iterable of lines.
+
+    Lines are read lazily and values are built as they arrive; only one line
+    of lookahead is held at a time, so peak memory is the decoded result plus
+    a small constant. Bytes are decoded as UTF-8.
+
+    Args:
+        source: Open file (text or binary) or iterable of lines, with or
+            without trailing newlines
+        options: Optional decoding options
+        select: Optional dotted paths to decode (see ``decode``)
+        into: Optional target type (see ``decode``)
+
+    Returns:
+        Decoded Python value, or an instance of ``into``
+
+    Raises:
+        ToonDecodeError: If input is malformed
+    """
+    if options is None:
+        options = DecodeOptions()
+
+    lines = _iter_lines(_strip_newlines(source), options.indent, _validating(options))
+    selection = parse_selection(select) if select is not None else None
+    return _decode_line_iterator(lines, options, "decode.stream", selection, into)
+
+
+def decode_file(
+    path: Union[str, "os.PathLike[str]"],
+    options: Optional[DecodeOptions] = None,
+    mmap: bool = True,
+    select: Optional[Iterable[str]] = None,
+    into: Any = None,
+) -> JsonValue:
+    """Decode a UTF-8 TOON file.
+
+    With ``mmap=True`` the file is memory-mapped and parsed in place: line
+    boundaries and indentation are found on the bytes, and only the content
+    of each line is decoded to ``str``. Neither the whole text nor a list of
+    lines is ever built, and the mapped pages are shared through the OS page
+    cache. With ``mmap=False`` the file is read line by line through
+    ``decode_stream``.
+
+    Args:
+        path: Path of the file
+        options: Optional decoding options
+        mmap: Whether to memory-map the file
+        select: Optional dotted paths to decode (see ``decode``)
+        into: Optional target type (see ``decode``)
 
     Returns:
-        Decoded Python value
+        Decoded Python value, or an instance of ``into``
 
     Raises:
         ToonDecodeError: If input is malformed
+        OSError: If the file cannot be read
     """
     if options is None:
         options = DecodeOptions()
 
-    indent_size = options.indent
-    strict = options.strict
+    with open(path, "rb") as f:
+        if not mmap:
+            return decode_stream(f, options, select, into)
+        selection = parse_selection(select) if select is not None else None
+        if os.fstat(f.fileno()).st_size == 0:
+            return _decode_line_iterator(iter(()), options, "decode.file", selection, into)
+        with _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ) as buffer:
+            lines = _iter_buffer_lines(buffer, options.indent, _validating(options))
+            return _decode_line_iterator(lines, options, "decode.file", selection, into)
+
+
+def _decode_line_iterator(
+    lines: Iterator[Line],
+    options: DecodeOptions,
+    phase: str,
+    selection: Optional["Selection"] = None,
+    into: Any = None,
+) -> JsonValue:
+    """Decode lines as they are produced, timing the whole run as one phase."""
+    context = DecodeContext.from_options(options, into)
+    strict = _validating(options)
+    if options.profiler is None:
+        result = _decode_root(LineReader(lines), strict, selection, context)
+        return context.finish(result)
+
+    profiler = options.profiler
+    context.profiler = profiler
+    with profiler.call("decode", {"parse_key": parse_key}):
+        with profiler.phase(phase):
+            result = context.finish(_decode_root(LineReader(lines), strict, selection, context))
+        profiler.count("decode.nodes", count_nodes(result))
+        context.report(profiler)
+    return result
+
 
-    # Split into lines
-    raw_lines = input_str.split('\n')
+def _iter_buffer_lines(
+    buffer: Union[bytes, _mmap.mmap], indent_size: int, strict: bool
+) -> Iterator[Line]:
+    """Yield Line objects straight from a UTF-8 bytes buffer.
 
-    # Process lines: compute depth and filter blanks outside arrays
-    lines: List[Line] = []
-    for i, raw in enumerate(raw_lines):
-        # Skip trailing newline
-        if i == len(raw_lines) - 1 and not raw.strip():
+    Indentation is counted on the bytes; only the content after it is
+    decoded. Blank lines are dropped in strict mode, as in ``_iter_lines``.
+    """
+    size = len(buffer)
+    position = 0
+    number = 0
+    while position < size:
+        newline = buffer.find(b"\n", position)
+        if newline == -1:
+            newline = size
+        raw = buffer[position:newline]
+        position = newline + 1
+        number += 1
+
+        content_bytes = raw.lstrip(b" ")
+        content = content_bytes.decode("utf-8").strip()
+        if not content and strict:
             continue
+        depth = _depth_from_spaces(len(raw) - len(content_bytes), indent_size, strict)
+        yield Line(content, depth, number)
 
-        depth = compute_depth(raw, indent_size, strict)
-        line = Line(raw.strip(), depth, i + 1)
 
-        # Keep all lines for now (we'll handle blank line rules during parsing)
-        if line.content or not strict:
-            lines.append(line)
+def _split_lines(text: str) -> Iterator[str]:
+    """Yield the lines of ``text`` one at a time, like ``text.split('\\n')``.
+
+    Only the current line is held, never the full list of line strings.
+    """
+    position = 0
+    while True:
+        newline = text.find('\n', position)
+        if newline == -1:
+            yield text[position:]
+            return
+        yield text[position:newline]
+        position = newline + 1
+
+
+def _strip_newlines(source: Iterable[Union[str, bytes]]) -> Iterator[str]:
+    """Yield lines without their line terminator, decoding bytes as UTF-8."""
+    for raw in source:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        if raw.endswith('\n'):
+            raw = raw[:-1]
+        yield raw
+
+
+def _decode_profiled(
+    input_str: str,
+    lines: Iterator[Line],
+    options: DecodeOptions,
+    profiler: Profiler,
+    into: Any = None,
+) -> JsonValue:
+    """Run decode() with every phase timed by the profiler.
+
+    Lines are scanned and classified only as the builder reaches them, as
+    without a profiler, so the result and any error are the same. The time
+    spent on each line is split off from ``decode.build`` into
+    ``decode.scan`` and ``decode.headers``.
+    """
+    context = DecodeContext.from_options(options, into)
+    context.profiler = profiler
+    strict = _validating(options)
+    # Seconds spent scanning and classifying lines
+    spent = [0.0, 0.0]
+    with profiler.call("decode", {"parse_key": parse_key}):
+        start = time.perf_counter()
+        try:
+            reader = _text_reader(input_str, options, lines)
+            reader._lines = _profiled_lines(chain([reader.line], reader._lines), spent)
+            reader.advance()
+            result = _decode_root(reader, strict, None, context)
+        finally:
+            build = time.perf_counter() - start - spent[0] - spent[1]
+            profiler.add_time("decode.scan", spent[0])
+            profiler.add_time("decode.headers", spent[1])
+            profiler.add_time("decode.build", build)
+        if context.into is not None:
+            with profiler.phase("decode.into"):
+                result = context.finish(result)
+        profiler.count("decode.nodes", count_nodes(result))
+        context.report(profiler)
+    return result
 
-    # Remove blank lines outside arrays (Section 12)
-    # For simplicity, we'll handle this during parsing
 
-    # Check for empty input
-    non_blank_lines = [ln for ln in lines if not ln.is_blank]
-    if not non_blank_lines:
+def _profiled_lines(lines: Iterator[Optional[Line]], spent: List[float]) -> Iterator[Line]:
+    """Yield ``lines`` up to the first None, classifying each one.
+
+    The time taken to produce each line is added to ``spent[0]`` and the
+    time to classify it to ``spent[1]``. A line that fails to classify is
+    passed on as is; the builder raises the same error if it reaches it.
+    """
+    perf_counter = time.perf_counter
+    while True:
+        start = perf_counter()
+        line = next(lines, None)
+        scanned = perf_counter()
+        spent[0] += scanned - start
+        if line is None:
+            return
+        try:
+            line.classify()
+        except ToonDecodeError:
+            pass
+        spent[1] += perf_counter() - scanned
+        yield line
+
+
+def _iter_lines(raw_lines: Iterable[str], indent_size: int, strict: bool) -> Iterator[Line]:
+    """Compute the depth of raw lines and wrap them in Line objects.
+
+    A trailing blank line (the empty string after a final newline) is
+    dropped. Blank lines are dropped entirely in strict mode and kept in
+    non-strict mode; blank line rules are applied during parsing.
+    """
+    # A blank line is only emitted once we know it is not the last one
+    pending_blank: Optional[Tuple[str, int]] = None
+    for number, raw in enumerate(raw_lines, 1):
+        if pending_blank is not None:
+            blank_raw, blank_number = pending_blank
+            pending_blank = None
+            depth = compute_depth(blank_raw, indent_size, strict)
+            if not strict:
+                yield Line("", depth, blank_number)
+
+        content = raw.strip()
+        if not content:
+            pending_blank = (raw, number)
+            continue
+
+        yield Line(content, compute_depth(raw, indent_size, strict), number)
+
+
+class LineReader:
+    """Forward-only cursor over lines with one line of lookahead.
+
+    ``line`` is the next unconsumed line, or None at the end of input.
+    Decoding functions consume the lines that belong to them and leave the
+    reader on the first line they do not own.
+    """
+
+    def __init__(self, lines: Iterator[Line]) -> None:
+        self._lines = lines
+        self.line: Optional[Line] = next(lines, None)
+
+    def advance(self) -> None:
+        """Move to the next line."""
+        self.line = next(self._lines, None)
+
+    def take(self, count: int) -> List[str]:
+        """Consume up to ``count`` lines and return their content."""
+        contents: List[str] = []
+        while len(contents) < count and self.line is not None:
+            contents.append(self.line.content)
+            self.advance()
+        return contents
+
+
+class _TrustedLineReader(LineReader):
+    """LineReader over raw lines for trusted input (``DecodeOptions.trusted``).
+
+    Depth is the floor of the indentation over ``indent_size`` with no
+    checks, and ``take`` strips the next lines without building ``Line``
+    objects for them.
+    """
+
+    def __init__(self, raw_lines: Iterator[str], indent_size: int) -> None:
+        self._raw = iter(raw_lines)
+        # Lines consumed by take(), to keep line numbers in step
+        self._taken = [0]
+        super().__init__(_iter_trusted_lines(self._raw, indent_size, self._taken))
+
+    def take(self, count: int) -> List[str]:
+        if self.line is None or count <= 0:
+            return []
+        contents = [self.line.content]
+        contents.extend([raw.strip() for raw in islice(self._raw, count - 1)])
+        self._taken[0] += len(contents) - 1
+        self.advance()
+        return contents
+
+
+def _iter_trusted_lines(
+    raw_lines: Iterator[str], indent_size: int, taken: List[int]
+) -> Iterator[Line]:
+    """Yield the non-blank lines of ``raw_lines`` with unchecked depths."""
+    for number, raw in enumerate(raw_lines, 1):
+        content = raw.strip()
+        if content:
+            depth = (len(raw) - len(raw.lstrip(' '))) // indent_size
+            yield Line(content, depth, number + taken[0])
+
+
+def _decode_root(
+    reader: LineReader,
+    strict: bool,
+    selection: Optional["Selection"] = None,
+    context: Optional["DecodeContext"] = None,
+) -> JsonValue:
+    """Decode the root value (Section 5), projected onto ``selection`` if given."""
+    if context is None:
+        context = DecodeContext()
+    # Skip leading blank lines
+    while reader.line is not None and reader.line.is_blank:
+        reader.advance()
+
+    first_line = reader.line
+    if first_line is None:
         if strict:
             raise ToonDecodeError("Empty input")
         return None
 
-    # Determine root form (Section 5)
-    first_line = non_blank_lines[0]
-
     # Check if it's a root array header
-    header_info = parse_header(first_line.content)
-    if header_info is not None and header_info[0] is None:  # No key = root array
-        # Root array
-        return decode_array(lines, 0, 0, header_info, strict)
-
-    # Check if it's a single primitive
-    if len(non_blank_lines) == 1:
-        line_content = first_line.content
-        # Check if it's not a key-value line
-        try:
-            split_key_value(line_content)
-            # It's a key-value, so root object
-        except ToonDecodeError:
-            # Not a key-value, check if it's a header
-            if header_info is None:
-                # Single primitive
-                return parse_primitive(line_content)
+    kind, header_info, inline_content = first_line.field_info()
+    if kind == LINE_HEADER and header_info[0] is None:  # No key = root array
+        if selection is not None:
+            content, depth = first_line.content, first_line.depth
+            return _select_array(reader, content, depth, header_info, strict, selection, context)
+        return _decode_array(reader, header_info, inline_content, first_line.depth, strict, context)
+
+    if kind == LINE_TEXT:
+        # Neither a key-value line nor a header: a single primitive,
+        # provided nothing else follows
+        reader.advance()
+        while reader.line is not None and reader.line.is_blank:
+            reader.advance()
+        if reader.line is None:
+            return parse_primitive(first_line.content)
+        if strict:
+            raise ToonDecodeError("Missing colon after key")
 
     # Otherwise, root object
-    return decode_object(lines, 0, 0, strict)
+    if selection is not None:
+        return _select_object(reader, first_line.depth, strict, selection, context)
+    return decode_object(reader, first_line.depth, strict, context)
 
 
 def decode_object(
-    lines: List[Line],
-    start_idx: int,
-    parent_depth: int,
-    strict: bool
+    reader: LineReader, depth: int, strict: bool, context: Optional["DecodeContext"] = None
 ) -> Dict[str, Any]:
-    """Decode an object starting at given line index.
+    """Decode the fields of an object.
+
+    Consumes every line deeper than ``depth - 1``; lines indented deeper
+    than ``depth`` that do not belong to a field are skipped.
 
     Args:
-        lines: List of lines
-        start_idx: Starting line index
-        parent_depth: Parent indentation depth
+        reader: Line reader positioned on the first field
+        depth: Indentation depth of the object's fields
         strict: Strict mode flag
+        context: Optional per-decode settings (tabular output, interning)
 
     Returns:
         Decoded object
     """
-    result = {}
-    i = start_idx
-    expected_depth = parent_depth if start_idx == 0 else parent_depth + 1
+    result: Dict[str, Any] = {}
+    root = [result]
+    _build(reader, [_Frame(depth, result, root, 0)], strict, context or DecodeContext())
+    return root[0]
 
-    while i < len(lines):
-        line = lines[i]
 
-        # Skip blank lines outside arrays (allowed)
-        if line.is_blank:
-            i += 1
-            continue
+class _Frame:
+    """An open object or list-format array on the decoder's stack.
 
-        # Stop if we've dedented below expected depth
-        if line.depth < expected_depth:
-            break
+    Object frames hold fields at ``depth``; list frames hold items whose
+    ``- `` marker is at ``depth``. ``parent[key]`` is where the container
+    was stored, so a hook's result can replace it when the frame closes.
+    """
+
+    __slots__ = ("depth", "container", "parent", "key", "is_list", "expected")
+
+    def __init__(
+        self,
+        depth: int,
+        container: Any,
+        parent: Any,
+        key: Any,
+        is_list: bool = False,
+        expected: int = 0,
+    ) -> None:
+        self.depth = depth
+        self.container = container
+        self.parent = parent
+        self.key = key
+        self.is_list = is_list
+        self.expected = expected
 
-        # Skip lines that are too deeply indented (they belong to nested structures)
-        if line.depth > expected_depth:
-            i += 1
+
+def _build(reader: LineReader, stack: List[_Frame], strict: bool, context: "DecodeContext") -> None:
+    """Decode nested objects and list arrays with an explicit stack.
+
+    Each line is looked at once by the frame that owns it, and nesting
+    depth is bounded by memory rather than the interpreter's recursion
+    limit. Returns when every frame on ``stack`` has been closed.
+    """
+    while stack:
+        frame = stack[-1]
+        line = reader.line
+
+        # Close the frame at end of input or when we've dedented below it
+        if line is None or (not line.is_blank and line.depth < frame.depth):
+            stack.pop()
+            _close_frame(frame, strict, context)
             continue
 
-        content = line.content
+        if line.is_blank:
+            # Blank lines are allowed between fields, not inside arrays
+            if frame.is_list and strict:
+                raise ToonDecodeError("Blank lines not allowed inside arrays")
+            reader.advance()
+            continue
 
-        # Check for array header
-        header_info = parse_header(content)
-        if header_info is not None:
-            key, length, delimiter, fields = header_info
-            if key is not None:
-                # Array field
-                array_val, next_i = decode_array_from_header(
-                    lines, i, line.depth, header_info, strict
-                )
-                result[key] = array_val
-                i = next_i
+        if frame.is_list:
+            if not line.content.startswith(LIST_ITEM_MARKER):
+                # Not a list item, end of array
+                stack.pop()
+                _close_frame(frame, strict, context)
                 continue
+            _decode_list_item(reader, line, frame.container, stack, strict, context)
+            continue
 
-        # Must be a key-value line
-        try:
-            key_str, value_str = split_key_value(content)
-        except ToonDecodeError:
-            # Invalid line, skip in non-strict mode
-            if strict:
-                raise
-            i += 1
+        # Skip lines that are too deeply indented (they belong to nothing)
+        if line.depth > frame.depth:
+            reader.advance()
             continue
 
-        key = parse_key(key_str)
+        _decode_field(reader, line, frame.container, stack, strict, context)
 
-        # Check if value is empty (nested object)
-        if not value_str:
-            # Nested object
-            result[key] = decode_object(lines, i + 1, line.depth, strict)
-            # Skip past nested object
-            i += 1
-            while i < len(lines) and lines[i].depth > line.depth:
-                i += 1
-        else:
-            # Primitive value
-            result[key] = parse_primitive(value_str)
-            i += 1
 
-    return result
+def _close_frame(frame: _Frame, strict: bool, context: "DecodeContext") -> None:
+    if strict and frame.is_list and len(frame.container) != frame.expected:
+        raise ToonDecodeError(
+            f"Expected {frame.expected} items, but got {len(frame.container)}"
+        )
+    hook = context.array_factory if frame.is_list else context.object_hook
+    if hook is not None:
+        frame.parent[frame.key] = hook(frame.container)
+
+
+def _decode_field(
+    reader: LineReader,
+    line: Line,
+    result: Dict[str, Any],
+    stack: List[_Frame],
+    strict: bool,
+    context: "DecodeContext",
+) -> None:
+    """Decode one field line into ``result``, pushing a frame for nested values."""
+    kind, first, second = line.field_info()
+    keys = context.intern_keys
+
+    # Check for array header
+    if kind == LINE_HEADER:
+        if first[0] is not None:
+            key = first[0] if keys is None else keys(first[0])
+            result[key] = _open_array(
+                reader, first, second, line.depth, stack, strict, context, result, key
+            )
+            return
+        # A keyless header inside an object reads as a "[N]" key
+        key_str, second = split_key_value(line.content)
+        first = parse_key(key_str)
+    elif kind == LINE_TEXT:
+        # Invalid line, skip in non-strict mode
+        if strict:
+            raise ToonDecodeError("Missing colon after key")
+        reader.advance()
+        return
+
+    reader.advance()
+    if keys is not None:
+        first = keys(first)
+
+    if not second:
+        # Nested object
+        child: Dict[str, Any] = {}
+        result[first] = child
+        stack.append(_Frame(line.depth + 1, child, result, first))
+    else:
+        # Primitive value
+        value = parse_primitive(second)
+        result[first] = value if context.intern_values is None else context.intern_values(value)
+
+
+def _decode_list_item(
+    reader: LineReader,
+    line: Line,
+    items: List[Any],
+    stack: List[_Frame],
+    strict: bool,
+    context: "DecodeContext",
+) -> None:
+    """Decode one ``- `` line into ``items``, pushing frames for nested values."""
+    _, item_info, item_content = line.classify()
+
+    if item_info is None:
+        # "-" alone: object whose fields follow at depth +1 (or empty object)
+        reader.advance()
+        obj: Dict[str, Any] = {}
+        items.append(obj)
+        stack.append(_Frame(line.depth + 1, obj, items, len(items) - 1))
+        return
+
+    # Check what kind of item this is
+    kind, first, second = item_info
+    keys, values = context.intern_keys, context.intern_values
+    if kind == LINE_HEADER:
+        # It's an array header: - [N]: ... or - key[N]: ...
+        key, length, item_delim, fields = first
+
+        if key is not None:
+            # - key[N]: array field in object; remaining fields at depth +1
+            obj = {}
+            items.append(obj)
+            stack.append(_Frame(line.depth + 1, obj, items, len(items) - 1))
+            if keys is not None:
+                key = keys(key)
+            obj[key] = _open_array(
+                reader, first, second, line.depth, stack, strict, context, obj, key
+            )
+            return
+
+        if second or length == 0:
+            # - [N]: inline array
+            array = decode_inline_array(second, item_delim, length, strict)
+            items.append(array if context.array_factory is None else context.array_factory(array))
+            reader.advance()
+            return
+
+        # A keyless header without values reads as a "[N]" key
+        key_str, second = split_key_value(item_content)
+        kind, first = LINE_FIELD, parse_key(key_str)
+
+    if kind == LINE_TEXT:
+        # Not an object, must be a primitive
+        value = parse_primitive(item_content)
+        items.append(value if values is None else values(value))
+        reader.advance()
+        return
+
+    # It's an object item; remaining fields at depth +1
+    obj = {}
+    items.append(obj)
+    reader.advance()
+    stack.append(_Frame(line.depth + 1, obj, items, len(items) - 1))
+    if keys is not None:
+        first = keys(first)
+
+    # First field
+    if not second:
+        # First field is nested object: fields at depth +2
+        child: Dict[str, Any] = {}
+        obj[first] = child
+        stack.append(_Frame(line.depth + 2, child, obj, first))
+    else:
+        # First field is primitive
+        value = parse_primitive(second)
+        obj[first] = value if values is None else values(value)
 
 
-def decode_array_from_header(
-    lines: List[Line],
-    header_idx: int,
-    header_depth: int,
+def _open_array(
+    reader: LineReader,
     header_info: Tuple[Optional[str], int, str, Optional[List[str]]],
-    strict: bool
-) -> Tuple[List[Any], int]:
-    """Decode array starting from a header line.
-
-    Args:
-        lines: List of lines
-        header_idx: Index of header line
-        header_depth: Depth of header line
-        header_info: Parsed header info
-        strict: Strict mode flag
-
-    Returns:
-        Tuple of (decoded array, next line index)
+    inline_content: str,
+    header_depth: int,
+    stack: List[_Frame],
+    strict: bool,
+    context: "DecodeContext",
+    parent: Any,
+    parent_key: Any,
+) -> Any:
+    """Start decoding an array at its header line.
+
+    Inline and tabular arrays are decoded completely. A list-format array
+    is returned empty with a frame pushed for its items; the caller stores
+    it at ``parent[parent_key]``.
     """
     key, length, delimiter, fields = header_info
-    header_line = lines[header_idx].content
-
-    # Check if there's inline content after the colon
-    colon_idx = header_line.rfind(COLON)
-    inline_content = header_line[colon_idx + 1:].strip()
+    if context.profiler is not None:
+        context.profiler.count(_array_counter(length, fields, inline_content))
+    if context.parallel is not None and fields is not None and not inline_content:
+        # Rows decoded by worker processes (see toon.parallel)
+        planned = context.parallel.pop(reader.line.line_number, None)  # type: ignore[union-attr]
+        if planned is not None:
+            reader.advance()
+            return context.table(fields, planned.result())
+    reader.advance()
 
     if inline_content:
         # Inline primitive array
-        return decode_inline_array(inline_content, delimiter, length, strict), header_idx + 1
+        array = decode_inline_array(inline_content, delimiter, length, strict)
+        return array if context.array_factory is None else context.array_factory(array)
 
     # Non-inline array
     if fields is not None:
         # Tabular array
+        if context.trusted:
+            # Trusted input: exactly ``length`` rows follow, each a row line
+            token_rows = _trusted_row_tokens(reader.take(length), delimiter)
+            return context.table(fields, token_rows)
         return decode_tabular_array(
-            lines, header_idx + 1, header_depth, fields, delimiter, length, strict
+            reader, header_depth, fields, delimiter, length, strict, context.table
         )
-    else:
-        # List format (mixed/non-uniform)
-        return decode_list_array(lines, header_idx + 1, header_depth, delimiter, length, strict)
+
+    # List format (mixed/non-uniform)
+    result: List[Any] = []
+    stack.append(_Frame(header_depth + 1, result, parent, parent_key, True, length))
+    return result
+
+
+def _array_counter(length: int, fields: Optional[List[str]], inline_content: str) -> str:
+    """Return the profiler counter for an array of the given header."""
+    if inline_content:
+        return "decode.arrays.inline"
+    if fields is not None:
+        return "decode.arrays.tabular"
+    if length == 0:
+        return "decode.arrays.empty"
+    return "decode.arrays.list"
+
+
+def _header_inline_content(content: str) -> str:
+    """Return the text after the colon that ends an array header."""
+    bracket_end = content.find(CLOSE_BRACKET, content.find(OPEN_BRACKET))
+    colon_idx = content.find(COLON, bracket_end)
+    # With a fields segment, the header colon follows the closing brace
+    brace_idx = content.find(OPEN_BRACE, bracket_end)
+    if brace_idx != -1 and (colon_idx == -1 or brace_idx < colon_idx):
+        colon_idx = content.find(COLON, content.find(CLOSE_BRACE, brace_idx))
+    return content[colon_idx + 1:].strip()
 
 
-def decode_array(
-    lines: List[Line],
-    start_idx: int,
-    parent_depth: int,
+def decode_array_from_header(
+    reader: LineReader,
+    content: str,
+    header_depth: int,
     header_info: Tuple[Optional[str], int, str, Optional[List[str]]],
-    strict: bool
-) -> List[Any]:
-    """Decode array (convenience wrapper).
+    strict: bool,
+    context: Optional["DecodeContext"] = None,
+) -> Any:
+    """Decode array starting from a header line.
 
     Args:
-        lines: List of lines
-        start_idx: Starting line index
-        parent_depth: Parent depth
-        header_info: Header info
-        strict: Strict mode
+        reader: Line reader positioned on the header line
+        content: Header text (without any list item marker)
+        header_depth: Depth of header line
+        header_info: Parsed header info
+        strict: Strict mode flag
+        context: Optional per-decode settings (tabular output, interning)
 
     Returns:
         Decoded array
     """
-    arr, _ = decode_array_from_header(lines, start_idx, parent_depth, header_info, strict)
-    return arr
+    inline_content = _header_inline_content(content)
+    context = context or DecodeContext()
+    return _decode_array(reader, header_info, inline_content, header_depth, strict, context)
+
+
+def _decode_array(
+    reader: LineReader,
+    header_info: Tuple[Optional[str], int, str, Optional[List[str]]],
+    inline_content: str,
+    header_depth: int,
+    strict: bool,
+    context: "DecodeContext",
+) -> Any:
+    """Decode a whole array whose header has already been classified."""
+    stack: List[_Frame] = []
+    root: List[Any] = [None]
+    root[0] = _open_array(
+        reader, header_info, inline_content, header_depth, stack, strict, context, root, 0
+    )
+    _build(reader, stack, strict, context)
+    return root[0]
+
+
+def _trusted_row_tokens(contents: List[str], delimiter: str) -> List[List[str]]:
+    """Split row lines into tokens like ``split_row``, without telling rows from fields."""
+    pattern = _token_pattern(delimiter)
+    return [
+        content.split(delimiter) if DOUBLE_QUOTE not in content else pattern.findall(content)
+        for content in contents
+    ]
 
 
 def decode_inline_array(
@@ -593,44 +1335,486 @@ def decode_inline_array(
     return values
 
 
+
+
 def decode_tabular_array(
-    lines: List[Line],
-    start_idx: int,
+    reader: LineReader,
     header_depth: int,
     fields: List[str],
     delimiter: str,
     expected_length: int,
-    strict: bool
-) -> Tuple[List[Dict[str, Any]], int]:
+    strict: bool,
+    table: Optional["TableBuilder"] = None,
+) -> Any:
     """Decode a tabular array.
 
     Args:
-        lines: List of lines
-        start_idx: Starting line index (after header)
+        reader: Line reader positioned after the header
         header_depth: Depth of header
         fields: Field names
         delimiter: Active delimiter
         expected_length: Expected number of rows
         strict: Strict mode flag
+        table: Optional builder called with the fields and an iterator over
+            the token rows, which it must exhaust; defaults to a list with
+            one dict per row (see ``TABULAR_OUTPUTS``)
 
     Returns:
-        Tuple of (decoded array, next line index)
+        Decoded array, in the form ``table`` builds
 
     Raises:
         ToonDecodeError: If row width or count mismatch in strict mode
     """
-    result = []
-    i = start_idx
+    rows = _iter_row_tokens(reader, header_depth, len(fields), delimiter, expected_length, strict)
+    return (table or _rows_table)(fields, rows)
+
+
+# Builds a decoded tabular array from its fields and the tokens of its rows.
+# Rows arrive as an iterable that is read once, so they can be converted as
+# the lines are read instead of all being held as tokens first.
+TableBuilder = Callable[[List[str], Iterable[List[str]]], Any]
+
+
+class ParsedColumns:
+    """Values of a tabular array already converted, one list per field.
+
+    Table builders accept it in place of the token rows; ``toon.parallel``
+    hands one over for each table its worker processes decoded.
+    """
+
+    __slots__ = ("columns", "count")
+
+    def __init__(self, columns: List[List[Any]], count: int) -> None:
+        self.columns = columns
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def _token_batches(
+    token_rows: Iterable[List[str]], width: int, intern: Optional["InternTable"] = None
+) -> Tuple[List[Callable[[str], JsonValue]], Iterator[List[List[str]]]]:
+    """Infer the column converters, then yield the token rows in batches.
+
+    Only the first ``INFERENCE_ROWS`` rows are read before the converters
+    are known, and at most ``TABLE_BATCH_ROWS`` rows are held as tokens at
+    a time, so a table never needs the tokens of all its rows at once.
+    """
+    rows = iter(token_rows)
+    samples = list(islice(rows, INFERENCE_ROWS))
+    converters = _column_converters(samples, width, intern)
+
+    def batches() -> Iterator[List[List[str]]]:
+        batch = samples
+        while batch:
+            yield batch
+            batch = list(islice(rows, TABLE_BATCH_ROWS))
+
+    return converters, batches()
+
+
+def _rows_table(
+    fields: List[str], token_rows: Iterable[List[str]], intern: Optional["InternTable"] = None
+) -> List[Dict[str, Any]]:
+    """Build one dict per row."""
+    if isinstance(token_rows, ParsedColumns):
+        return [dict(zip(fields, values)) for values in zip(*token_rows.columns)]
+    width = len(fields)
+    converters, batches = _token_batches(token_rows, width, intern)
+
+    result: List[Dict[str, Any]] = []
+    for batch in batches:
+        if any(len(tokens) != width for tokens in batch):
+            # Ragged rows (non-strict mode): convert row by row
+            result.extend(
+                dict(zip(fields, [convert(token) for convert, token in zip(converters, tokens)]))
+                for tokens in batch
+            )
+            continue
+        # Convert a column at a time, then zip the columns back into rows
+        columns = [list(map(convert, column)) for convert, column in zip(converters, zip(*batch))]
+        result.extend(dict(zip(fields, values)) for values in zip(*columns))
+    return result
+
+
+def _table_columns(
+    fields: List[str], token_rows: Iterable[List[str]], intern: Optional["InternTable"] = None
+) -> List[List[Any]]:
+    """Convert the token rows into one list of values per field.
+
+    Missing cells of short rows (non-strict mode) become None and extra
+    cells are dropped.
+    """
+    if isinstance(token_rows, ParsedColumns):
+        return token_rows.columns
+    width = len(fields)
+    converters, batches = _token_batches(token_rows, width, intern)
+
+    columns: List[List[Any]] = [[] for _ in fields]
+    padding = [NULL_LITERAL] * width
+    for batch in batches:
+        if any(len(tokens) != width for tokens in batch):
+            batch = [(tokens + padding)[:width] for tokens in batch]
+        for column, convert, tokens in zip(columns, converters, zip(*batch)):
+            column.extend(map(convert, tokens))
+    return columns
+
+
+def _columns_table(
+    fields: List[str], token_rows: Iterable[List[str]], intern: Optional["InternTable"] = None
+) -> Dict[str, List[Any]]:
+    """Build a dict mapping each field to the list of its values."""
+    return dict(zip(fields, _table_columns(fields, token_rows, intern)))
+
+
+def _numpy_table(
+    fields: List[str], token_rows: Iterable[List[str]], intern: Optional["InternTable"] = None
+) -> Any:
+    """Build a NumPy structured array with one typed field per column."""
+    import numpy as np
+
+    arrays = [_numpy_column(np, values) for values in _table_columns(fields, token_rows, intern)]
+    dtype = [(field, array.dtype) for field, array in zip(fields, arrays)]
+    result = np.empty(len(arrays[0]) if arrays else 0, dtype=dtype)
+    for field, array in zip(fields, arrays):
+        result[field] = array
+    return result
+
+
+def _numpy_column(np: Any, values: List[Any]) -> Any:
+    """Convert one column to a bool, int64 or float64 array, or an object array."""
+    types = set(map(type, values))
+    if types == {bool}:
+        return np.array(values, dtype=bool)
+    if types == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif types == {float} or types == {int, float}:
+        return np.array(values, dtype=np.float64)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _pandas_table(
+    fields: List[str], token_rows: Iterable[List[str]], intern: Optional["InternTable"] = None
+) -> Any:
+    """Build a pandas DataFrame with one column per field."""
+    import pandas as pd
+
+    columns = _table_columns(fields, token_rows, intern)
+    return pd.DataFrame(dict(zip(fields, columns)), columns=fields)
+
+
+class TupleRows(list):  # type: ignore[type-arg]
+    """Tabular rows decoded as plain tuples, with the header fields shared.
+
+    A list of tuples that compares equal to any list of the same tuples;
+    ``fields`` names the tuple positions.
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, rows: Iterable[Tuple[Any, ...]], fields: Tuple[str, ...]) -> None:
+        super().__init__(rows)
+        self.fields = fields
+
+
+@lru_cache(maxsize=256)
+def row_class(fields: Tuple[str, ...]) -> Any:
+    """Return the namedtuple class for rows with these header fields.
+
+    Classes are cached, so every table with the same header shares one.
+    Field names that are not identifiers, or repeat, become ``_0``, ``_1``...
+    """
+    return namedtuple("Row", fields, rename=True)  # type: ignore[misc]
+
+
+def _row_factory_table(row_factory: Any, intern: Optional["InternTable"] = None) -> TableBuilder:
+    """Return a table builder that makes each row with ``row_factory``."""
+    if row_factory == "tuple":
+        def build(fields: List[str], token_rows: Iterable[List[str]]) -> Any:
+            return TupleRows(zip(*_table_columns(fields, token_rows, intern)), tuple(fields))
+    elif row_factory == "namedtuple":
+        def build(fields: List[str], token_rows: Iterable[List[str]]) -> Any:
+            rows = zip(*_table_columns(fields, token_rows, intern))
+            return list(starmap(row_class(tuple(fields)), rows))
+    elif callable(row_factory):
+        def build(fields: List[str], token_rows: Iterable[List[str]]) -> Any:
+            shared = tuple(fields)
+            rows = zip(*_table_columns(fields, token_rows, intern))
+            return [row_factory(shared, values) for values in rows]
+    else:
+        raise ValueError(
+            f"Unknown row factory {row_factory!r}; "
+            "expected 'dict', 'tuple', 'namedtuple' or a callable"
+        )
+    return build
+
+
+# A TABULAR_OUTPUTS builder: a TableBuilder that also takes the intern table
+# (or None) that string cells are shared through
+InterningTableBuilder = Callable[[List[str], Iterable[List[str]], Optional["InternTable"]], Any]
+
+# Values of DecodeOptions.tabular and the builder each one selects
+TABULAR_OUTPUTS: Dict[str, InterningTableBuilder] = {
+    "rows": _rows_table,
+    "columns": _columns_table,
+    "numpy": _numpy_table,
+    "pandas": _pandas_table,
+}
+
+
+def _table_builder(options: DecodeOptions, intern: Optional["InternTable"] = None) -> TableBuilder:
+    """Return the table builder for ``options.tabular`` and ``options.row_factory``.
+
+    String cells are shared through ``intern`` when it is given.
+
+    Raises:
+        ValueError: If ``tabular`` is not a key of ``TABULAR_OUTPUTS`` or
+            ``row_factory`` is not a known name or a callable
+        ImportError: If the output needs NumPy or pandas and it is not installed
+    """
+    tabular, row_factory = options.tabular, options.row_factory
+    if tabular == "rows" and row_factory != "dict":
+        return _row_factory_table(row_factory, intern)
+    try:
+        builder = TABULAR_OUTPUTS[tabular]
+    except KeyError:
+        raise ValueError(
+            f"Unknown tabular output {tabular!r}; expected one of {', '.join(TABULAR_OUTPUTS)}"
+        ) from None
+    if tabular in ("numpy", "pandas"):
+        try:
+            __import__(tabular)
+        except ImportError:
+            raise ImportError(f"tabular={tabular!r} requires {tabular} to be installed") from None
+    return lambda fields, token_rows: builder(fields, token_rows, intern)
+
+
+def _pairs_hook(
+    pairs_hook: Callable[[List[Tuple[str, Any]]], Any]
+) -> Callable[[Dict[str, Any]], Any]:
+    return lambda obj: pairs_hook(list(obj.items()))
+
+
+def _hooked_table(
+    build: TableBuilder,
+    object_hook: Optional[Callable[[Dict[str, Any]], Any]],
+    array_factory: Optional[Callable[[List[Any]], Any]],
+) -> TableBuilder:
+    """Return a table builder that passes dict rows through ``object_hook``
+    and list results through ``array_factory``."""
+    def hooked(fields: List[str], token_rows: Iterable[List[str]]) -> Any:
+        result = build(fields, token_rows)
+        if not isinstance(result, list):
+            return result
+        if object_hook is not None:
+            result = list(map(object_hook, result))
+        return result if array_factory is None else array_factory(result)
+    return hooked
+
+
+# Bounds of the per-decode intern table
+INTERN_TABLE_SIZE = 65536
+INTERN_MAX_LENGTH = 64
+
+
+class InternTable:
+    """Bounded table that makes equal short strings share one object.
+
+    The first ``max_size`` distinct strings of at most ``max_length``
+    characters are remembered; later equal strings are replaced by the
+    remembered object so only one copy stays alive. ``hits`` and
+    ``saved_bytes`` count the replacements and the memory they freed.
+    Values that are not strings pass through unchanged.
+    """
+
+    __slots__ = ("_strings", "max_size", "max_length", "hits", "saved_bytes")
+
+    def __init__(
+        self, max_size: int = INTERN_TABLE_SIZE, max_length: int = INTERN_MAX_LENGTH
+    ) -> None:
+        self._strings: Dict[str, str] = {}
+        self.max_size = max_size
+        self.max_length = max_length
+        self.hits = 0
+        self.saved_bytes = 0
+
+    def __call__(self, value: Any) -> Any:
+        if value.__class__ is not str or len(value) > self.max_length:
+            return value
+        shared = self._strings.get(value)
+        if shared is None:
+            if len(self._strings) < self.max_size:
+                self._strings[value] = value
+            return value
+        if shared is not value:
+            self.hits += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return shared
+
+
+class DecodeContext:
+    """Per-decode settings threaded through the builder functions.
+
+    ``intern_keys`` and ``intern_values`` are the ``InternTable`` applied to
+    object keys and to string values, or None when that interning is off.
+    ``into`` is the compiled converter to the caller's target type, or None
+    when plain values are returned. ``object_hook`` and ``array_factory``
+    are applied to every completed object and array, or None when unset.
+    ``parallel`` maps the header line number of each tabular array being
+    decoded by worker processes to its pending result (see ``toon.parallel``).
+    ``trusted`` reads tabular rows by their declared count (see
+    ``DecodeOptions.trusted``). ``profiler`` counts the arrays opened by the
+    builder, or is None when the decode is not profiled.
+    """
+
+    __slots__ = (
+        "table", "intern_keys", "intern_values", "into", "object_hook", "array_factory",
+        "parallel", "trusted", "profiler",
+    )
+
+    def __init__(
+        self,
+        table: Optional[TableBuilder] = None,
+        intern_keys: Optional[InternTable] = None,
+        intern_values: Optional[InternTable] = None,
+        into: Optional[Callable[[Any], Any]] = None,
+        object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        array_factory: Optional[Callable[[List[Any]], Any]] = None,
+    ) -> None:
+        self.table = table or _rows_table
+        self.intern_keys = intern_keys
+        self.intern_values = intern_values
+        self.into = into
+        self.object_hook = object_hook
+        self.array_factory = array_factory
+        self.parallel: Optional[Dict[int, Any]] = None
+        self.trusted = False
+        self.profiler: Optional[Profiler] = None
+
+    @classmethod
+    def from_options(cls, options: DecodeOptions, into: Any = None) -> "DecodeContext":
+        """Build the context for one decode call.
+
+        With ``into``, tabular arrays are kept as tokens until the converter
+        to ``into`` maps them onto the target type (see ``toon.typed``).
+
+        Raises:
+            ValueError: If ``options.tabular`` or ``options.row_factory`` is unknown
+            ImportError: If the tabular output needs a package that is not installed
+            TypeError: If ``into`` is not a supported target type
+        """
+        intern = InternTable() if options.intern_keys or options.intern_values else None
+        values = intern if options.intern_values else None
+        table = _table_builder(options, values)
+        keys = intern if options.intern_keys else None
+
+        object_hook = options.object_hook
+        pairs_hook = options.object_pairs_hook
+        if pairs_hook is not None:
+            # As in json.loads, object_pairs_hook takes priority over object_hook
+            object_hook = _pairs_hook(pairs_hook)
+        array_factory = options.array_factory
+        if object_hook is not None or array_factory is not None:
+            dict_rows = options.tabular == "rows" and options.row_factory == "dict"
+            table = _hooked_table(table, object_hook if dict_rows else None, array_factory)
+
+        converter = None
+        if into is not None:
+            from .typed import compile_converter, raw_tables
+
+            table = raw_tables(table)
+            converter = compile_converter(into)
+        context = cls(table, keys, values, converter, object_hook, array_factory)
+        context.trusted = options.trusted
+        return context
+
+    def finish(self, result: Any) -> Any:
+        """Convert the decoded ``result`` to the ``into`` type, if one was given."""
+        if self.into is None:
+            return result
+        return self.into(result)
+
+    def report(self, profiler: Profiler) -> None:
+        """Add the interning counters of this decode to ``profiler``."""
+        intern = self.intern_keys or self.intern_values
+        if intern is not None:
+            profiler.count("decode.intern.hits", intern.hits)
+            profiler.count("decode.intern.saved_bytes", intern.saved_bytes)
+
+
+def iter_tabular_rows(
+    reader: LineReader,
+    header_depth: int,
+    fields: List[str],
+    delimiter: str,
+    expected_length: int,
+    strict: bool,
+    columns: Optional[List[int]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of a tabular array one at a time.
+
+    Args:
+        reader: Line reader positioned after the header
+        header_depth: Depth of header
+        fields: Field names
+        delimiter: Active delimiter
+        expected_length: Expected number of rows
+        strict: Strict mode flag
+        columns: Optional indexes of the fields to keep; only these values
+            are parsed
+
+    Yields:
+        One dict per row
+
+    Raises:
+        ToonDecodeError: If row width or count mismatch in strict mode. A
+            count mismatch is raised after the last row has been yielded.
+    """
+    width = len(fields)
+    converters: Optional[List[Callable[[str], JsonValue]]] = None
+    for tokens in _iter_row_tokens(reader, header_depth, width, delimiter, expected_length, strict):
+        if converters is None:
+            # Streaming: infer column types from the first row
+            converters = _column_converters([tokens], width)
+        if columns is not None:
+            yield {fields[j]: converters[j](tokens[j]) for j in columns if j < len(tokens)}
+        else:
+            yield dict(zip(fields, [convert(token) for convert, token in zip(converters, tokens)]))
+
+
+def _iter_row_tokens(
+    reader: LineReader,
+    header_depth: int,
+    width: int,
+    delimiter: str,
+    expected_length: int,
+    strict: bool,
+) -> Iterator[List[str]]:
+    """Yield the tokens of each row of a tabular array.
+
+    Raises:
+        ToonDecodeError: If row width or count mismatch in strict mode. A
+            count mismatch is raised after the last row has been yielded.
+    """
+    count = 0
     row_depth = header_depth + 1
 
-    while i < len(lines):
-        line = lines[i]
+    while True:
+        line = reader.line
+        if line is None:
+            break
 
         # Check for blank lines in array (error in strict mode)
         if line.is_blank:
             if strict:
                 raise ToonDecodeError("Blank lines not allowed inside arrays")
-            i += 1
+            reader.advance()
             continue
 
         # Stop if dedented or different depth
@@ -640,33 +1824,55 @@ def decode_tabular_array(
             # End of tabular rows (might be next key-value)
             break
 
-        content = line.content
-
         # Disambiguation: check if this is a row or a key-value line
         # A row has no unquoted colon, or delimiter before colon
-        if is_row_line(content, delimiter):
-            # Parse as row
-            tokens = parse_delimited_values(content, delimiter)
-            values = [parse_primitive(token) for token in tokens]
-
-            if strict and len(values) != len(fields):
-                raise ToonDecodeError(
-                    f"Expected {len(fields)} values in row, but got {len(values)}"
-                )
-
-            obj = {fields[j]: values[j] for j in range(min(len(fields), len(values)))}
-            result.append(obj)
-            i += 1
-        else:
+        tokens = split_row(line.content, delimiter)
+        if tokens is None:
             # Not a row, end of tabular data
             break
 
-    if strict and len(result) != expected_length:
+        if strict and len(tokens) != width:
+            raise ToonDecodeError(
+                f"Expected {width} values in row, but got {len(tokens)}"
+            )
+
+        reader.advance()
+        count += 1
+        yield tokens
+
+    if strict and count != expected_length:
         raise ToonDecodeError(
-            f"Expected {expected_length} rows, but got {len(result)}"
+            f"Expected {expected_length} rows, but got {count}"
         )
 
-    return result, i
+
+def _parse_row(
+    content: str,
+    fields: List[str],
+    delimiter: str,
+    strict: bool,
+    columns: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    """Parse one tabular row into a dict keyed by the header fields."""
+    return _row_from_tokens(parse_delimited_values(content, delimiter), fields, strict, columns)
+
+
+def _row_from_tokens(
+    tokens: List[str],
+    fields: List[str],
+    strict: bool,
+    columns: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    """Build a row dict from tokens already split by ``split_row``."""
+    if strict and len(tokens) != len(fields):
+        raise ToonDecodeError(
+            f"Expected {len(fields)} values in row, but got {len(tokens)}"
+        )
+
+    if columns is not None:
+        return {fields[j]: parse_primitive(tokens[j]) for j in columns if j < len(tokens)}
+
+    return dict(zip(fields, map(parse_primitive, tokens)))
 
 
 def is_row_line(line: str, delimiter: str) -> bool:
@@ -679,224 +1885,272 @@ def is_row_line(line: str, delimiter: str) -> bool:
     Returns:
         True if it's a row line
     """
-    # Find first unquoted delimiter and first unquoted colon
-    first_delim_pos = None
-    first_colon_pos = None
-    in_quotes = False
-    i = 0
-
-    while i < len(line):
-        char = line[i]
-
-        if char == DOUBLE_QUOTE:
-            in_quotes = not in_quotes
-        elif char == BACKSLASH and i + 1 < len(line) and in_quotes:
-            i += 1
-        elif not in_quotes:
-            if char == delimiter and first_delim_pos is None:
-                first_delim_pos = i
-            if char == COLON and first_colon_pos is None:
-                first_colon_pos = i
-
-        i += 1
-
-    # No unquoted colon -> row
-    if first_colon_pos is None:
-        return True
-
-    # Both present: delimiter before colon -> row
-    if first_delim_pos is not None and first_delim_pos < first_colon_pos:
-        return True
-
-    # Colon before delimiter or no delimiter -> key-value
-    return False
+    return split_row(line, delimiter) is not None
 
 
 def decode_list_array(
-    lines: List[Line],
-    start_idx: int,
+    reader: LineReader,
     header_depth: int,
     delimiter: str,
     expected_length: int,
-    strict: bool
-) -> Tuple[List[Any], int]:
+    strict: bool,
+    context: Optional["DecodeContext"] = None,
+) -> List[Any]:
     """Decode a list-format array (mixed/non-uniform).
 
     Args:
-        lines: List of lines
-        start_idx: Starting line index
+        reader: Line reader positioned after the header
         header_depth: Header depth
         delimiter: Active delimiter
         expected_length: Expected number of items
         strict: Strict mode flag
+        context: Optional per-decode settings (tabular output, interning)
 
     Returns:
-        Tuple of (decoded array, next line index)
+        Decoded array
 
     Raises:
         ToonDecodeError: If item count mismatch in strict mode
     """
-    result = []
-    i = start_idx
-    item_depth = header_depth + 1
+    result: List[Any] = []
+    root = [result]
+    frame = _Frame(header_depth + 1, result, root, 0, True, expected_length)
+    _build(reader, [frame], strict, context or DecodeContext())
+    return root[0]
+
 
-    while i < len(lines):
-        line = lines[i]
+# Projection: decode only selected paths
+
+# Trie of selected keys; None selects the whole subtree
+Selection = Dict[str, Optional["Selection"]]
+
+
+def parse_selection(paths: Iterable[str]) -> Optional[Selection]:
+    """Build a selection trie from dotted paths.
+
+    Array items share the path of their array, so ``users[*].id`` and
+    ``users.id`` are equivalent; ``[*]`` may be written for readability.
+    Selecting a path selects everything under it.
+
+    Args:
+        paths: Dotted key paths such as ``"meta.version"`` or ``"users[*].id"``
 
-        # Skip blank lines (error in strict mode)
+    Returns:
+        Selection trie, or None if a path selects the whole document
+    """
+    selection: Selection = {}
+    for path in paths:
+        parts = [part for part in path.replace("[*]", "").split(".") if part]
+        if not parts:
+            # The root path selects the whole document
+            return None
+        node = selection
+        for part in parts[:-1]:
+            child = node.get(part, {})
+            if child is None:
+                break
+            node[part] = child
+            node = child
+        else:
+            node[parts[-1]] = None
+    return selection
+
+
+def _skip_subtree(reader: LineReader, depth: int) -> None:
+    """Advance past every line nested deeper than ``depth`` without parsing it."""
+    while reader.line is not None and (reader.line.is_blank or reader.line.depth > depth):
+        reader.advance()
+
+
+def _select_object(
+    reader: LineReader, depth: int, strict: bool, selection: Selection, context: "DecodeContext"
+) -> Dict[str, Any]:
+    """Decode only the selected fields of an object (see decode_object)."""
+    result: Dict[str, Any] = {}
+    _select_fields(reader, depth, result, strict, selection, context)
+    return result if context.object_hook is None else context.object_hook(result)
+
+
+def _select_fields(
+    reader: LineReader,
+    depth: int,
+    result: Dict[str, Any],
+    strict: bool,
+    selection: Selection,
+    context: "DecodeContext",
+) -> None:
+    """Decode selected fields at ``depth`` into ``result``, skipping the rest."""
+    while True:
+        line = reader.line
+        if line is None:
+            break
         if line.is_blank:
+            reader.advance()
+            continue
+        if line.depth < depth:
+            break
+        if line.depth > depth:
+            reader.advance()
+            continue
+
+        kind, first, value_str = line.field_info()
+        if kind == LINE_HEADER and first[0] is not None:
+            key = first[0]
+            if key not in selection:
+                reader.advance()
+                _skip_subtree(reader, line.depth)
+                continue
+            sub = selection[key]
+            if sub is None:
+                result[key] = _decode_array(reader, first, value_str, line.depth, strict, context)
+            else:
+                result[key] = _select_array(
+                    reader, line.content, line.depth, first, strict, sub, context
+                )
+            continue
+
+        if kind == LINE_HEADER:
+            key_str, value_str = split_key_value(line.content)
+            key = parse_key(key_str)
+        elif kind == LINE_TEXT:
             if strict:
-                raise ToonDecodeError("Blank lines not allowed inside arrays")
-            i += 1
+                raise ToonDecodeError("Missing colon after key")
+            reader.advance()
             continue
+        else:
+            key = first
 
-        # Stop if dedented
-        if line.depth < item_depth:
-            break
+        reader.advance()
+        if key not in selection:
+            _skip_subtree(reader, line.depth)
+            continue
+
+        sub = selection[key]
+        if value_str:
+            result[key] = parse_primitive(value_str)
+        elif sub is None:
+            result[key] = decode_object(reader, line.depth + 1, strict, context)
+        else:
+            result[key] = _select_object(reader, line.depth + 1, strict, sub, context)
+
+
+def _select_array(
+    reader: LineReader,
+    content: str,
+    header_depth: int,
+    header_info: Tuple[Optional[str], int, str, Optional[List[str]]],
+    strict: bool,
+    selection: Selection,
+    context: "DecodeContext",
+) -> Any:
+    """Decode the selected fields of every object in an array.
+
+    Only the selected columns of a tabular array are parsed. Items that are
+    not objects have no fields to select and are left out.
+    """
+    key, length, delimiter, fields = header_info
+    reader.advance()
+
+    if _header_inline_content(content):
+        # Inline arrays hold primitives only
+        return [] if context.array_factory is None else context.array_factory([])
+
+    if fields is not None:
+        columns = [j for j, field in enumerate(fields) if field in selection]
+        token_rows = _iter_row_tokens(reader, header_depth, len(fields), delimiter, length, strict)
+        projected = [[tokens[j] for j in columns if j < len(tokens)] for tokens in token_rows]
+        return context.table([fields[j] for j in columns], projected)
+
+    return _select_list_items(reader, header_depth, length, strict, selection, context)
 
-        # Must start with "- "
-        content = line.content
-        if not content.startswith(LIST_ITEM_MARKER):
-            # Not a list item, end of array
+
+def _select_list_items(
+    reader: LineReader,
+    header_depth: int,
+    expected_length: int,
+    strict: bool,
+    selection: Selection,
+    context: "DecodeContext",
+) -> List[Any]:
+    """Decode selected fields of object items in a list array (see decode_list_array)."""
+    object_hook = context.object_hook
+    result: List[Any] = []
+    count = 0
+    item_depth = header_depth + 1
+
+    while True:
+        line = reader.line
+        if line is None:
+            break
+        if line.is_blank:
+            reader.advance()
+            continue
+        if line.depth < item_depth or not line.content.startswith(LIST_ITEM_MARKER):
             break
 
-        # Remove "- " prefix
-        item_content = content[len(LIST_ITEM_MARKER):].strip()
+        count += 1
+        item_content = line.content[len(LIST_ITEM_MARKER):].strip()
+
+        if not item_content:
+            reader.advance()
+            result.append(_select_object(reader, line.depth + 1, strict, selection, context))
+            continue
 
-        # Check what kind of item this is
         item_header = parse_header(item_content)
         if item_header is not None:
-            # It's an array header: - [N]: ... or - key[N]: ...
-            key, length, item_delim, fields = item_header
-
+            key = item_header[0]
             if key is None:
-                # - [N]: inline array
-                colon_idx = item_content.find(COLON)
-                if colon_idx != -1:
-                    inline_part = item_content[colon_idx + 1:].strip()
-                    if inline_part:
-                        # Inline primitive array
-                        item_val = decode_inline_array(inline_part, item_delim, length, strict)
-                        result.append(item_val)
-                        i += 1
-                        continue
+                # Nested array item: no fields to select
+                reader.advance()
+                _skip_subtree(reader, line.depth)
+                continue
+
+            # Object whose first field is an array; its rows share the depth of
+            # the remaining fields, so it is decoded even when not selected
+            item_obj: Dict[str, Any] = {}
+            sub = selection.get(key, {})
+            if key in selection and sub is None:
+                item_obj[key] = decode_array_from_header(
+                    reader, item_content, line.depth, item_header, strict, context
+                )
             else:
-                # - key[N]: array field in object
-                # This is an object with an array as its first field
-                item_obj = {}
-                array_val, next_i = decode_array_from_header(
-                    lines, i, line.depth, item_header, strict
+                array = _select_array(
+                    reader, item_content, line.depth, item_header, strict, sub or {}, context
                 )
-                item_obj[key] = array_val
-
-                # Continue reading remaining fields at depth +1
-                i = next_i
-                while i < len(lines) and lines[i].depth == line.depth + 1:
-                    field_line = lines[i]
-                    if field_line.is_blank:
-                        i += 1
-                        continue
-
-                    field_content = field_line.content
-
-                    # Check for array header
-                    field_header = parse_header(field_content)
-                    if field_header is not None and field_header[0] is not None:
-                        field_key, field_length, field_delim, field_fields = field_header
-                        field_val, next_i = decode_array_from_header(
-                            lines, i, field_line.depth, field_header, strict
-                        )
-                        item_obj[field_key] = field_val
-                        i = next_i
-                        continue
-
-                    try:
-                        field_key_str, field_value_str = split_key_value(field_content)
-                        field_key = parse_key(field_key_str)
-
-                        if not field_value_str:
-                            # Nested object
-                            item_obj[field_key] = decode_object(
-                                lines, i + 1, field_line.depth, strict
-                            )
-                            i += 1
-                            while i < len(lines) and lines[i].depth > field_line.depth:
-                                i += 1
-                        else:
-                            item_obj[field_key] = parse_primitive(field_value_str)
-                            i += 1
-                    except ToonDecodeError:
-                        break
-
-                result.append(item_obj)
-                continue
+                if key in selection:
+                    item_obj[key] = array
+            _select_fields(reader, line.depth + 1, item_obj, strict, selection, context)
+            result.append(item_obj if object_hook is None else object_hook(item_obj))
+            continue
 
-        # Check if it's an object (has colon)
         try:
             key_str, value_str = split_key_value(item_content)
-            # It's an object item
-            item_obj = {}
+        except ToonDecodeError:
+            # Primitive item
+            reader.advance()
+            continue
 
-            # First field
-            key = parse_key(key_str)
+        item_obj = {}
+        reader.advance()
+        key = parse_key(key_str)
+        if key not in selection:
             if not value_str:
-                # First field is nested object: fields at depth +2
-                nested = decode_object(lines, i + 1, line.depth + 1, strict)
-                item_obj[key] = nested
-                # Skip nested content
-                i += 1
-                while i < len(lines) and lines[i].depth > line.depth + 1:
-                    i += 1
+                _skip_subtree(reader, line.depth + 1)
+        elif value_str:
+            item_obj[key] = parse_primitive(value_str)
+        else:
+            child = selection[key]
+            if child is None:
+                item_obj[key] = decode_object(reader, line.depth + 2, strict, context)
             else:
-                # First field is primitive
-                item_obj[key] = parse_primitive(value_str)
-                i += 1
-
-            # Remaining fields at depth +1
-            while i < len(lines) and lines[i].depth == line.depth + 1:
-                field_line = lines[i]
-                if field_line.is_blank:
-                    i += 1
-                    continue
-
-                field_content = field_line.content
-
-                # Check for array header
-                field_header = parse_header(field_content)
-                if field_header is not None and field_header[0] is not None:
-                    field_key, field_length, field_delim, field_fields = field_header
-                    field_val, next_i = decode_array_from_header(
-                        lines, i, field_line.depth, field_header, strict
-                    )
-                    item_obj[field_key] = field_val
-                    i = next_i
-                    continue
-
-                try:
-                    field_key_str, field_value_str = split_key_value(field_content)
-                    field_key = parse_key(field_key_str)
-
-                    if not field_value_str:
-                        # Nested object
-                        item_obj[field_key] = decode_object(lines, i + 1, field_line.depth, strict)
-                        i += 1
-                        while i < len(lines) and lines[i].depth > field_line.depth:
-                            i += 1
-                    else:
-                        item_obj[field_key] = parse_primitive(field_value_str)
-                        i += 1
-                except ToonDecodeError:
-                    break
-
-            result.append(item_obj)
-        except ToonDecodeError:
-            # Not an object, must be a primitive
-            result.append(parse_primitive(item_content))
-            i += 1
+                item_obj[key] = _select_object(reader, line.depth + 2, strict, child, context)
+
+        _select_fields(reader, line.depth + 1, item_obj, strict, selection, context)
+        result.append(item_obj if object_hook is None else object_hook(item_obj))
 
-    if strict and len(result) != expected_length:
+    if strict and count != expected_length:
         raise ToonDecodeError(
-            f"Expected {expected_length} items, but got {len(result)}"
+            f"Expected {expected_length} items, but got {count}"
         )
 
-    return result, i
+    return result if context.array_factory is None else context.array_factory(result)
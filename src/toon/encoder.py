@@ -1,12 +1,16 @@
 """Core TOON encoding functionality."""
 
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 
 from .constants import DEFAULT_DELIMITER, DELIMITERS
 from .encoders import encode_value
 from .normalize import normalize_value
-from .types import EncodeOptions, ResolvedEncodeOptions
-from .writer import LineWriter
+from .primitives import encode_key
+from .profiling import Profiler, count_nodes
+from .stats import SizeReport, StatsWriter
+from .tokens import TokenCounter
+from .types import EncodeOptions, JsonValue, ResolvedEncodeOptions
+from .writer import ChunkWriter, LineWriter
 
 
 def _extract_model_field_description_map(value: Any, base_path: List[str] | None = None) -> Dict[str, str]:
@@ -93,9 +97,109 @@ def encode(value: Any, options: Optional[EncodeOptions] = None) -> str:
     Returns:
         TOON-formatted string
     """
-    # Merge model-derived comments before normalization so we don't lose metadata
+    profiler = options.get("profiler") if options else None
+    if profiler is not None:
+        return _encode_profiled(value, options or {}, profiler)
+
+    normalized, resolved_options = _prepare(value, options)
+    writer = LineWriter(resolved_options.indent)
+    encode_value(normalized, resolved_options, writer, 0)
+    return writer.to_string()
+
+
+def _encode_profiled(value: Any, options: EncodeOptions, profiler: Profiler) -> str:
+    """Run encode() with every phase timed by the profiler."""
+    with profiler.call("encode", {"encode_key": encode_key}):
+        with profiler.phase("encode.model_comments"):
+            comments = _collect_comments(value, options)
+        with profiler.phase("encode.normalize"):
+            normalized = normalize_value(value)
+        resolved_options = resolve_options({**options, "comments": comments})
+        writer = LineWriter(resolved_options.indent)
+        with profiler.phase("encode.encode_value"):
+            encode_value(normalized, resolved_options, writer, 0)
+        with profiler.phase("encode.join"):
+            result = writer.to_string()
+        profiler.count("encode.nodes", count_nodes(normalized))
+    return result
+
+
+def encode_chunks(
+    value: Any,
+    max_tokens: int,
+    options: Optional[EncodeOptions] = None,
+    token_counter: Optional[TokenCounter] = None,
+) -> List[str]:
+    """Encode a value into self-contained TOON chunks of bounded size.
+
+    Every chunk repeats the enclosing key path and tabular header
+    (``items[k,]{...}:``) of the content it holds, so each one decodes on
+    its own. Chunks are cut while the encoder writes its output; the full
+    document is never built as a single string.
+
+    Args:
+        value: The value to encode (must be JSON-serializable)
+        max_tokens: Token budget per chunk
+        options: Optional encoding options
+        token_counter: Optional callable returning the token count of a
+            string (default: estimate_tokens)
+
+    Returns:
+        List of TOON-formatted strings
+
+    Raises:
+        ValueError: If max_tokens is not positive
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be a positive integer")
+
+    normalized, resolved_options = _prepare(value, options)
+    writer = ChunkWriter(resolved_options, max_tokens, token_counter)
+    encode_value(normalized, resolved_options, writer, 0)
+    return writer.chunks()
+
+
+def encode_with_stats(
+    value: Any,
+    options: Optional[EncodeOptions] = None,
+    token_counter: Optional[TokenCounter] = None,
+) -> Tuple[str, SizeReport]:
+    """Encode a value and report its size per dotted key path.
+
+    Sizes are recorded while the output is written, so this costs a single
+    encoding pass plus the per-line measurements.
+
+    Args:
+        value: The value to encode (must be JSON-serializable)
+        options: Optional encoding options
+        token_counter: Optional callable returning the token count of a
+            string (default: estimate_tokens)
+
+    Returns:
+        Tuple of (TOON-formatted string, size report)
+    """
+    normalized, resolved_options = _prepare(value, options)
+    writer = StatsWriter(resolved_options.indent, token_counter)
+    encode_value(normalized, resolved_options, writer, 0)
+    return writer.to_string(), writer.report
+
+
+def _prepare(
+    value: Any, options: Optional[EncodeOptions]
+) -> Tuple[JsonValue, ResolvedEncodeOptions]:
+    """Normalize a value and resolve options, merging model-derived comments."""
     incoming_options = options or {}
-    model_comments_enabled = incoming_options.get("modelComments", True)
+    # Merge model-derived comments before normalization so we don't lose metadata
+    comments = _collect_comments(value, incoming_options)
+    normalized = normalize_value(value)
+    # Inject merged comments into options before resolving
+    merged_options: EncodeOptions = {**incoming_options, "comments": comments}
+    return normalized, resolve_options(merged_options)
+
+
+def _collect_comments(value: Any, options: EncodeOptions) -> Dict[str, str]:
+    """Merge Pydantic field descriptions with user-provided comments (user wins)."""
+    model_comments_enabled = options.get("modelComments", True)
     auto_comments: Dict[str, str] = {}
     if model_comments_enabled:
         try:
@@ -103,17 +207,8 @@ def encode(value: Any, options: Optional[EncodeOptions] = None) -> str:
         except Exception:
             auto_comments = {}
 
-    # Merge with user-provided comments (user wins)
-    provided_comments = incoming_options.get("comments", {}) or {}
-    merged_comments = {**auto_comments, **provided_comments}
-
-    normalized = normalize_value(value)
-    # Inject merged comments into options before resolving
-    merged_options: EncodeOptions = {**incoming_options, "comments": merged_comments}
-    resolved_options = resolve_options(merged_options)
-    writer = LineWriter(resolved_options.indent)
-    encode_value(normalized, resolved_options, writer, 0)
-    return writer.to_string()
+    provided_comments = options.get("comments", {}) or {}
+    return {**auto_comments, **provided_comments}
 
 
 def resolve_options(options: Optional[EncodeOptions]) -> ResolvedEncodeOptions:
@@ -133,6 +228,7 @@ def resolve_options(options: Optional[EncodeOptions]) -> ResolvedEncodeOptions:
     length_marker = options.get("lengthMarker", False)
     comments = options.get("comments", {})
     comment_prefix = options.get("commentPrefix", "#")
+    profiler = options.get("profiler")
 
     # Resolve delimiter if it's a key
     if delimiter in DELIMITERS:
@@ -144,4 +240,5 @@ def resolve_options(options: Optional[EncodeOptions]) -> ResolvedEncodeOptions:
         length_marker=length_marker,
         comments=comments,
         comment_prefix=comment_prefix,
+        profiler=profiler,
     )
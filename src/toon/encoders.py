@@ -27,7 +27,7 @@ def _maybe_write_comment(options: ResolvedEncodeOptions, writer: LineWriter, dep
     comment = options.comments.get(key)
     if comment:
         prefix = options.commentPrefix if options.commentPrefix is not None else "#"
-        writer.push(depth, f"{prefix} {comment}")
+        writer.push_comment(depth, f"{prefix} {comment}", path_parts)
 
 
 def encode_value(
@@ -45,7 +45,7 @@ def encode_value(
         path_parts = []
 
     if is_json_primitive(value):
-        writer.push(depth, encode_primitive(value, options.delimiter))
+        writer.push(depth, encode_primitive(value, options.delimiter), path_parts)
     elif is_json_array(value):
         encode_array(value, options, writer, depth, None, path_parts)
     elif is_json_object(value):
@@ -69,9 +69,10 @@ def encode_object(
         depth: Current indentation depth
         key: Optional key name
     """
+    object_path = [*path_parts, key] if key else path_parts
     if key:
-        _maybe_write_comment(options, writer, depth, [*path_parts, key])
-        writer.push(depth, f"{encode_key(key)}:")
+        _maybe_write_comment(options, writer, depth, object_path)
+        writer.push_object_header(depth, f"{encode_key(key)}:", object_path)
 
     for obj_key, obj_value in obj.items():
         encode_key_value_pair(
@@ -80,7 +81,7 @@ def encode_object(
             options,
             writer,
             depth if not key else depth + 1,
-            [*path_parts, key] if key else path_parts,
+            object_path,
         )
 
 
@@ -97,8 +98,10 @@ def encode_key_value_pair(
         depth: Current indentation depth
     """
     if is_json_primitive(value):
-        _maybe_write_comment(options, writer, depth, [*path_parts, key])
-        writer.push(depth, f"{encode_key(key)}: {encode_primitive(value, options.delimiter)}")
+        field_path = [*path_parts, key]
+        _maybe_write_comment(options, writer, depth, field_path)
+        encoded_value = encode_primitive(value, options.delimiter)
+        writer.push(depth, f"{encode_key(key)}: {encoded_value}", field_path)
     elif is_json_array(value):
         encode_array(value, options, writer, depth, key, path_parts)
     elif is_json_object(value):
@@ -124,26 +127,37 @@ def encode_array(
     """
     # Handle empty array
     if not arr:
+        array_path = [*path_parts, key] if key else path_parts
         if key:
-            _maybe_write_comment(options, writer, depth, [*path_parts, key])
+            _maybe_write_comment(options, writer, depth, array_path)
         header = format_header(key, 0, None, options.delimiter, options.lengthMarker)
-        writer.push(depth, header)
+        writer.push(depth, header, array_path)
+        if options.profiler is not None:
+            options.profiler.count("encode.arrays.empty")
         return
 
     # Check array type and encode accordingly
     if is_array_of_primitives(arr):
+        shape = "inline"
         encode_inline_primitive_array(arr, options, writer, depth, key, path_parts)
     elif is_array_of_arrays(arr):
+        shape = "nested"
         encode_array_of_arrays(arr, options, writer, depth, key, path_parts)
     elif is_array_of_objects(arr):
         tabular_header = detect_tabular_header(arr, options.delimiter)
         if tabular_header:
+            shape = "tabular"
             encode_array_of_objects_as_tabular(arr, tabular_header, options, writer, depth, key, path_parts)
         else:
+            shape = "list"
             encode_mixed_array_as_list_items(arr, options, writer, depth, key, path_parts)
     else:
+        shape = "list"
         encode_mixed_array_as_list_items(arr, options, writer, depth, key, path_parts)
 
+    if options.profiler is not None:
+        options.profiler.count(f"encode.arrays.{shape}")
+
 
 def encode_inline_primitive_array(
     arr: JsonArray,
@@ -162,12 +176,13 @@ def encode_inline_primitive_array(
         depth: Current indentation depth
         key: Optional key name
     """
+    array_path = [*path_parts, key] if key else path_parts
     if key:
-        _maybe_write_comment(options, writer, depth, [*path_parts, key])
+        _maybe_write_comment(options, writer, depth, array_path)
     encoded_values = [encode_primitive(item, options.delimiter) for item in arr]
     joined = join_encoded_values(encoded_values, options.delimiter)
     header = format_header(key, len(arr), None, options.delimiter, options.lengthMarker)
-    writer.push(depth, f"{header} {joined}")
+    writer.push(depth, f"{header} {joined}", array_path)
 
 
 def encode_array_of_arrays(
@@ -187,22 +202,39 @@ def encode_array_of_arrays(
         depth: Current indentation depth
         key: Optional key name
     """
+    array_path = [*path_parts, key] if key else path_parts
     if key:
-        _maybe_write_comment(options, writer, depth, [*path_parts, key])
+        _maybe_write_comment(options, writer, depth, array_path)
     header = format_header(key, len(arr), None, options.delimiter, options.lengthMarker)
-    writer.push(depth, header)
+    writer.push(depth, header, array_path)
 
     for item in arr:
         if is_array_of_primitives(item):
-            encoded_values = [encode_primitive(v, options.delimiter) for v in item]
-            joined = join_encoded_values(encoded_values, options.delimiter)
-            length_marker = options.lengthMarker if options.lengthMarker else ""
-            writer.push(
-                depth + 1,
-                f"{LIST_ITEM_PREFIX}[{length_marker}{len(item)}{options.delimiter}]: {joined}",
-            )
+            encode_primitive_array_as_list_item(item, options, writer, depth + 1, array_path)
         else:
-            encode_array(item, options, writer, depth + 1, None, path_parts)
+            encode_array(item, options, writer, depth + 1, None, array_path)
+
+
+def encode_primitive_array_as_list_item(
+    arr: JsonArray,
+    options: ResolvedEncodeOptions,
+    writer: LineWriter,
+    depth: Depth,
+    path_parts: List[str],
+) -> None:
+    """Encode an array of primitives as an inline list item (``- [N]: a,b``).
+
+    Args:
+        arr: Array of primitives
+        options: Resolved encoding options
+        writer: Line writer for output
+        depth: Current indentation depth
+    """
+    encoded_values = [encode_primitive(v, options.delimiter) for v in arr]
+    joined = join_encoded_values(encoded_values, options.delimiter)
+    length_marker = options.lengthMarker if options.lengthMarker else ""
+    line = f"{LIST_ITEM_PREFIX}[{length_marker}{len(arr)}{options.delimiter}]:"
+    writer.push(depth, f"{line} {joined}" if joined else line, path_parts)
 
 
 def detect_tabular_header(arr: List[JsonObject], delimiter: str) -> Optional[List[str]]:
@@ -263,24 +295,25 @@ def encode_array_of_objects_as_tabular(
         depth: Current indentation depth
         key: Optional key name
     """
+    array_path = [*path_parts, key] if key else path_parts
     if key:
-        _maybe_write_comment(options, writer, depth, [*path_parts, key])
+        _maybe_write_comment(options, writer, depth, array_path)
     header = format_header(key, len(arr), fields, options.delimiter, options.lengthMarker)
-    writer.push(depth, header)
+    writer.push_tabular_header(depth, header, key, fields, array_path)
 
     # Optional per-field comments (if provided) placed under header
     any_field_comment = False
     for field in fields:
-        field_comment = options.comments.get(_path_to_key([*path_parts, key, field]) if key else _path_to_key([*path_parts, field]))
+        field_comment = options.comments.get(_path_to_key([*array_path, field]))
         if field_comment:
             any_field_comment = True
             prefix = options.commentPrefix if options.commentPrefix is not None else "#"
-            writer.push(depth + 1, f"{prefix} {field}: {field_comment}")
+            writer.push_comment(depth + 1, f"{prefix} {field}: {field_comment}", array_path)
 
     for obj in arr:
         row_values = [encode_primitive(obj[field], options.delimiter) for field in fields]
         row = join_encoded_values(row_values, options.delimiter)
-        writer.push(depth + 1, row)
+        writer.push(depth + 1, row, array_path)
 
 
 def encode_mixed_array_as_list_items(
@@ -300,18 +333,22 @@ def encode_mixed_array_as_list_items(
         depth: Current indentation depth
         key: Optional key name
     """
+    array_path = [*path_parts, key] if key else path_parts
     if key:
-        _maybe_write_comment(options, writer, depth, [*path_parts, key])
+        _maybe_write_comment(options, writer, depth, array_path)
     header = format_header(key, len(arr), None, options.delimiter, options.lengthMarker)
-    writer.push(depth, header)
+    writer.push(depth, header, array_path)
 
     for item in arr:
         if is_json_primitive(item):
-            writer.push(depth + 1, f"{LIST_ITEM_PREFIX}{encode_primitive(item, options.delimiter)}")
+            encoded_item = encode_primitive(item, options.delimiter)
+            writer.push(depth + 1, f"{LIST_ITEM_PREFIX}{encoded_item}", array_path)
         elif is_json_object(item):
-            encode_object_as_list_item(item, options, writer, depth + 1, path_parts)
+            encode_object_as_list_item(item, options, writer, depth + 1, array_path)
+        elif is_json_array(item) and is_array_of_primitives(item):
+            encode_primitive_array_as_list_item(item, options, writer, depth + 1, array_path)
         elif is_json_array(item):
-            encode_array(item, options, writer, depth + 1, None, path_parts)
+            encode_array(item, options, writer, depth + 1, None, array_path)
 
 
 def encode_object_as_list_item(
@@ -328,17 +365,21 @@ def encode_object_as_list_item(
     # Get all keys
     keys = list(obj.items())
     if not keys:
-        writer.push(depth, LIST_ITEM_PREFIX.rstrip())
+        writer.push(depth, LIST_ITEM_PREFIX.rstrip(), path_parts)
         return
 
     # First key-value pair goes on same line as the "-"
     first_key, first_value = keys[0]
     if is_json_primitive(first_value):
         encoded_val = encode_primitive(first_value, options.delimiter)
-        writer.push(depth, f"{LIST_ITEM_PREFIX}{encode_key(first_key)}: {encoded_val}")
+        writer.push(
+            depth,
+            f"{LIST_ITEM_PREFIX}{encode_key(first_key)}: {encoded_val}",
+            [*path_parts, first_key],
+        )
     else:
         # If first value is not primitive, put "-" alone then encode normally
-        writer.push(depth, LIST_ITEM_PREFIX.rstrip())
+        writer.push(depth, LIST_ITEM_PREFIX.rstrip(), path_parts)
         encode_key_value_pair(first_key, first_value, options, writer, depth + 1, path_parts)
 
     # Rest of the keys go normally indented
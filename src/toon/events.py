@@ -0,0 +1,275 @@
+"""Pull-parser event API for TOON."""
+
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .constants import LIST_ITEM_MARKER
+from .decoder import (
+    Line,
+    LineReader,
+    ToonDecodeError,
+    _header_inline_content,
+    _iter_lines,
+    _split_lines,
+    _strip_newlines,
+    decode_inline_array,
+    iter_tabular_rows,
+    parse_header,
+    parse_key,
+    parse_primitive,
+    split_key_value,
+)
+from .types import DecodeOptions
+
+# (event, value) pairs. Events and their values:
+#   start_object  None
+#   key           field name
+#   start_array   {"length": int, "delimiter": str, "fields": list or None}
+#   row           dict of one tabular row
+#   scalar        primitive value
+#   end_array     None
+#   end_object    None
+Event = Tuple[str, Any]
+
+
+def iterparse(
+    source: Union[str, IO[str], IO[bytes], Iterable[Union[str, bytes]]],
+    options: Optional[DecodeOptions] = None,
+) -> Iterator[Event]:
+    """Parse TOON incrementally, yielding structural events.
+
+    Tabular arrays yield one ``row`` event per row instead of building the
+    list of rows, so arbitrarily large tables can be processed with constant
+    memory. Inline primitive arrays yield one ``scalar`` per element.
+
+    Args:
+        source: TOON string, open file (text or binary) or iterable of lines
+        options: Optional decoding options
+
+    Yields:
+        ``(event, value)`` tuples, see ``Event``
+
+    Raises:
+        ToonDecodeError: If input is malformed. Errors are raised when the
+            offending line is reached, after the events preceding it (an
+            array length mismatch is raised after the array's last item).
+    """
+    if options is None:
+        options = DecodeOptions()
+
+    raw_lines = _split_lines(source) if isinstance(source, str) else _strip_newlines(source)
+    reader = LineReader(_iter_lines(raw_lines, options.indent, options.strict))
+    return _parse_root(reader, options.strict)
+
+
+class _Frame:
+    """An open object or list-format array on the parser's stack.
+
+    Object frames hold fields at ``depth``; list frames hold items whose
+    ``- `` marker is at ``depth`` and count them against ``expected``.
+    """
+
+    __slots__ = ("depth", "is_list", "expected", "count")
+
+    def __init__(self, depth: int, is_list: bool = False, expected: int = 0) -> None:
+        self.depth = depth
+        self.is_list = is_list
+        self.expected = expected
+        self.count = 0
+
+
+def _parse_root(reader: LineReader, strict: bool) -> Iterator[Event]:
+    """Yield the events of the root value."""
+    while reader.line is not None and reader.line.is_blank:
+        reader.advance()
+
+    first_line = reader.line
+    if first_line is None:
+        if strict:
+            raise ToonDecodeError("Empty input")
+        yield ("scalar", None)
+        return
+
+    stack: List[_Frame] = []
+    header_info = first_line.header()
+    if header_info is not None and header_info[0] is None:
+        yield from _parse_array(
+            reader, first_line.content, first_line.depth, header_info, stack, strict
+        )
+        yield from _parse_frames(reader, stack, strict)
+        return
+
+    if header_info is None:
+        try:
+            split_key_value(first_line.content)
+        except ToonDecodeError:
+            reader.advance()
+            while reader.line is not None and reader.line.is_blank:
+                reader.advance()
+            if reader.line is None:
+                yield ("scalar", parse_primitive(first_line.content))
+                return
+            if strict:
+                raise
+
+    yield ("start_object", None)
+    stack.append(_Frame(first_line.depth))
+    yield from _parse_frames(reader, stack, strict)
+
+
+def _parse_frames(reader: LineReader, stack: List[_Frame], strict: bool) -> Iterator[Event]:
+    """Yield the events of nested objects and list arrays with an explicit stack.
+
+    This is the walk ``decoder._build`` does, emitting events instead of
+    building containers, so nesting depth is not bounded by the
+    interpreter's recursion limit. Returns when every frame on ``stack``
+    has been closed.
+    """
+    while stack:
+        frame = stack[-1]
+        line = reader.line
+
+        # Close the frame at end of input or when we've dedented below it
+        if line is None or (not line.is_blank and line.depth < frame.depth):
+            stack.pop()
+            yield _close_frame(frame, strict)
+            continue
+
+        if line.is_blank:
+            # Blank lines are allowed between fields, not inside arrays
+            if frame.is_list and strict:
+                raise ToonDecodeError("Blank lines not allowed inside arrays")
+            reader.advance()
+            continue
+
+        if frame.is_list:
+            if not line.content.startswith(LIST_ITEM_MARKER):
+                # Not a list item, end of array
+                stack.pop()
+                yield _close_frame(frame, strict)
+                continue
+            frame.count += 1
+            yield from _parse_list_item(reader, line, stack, strict)
+            continue
+
+        # Skip lines that are too deeply indented (they belong to nothing)
+        if line.depth > frame.depth:
+            reader.advance()
+            continue
+
+        yield from _parse_field(reader, line, stack, strict)
+
+
+def _close_frame(frame: _Frame, strict: bool) -> Event:
+    if not frame.is_list:
+        return ("end_object", None)
+    if strict and frame.count != frame.expected:
+        raise ToonDecodeError(f"Expected {frame.expected} items, but got {frame.count}")
+    return ("end_array", None)
+
+
+def _parse_field(
+    reader: LineReader, line: Line, stack: List[_Frame], strict: bool
+) -> Iterator[Event]:
+    """Yield the events of one field line, pushing a frame for nested values."""
+    header_info = line.header()
+    if header_info is not None and header_info[0] is not None:
+        yield ("key", header_info[0])
+        yield from _parse_array(reader, line.content, line.depth, header_info, stack, strict)
+        return
+
+    try:
+        key_str, value_str = split_key_value(line.content)
+    except ToonDecodeError:
+        if strict:
+            raise
+        reader.advance()
+        return
+
+    yield ("key", parse_key(key_str))
+    reader.advance()
+    if not value_str:
+        yield ("start_object", None)
+        stack.append(_Frame(line.depth + 1))
+    else:
+        yield ("scalar", parse_primitive(value_str))
+
+
+def _parse_array(
+    reader: LineReader,
+    content: str,
+    header_depth: int,
+    header_info: Tuple[Optional[str], int, str, Optional[List[str]]],
+    stack: List[_Frame],
+    strict: bool,
+) -> Iterator[Event]:
+    """Yield the events of an array starting at its header line.
+
+    Inline and tabular arrays are parsed completely. A list-format array
+    only yields ``start_array``, with a frame pushed for its items.
+    """
+    _, length, delimiter, fields = header_info
+    reader.advance()
+    yield ("start_array", {"length": length, "delimiter": delimiter, "fields": fields})
+
+    inline_content = _header_inline_content(content)
+    if inline_content or length == 0:
+        for value in decode_inline_array(inline_content, delimiter, length, strict):
+            yield ("scalar", value)
+    elif fields is not None:
+        for row in iter_tabular_rows(reader, header_depth, fields, delimiter, length, strict):
+            yield ("row", row)
+    else:
+        stack.append(_Frame(header_depth + 1, True, length))
+        return
+
+    yield ("end_array", None)
+
+
+def _parse_list_item(
+    reader: LineReader, line: Line, stack: List[_Frame], strict: bool
+) -> Iterator[Event]:
+    """Yield the events of one ``- `` line, pushing frames for nested values."""
+    item_content = line.content[len(LIST_ITEM_MARKER):].strip()
+
+    if not item_content:
+        # "-" alone: object whose fields follow at depth +1 (or empty object)
+        reader.advance()
+        yield ("start_object", None)
+        stack.append(_Frame(line.depth + 1))
+        return
+
+    item_header = parse_header(item_content)
+    if item_header is not None:
+        if item_header[0] is None:
+            inline_part = _header_inline_content(item_content)
+            if inline_part or item_header[1] == 0:
+                yield from _parse_array(
+                    reader, item_content, line.depth, item_header, stack, strict
+                )
+                return
+        else:
+            # - key[N]: array field in object; remaining fields at depth +1
+            yield ("start_object", None)
+            yield ("key", item_header[0])
+            stack.append(_Frame(line.depth + 1))
+            yield from _parse_array(reader, item_content, line.depth, item_header, stack, strict)
+            return
+
+    try:
+        key_str, value_str = split_key_value(item_content)
+    except ToonDecodeError:
+        reader.advance()
+        yield ("scalar", parse_primitive(item_content))
+        return
+
+    # Object item; remaining fields at depth +1
+    reader.advance()
+    yield ("start_object", None)
+    yield ("key", parse_key(key_str))
+    stack.append(_Frame(line.depth + 1))
+    if not value_str:
+        # First field is a nested object: fields at depth +2
+        yield ("start_object", None)
+        stack.append(_Frame(line.depth + 2))
+    else:
+        yield ("scalar", parse_primitive(value_str))
@@ -0,0 +1,285 @@
+"""Incremental push parser for TOON arriving in chunks."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import LIST_ITEM_MARKER
+from .decoder import (
+    Line,
+    ToonDecodeError,
+    _header_inline_content,
+    _row_from_tokens,
+    compute_depth,
+    decode_inline_array,
+    parse_header,
+    parse_key,
+    parse_primitive,
+    split_key_value,
+    split_row,
+)
+from .types import DecodeOptions, JsonValue
+
+_OBJECT = "object"
+_TABLE = "table"
+_LIST = "list"
+
+
+class _Frame:
+    """An open container waiting for more lines."""
+
+    __slots__ = ("kind", "depth", "container", "expected", "fields", "delimiter")
+
+    def __init__(
+        self,
+        kind: str,
+        depth: int,
+        container: Any,
+        expected: int = 0,
+        fields: Optional[List[str]] = None,
+        delimiter: str = "",
+    ) -> None:
+        self.kind = kind
+        self.depth = depth
+        self.container = container
+        self.expected = expected
+        # Header fields of a table frame; empty for objects and lists
+        self.fields: List[str] = fields or []
+        self.delimiter = delimiter
+
+
+class ToonParser:
+    """Push parser that decodes TOON as it arrives, chunk by chunk.
+
+    Each complete line is parsed exactly once, when the newline ending it is
+    fed; an unfinished last line is buffered until the rest of it arrives.
+    ``partial()`` returns the value decoded so far, including every
+    completed tabular row, so callers can act on rows while a model is still
+    generating. ``close()`` parses the buffered tail and runs the checks that
+    need the whole input (array lengths, empty input).
+
+    Example:
+        >>> parser = ToonParser()
+        >>> parser.feed("orders[2]{id,sku}:\\n  1,A1\\n  2,")
+        >>> parser.partial()
+        {'orders': [{'id': 1, 'sku': 'A1'}]}
+        >>> parser.feed("A2\\n")
+        >>> parser.close()
+        {'orders': [{'id': 1, 'sku': 'A1'}, {'id': 2, 'sku': 'A2'}]}
+    """
+
+    def __init__(self, options: Optional[DecodeOptions] = None) -> None:
+        """Initialize the parser.
+
+        Args:
+            options: Optional decoding options
+        """
+        if options is None:
+            options = DecodeOptions()
+        self._indent = options.indent
+        self._strict = options.strict
+        self._buffer = ""
+        self._line_number = 0
+        self._frames: List[_Frame] = []
+        self._started = False
+        self._root: JsonValue = None
+        # First line of a document that may turn out to be a single primitive
+        self._pending_primitive: Optional[Line] = None
+        self._closed = False
+
+    def feed(self, chunk: str) -> None:
+        """Parse the complete lines in ``chunk`` (plus any buffered tail).
+
+        Args:
+            chunk: Next piece of TOON text, of any length
+
+        Raises:
+            ToonDecodeError: If a completed line is malformed
+            ValueError: If the parser has already been closed
+        """
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        newline = chunk.rfind("\n")
+        if newline == -1:
+            self._buffer += chunk
+            return
+        lines = (self._buffer + chunk[:newline]).split("\n")
+        self._buffer = chunk[newline + 1:]
+        for raw in lines:
+            self._process(raw)
+
+    def partial(self) -> JsonValue:
+        """Return the value decoded from the complete lines fed so far.
+
+        The returned containers are live: later ``feed()`` calls keep adding
+        to them rather than building new ones.
+        """
+        return self._root
+
+    def close(self) -> JsonValue:
+        """Finish parsing and return the decoded value.
+
+        Raises:
+            ToonDecodeError: If input is malformed or incomplete
+        """
+        if not self._closed:
+            self._closed = True
+            if self._buffer:
+                self._process(self._buffer)
+                self._buffer = ""
+            while self._frames:
+                self._pop()
+            if not self._started and self._strict:
+                raise ToonDecodeError("Empty input")
+        return self._root
+
+    def _process(self, raw: str) -> None:
+        self._line_number += 1
+        content = raw.strip()
+        if not content:
+            return
+        line = Line(content, compute_depth(raw, self._indent, self._strict), self._line_number)
+
+        if not self._started:
+            self._start(line)
+            return
+
+        if self._pending_primitive is not None:
+            # More content follows, so the first line was not a primitive
+            first = self._pending_primitive
+            self._pending_primitive = None
+            if self._strict:
+                split_key_value(first.content)
+            self._root = {}
+            self._frames.append(_Frame(_OBJECT, first.depth, self._root))
+
+        depth = line.depth
+        while self._frames:
+            frame = self._frames[-1]
+            if frame.kind == _OBJECT:
+                if depth < frame.depth:
+                    self._pop()
+                    continue
+                if depth == frame.depth:
+                    self._field(frame.container, line)
+                # Deeper lines that belong to no field are skipped
+                return
+            if frame.kind == _TABLE:
+                tokens = split_row(content, frame.delimiter) if depth == frame.depth else None
+                if tokens is not None:
+                    frame.container.append(_row_from_tokens(tokens, frame.fields, self._strict))
+                    return
+            elif depth >= frame.depth and content.startswith(LIST_ITEM_MARKER):
+                self._item(frame.container, line)
+                return
+            self._pop()
+        # Lines after the root value has ended are ignored
+
+    def _start(self, line: Line) -> None:
+        """Decide the root form from the first non-blank line."""
+        self._started = True
+        header_info = line.header()
+        if header_info is not None and header_info[0] is None:
+            self._root = self._open_array(line.content, line.depth, header_info)
+            return
+
+        if header_info is None:
+            try:
+                split_key_value(line.content)
+            except ToonDecodeError:
+                self._root = parse_primitive(line.content)
+                self._pending_primitive = line
+                return
+
+        self._root = {}
+        self._frames.append(_Frame(_OBJECT, line.depth, self._root))
+        self._field(self._root, line)
+
+    def _field(self, obj: Dict[str, Any], line: Line) -> None:
+        """Add one ``key: value`` or ``key[N]:`` line to an object."""
+        header_info = line.header()
+        if header_info is not None and header_info[0] is not None:
+            obj[header_info[0]] = self._open_array(line.content, line.depth, header_info)
+            return
+
+        try:
+            key_str, value_str = split_key_value(line.content)
+        except ToonDecodeError:
+            if self._strict:
+                raise
+            return
+
+        key = parse_key(key_str)
+        if not value_str:
+            child: Dict[str, Any] = {}
+            obj[key] = child
+            self._frames.append(_Frame(_OBJECT, line.depth + 1, child))
+        else:
+            obj[key] = parse_primitive(value_str)
+
+    def _item(self, items: List[Any], line: Line) -> None:
+        """Add one ``- ...`` line to a list-format array."""
+        item_content = line.content[len(LIST_ITEM_MARKER):].strip()
+        item_depth = line.depth
+
+        if not item_content:
+            obj: Dict[str, Any] = {}
+            items.append(obj)
+            self._frames.append(_Frame(_OBJECT, item_depth + 1, obj))
+            return
+
+        item_header = parse_header(item_content)
+        if item_header is not None:
+            key, length, delimiter, _ = item_header
+            if key is None:
+                inline_part = _header_inline_content(item_content)
+                if inline_part or length == 0:
+                    items.append(decode_inline_array(inline_part, delimiter, length, self._strict))
+                    return
+            else:
+                obj = {}
+                items.append(obj)
+                self._frames.append(_Frame(_OBJECT, item_depth + 1, obj))
+                obj[key] = self._open_array(item_content, item_depth, item_header)
+                return
+
+        try:
+            key_str, value_str = split_key_value(item_content)
+        except ToonDecodeError:
+            items.append(parse_primitive(item_content))
+            return
+
+        obj = {}
+        items.append(obj)
+        self._frames.append(_Frame(_OBJECT, item_depth + 1, obj))
+        key = parse_key(key_str)
+        if not value_str:
+            child: Dict[str, Any] = {}
+            obj[key] = child
+            self._frames.append(_Frame(_OBJECT, item_depth + 2, child))
+        else:
+            obj[key] = parse_primitive(value_str)
+
+    def _open_array(
+        self,
+        content: str,
+        header_depth: int,
+        header_info: Tuple[Optional[str], int, str, Optional[List[str]]],
+    ) -> List[Any]:
+        """Create the list for an array header, opening a frame for its rows or items."""
+        _, length, delimiter, fields = header_info
+        inline_content = _header_inline_content(content)
+        if inline_content:
+            return decode_inline_array(inline_content, delimiter, length, self._strict)
+
+        result: List[Any] = []
+        kind = _TABLE if fields is not None else _LIST
+        self._frames.append(_Frame(kind, header_depth + 1, result, length, fields, delimiter))
+        return result
+
+    def _pop(self) -> None:
+        """Close the innermost open container, checking its declared length."""
+        frame = self._frames.pop()
+        if self._strict and frame.kind != _OBJECT and len(frame.container) != frame.expected:
+            noun = "rows" if frame.kind == _TABLE else "items"
+            raise ToonDecodeError(
+                f"Expected {frame.expected} {noun}, but got {len(frame.container)}"
+            )
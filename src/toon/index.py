@@ -0,0 +1,455 @@
+"""Structural line index for random access into large TOON files."""
+
+import json
+import mmap
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
+
+from .constants import LIST_ITEM_MARKER
+from .decoder import (
+    ToonDecodeError,
+    _header_inline_content,
+    _parse_row,
+    compute_depth,
+    decode,
+    decode_inline_array,
+    is_row_line,
+    parse_header,
+    parse_key,
+    split_key_value,
+)
+from .types import DecodeOptions, JsonValue
+
+INDEX_VERSION = 1
+DEFAULT_STRIDE = 1024
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class IndexEntry:
+    """Location of one key path in a TOON file.
+
+    Attributes:
+        kind: "object", "array" or "value"
+        offset: Byte offset of the field's first line
+        end_offset: Byte offset just past the field's last line
+        line: 1-based number of the field's first line
+        end_line: Number of the first line after the field
+        depth: Indentation depth of the field's first line
+        length: Declared ``[N]`` length for arrays, else None
+        count: Rows or items actually found under an array header
+        checkpoints: Byte offsets of every ``stride``-th row or item
+    """
+
+    __slots__ = (
+        "kind", "offset", "end_offset", "line", "end_line", "depth", "length", "count",
+        "checkpoints",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        offset: int,
+        line: int,
+        depth: int,
+        length: Optional[int] = None,
+        end_offset: int = 0,
+        end_line: int = 0,
+        count: int = 0,
+        checkpoints: Optional[List[int]] = None,
+    ) -> None:
+        self.kind = kind
+        self.offset = offset
+        self.end_offset = end_offset
+        self.line = line
+        self.end_line = end_line
+        self.depth = depth
+        self.length = length
+        self.count = count
+        self.checkpoints = checkpoints if checkpoints is not None else []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndexEntry":
+        return cls(**data)
+
+    def __repr__(self) -> str:
+        return (
+            f"IndexEntry(kind={self.kind!r}, offset={self.offset}, end_offset={self.end_offset}, "
+            f"lines={self.line}-{self.end_line}, depth={self.depth}, length={self.length})"
+        )
+
+
+class ToonIndex:
+    """Byte offsets and line ranges of the key paths of a TOON file.
+
+    Object fields outside arrays are indexed by dotted path (the document
+    root is ``""``). Arrays additionally record a checkpoint every
+    ``stride`` rows or items, so ``decode_item("orders", 500000)`` seeks to
+    the nearest checkpoint and skips at most ``stride - 1`` rows. Reads go
+    through ``mmap``, so only the touched pages of the file are loaded.
+
+    Build an index with ``build_index``, persist it next to the data with
+    ``save`` and reopen it with ``load``.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        entries: Dict[str, IndexEntry],
+        size: int,
+        indent: int = 2,
+        stride: int = DEFAULT_STRIDE,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.entries = entries
+        self.size = size
+        self.indent = indent
+        self.stride = stride
+
+    def __getitem__(self, key_path: str) -> IndexEntry:
+        return self.entries[key_path]
+
+    def __contains__(self, key_path: object) -> bool:
+        return key_path in self.entries
+
+    def save(self, path: PathLike) -> None:
+        """Write the index as a JSON sidecar file."""
+        data = {
+            "version": INDEX_VERSION,
+            "path": self.path,
+            "size": self.size,
+            "indent": self.indent,
+            "stride": self.stride,
+            "entries": {key: entry.to_dict() for key, entry in self.entries.items()},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: PathLike) -> "ToonIndex":
+        """Read an index written by ``save``.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported index version: {data.get('version')}")
+        entries = {key: IndexEntry.from_dict(entry) for key, entry in data["entries"].items()}
+        return cls(data["path"], entries, data["size"], data["indent"], data["stride"])
+
+    def decode_path(self, key_path: str, options: Optional[DecodeOptions] = None) -> JsonValue:
+        """Decode the value at a dotted key path without reading the rest of the file.
+
+        Args:
+            key_path: Dotted path of an indexed field ("" for the whole document)
+            options: Optional decoding options
+
+        Returns:
+            Decoded value
+
+        Raises:
+            KeyError: If the path is not in the index
+            ValueError: If the file changed size since the index was built
+        """
+        entry = self.entries[key_path]
+        with self._open() as buffer:
+            text = _dedent(buffer[entry.offset:entry.end_offset], entry.depth * self.indent)
+        result = decode(text, options)
+        if key_path == "":
+            return result
+        # The slice is a one-field object; return that field's value
+        return next(iter(cast(Dict[str, Any], result).values()))
+
+    def decode_item(
+        self, key_path: str, position: int, options: Optional[DecodeOptions] = None
+    ) -> JsonValue:
+        """Decode one row or item of an indexed array.
+
+        Args:
+            key_path: Dotted path of an array
+            position: Index of the row or item (negative counts from the end)
+            options: Optional decoding options
+
+        Returns:
+            Decoded row or item
+
+        Raises:
+            KeyError: If the path is not in the index
+            TypeError: If the path is not an array
+            IndexError: If the position is out of range
+            ValueError: If the file changed since the index was built
+        """
+        if options is None:
+            options = DecodeOptions()
+        entry = self.entries[key_path]
+        if entry.kind != "array":
+            raise TypeError(f"{key_path!r} is not an array")
+        if position < 0:
+            position += entry.count
+        if not 0 <= position < entry.count:
+            raise IndexError("array index out of range")
+
+        with self._open() as buffer:
+            header = _line_at(buffer, entry.offset).decode("utf-8").strip()
+            header_info = parse_header(header)
+            if header_info is None:
+                # Rewritten in place without changing size
+                raise ValueError(f"{self.path} changed since the index was built")
+            _, length, delimiter, fields = header_info
+            inline_content = _header_inline_content(header)
+            if inline_content:
+                items = decode_inline_array(inline_content, delimiter, length, options.strict)
+                return items[position]
+
+            checkpoint = position // self.stride
+            lines = _lines_from(buffer, entry.checkpoints[checkpoint], entry.end_offset)
+            item_spaces = (entry.depth + 1) * self.indent
+            item_lines = _nth_item(
+                lines, position - checkpoint * self.stride, item_spaces, fields is not None
+            )
+
+        if fields is not None:
+            row = item_lines[0].decode("utf-8").strip()
+            return _parse_row(row, fields, delimiter, options.strict)
+
+        # Re-indent the item under a one-item root array and decode that
+        text = "\n".join(
+            " " * self.indent + line.decode("utf-8")[item_spaces:] for line in item_lines
+        )
+        return cast(List[Any], decode(f"[1]:\n{text}", options))[0]
+
+    def _open(self) -> mmap.mmap:
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size != self.size:
+                raise ValueError(f"{self.path} changed since the index was built")
+            if size == 0:
+                raise ValueError(f"{self.path} is empty")
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def build_index(
+    path: PathLike,
+    options: Optional[DecodeOptions] = None,
+    stride: int = DEFAULT_STRIDE,
+) -> ToonIndex:
+    """Index the key paths of a TOON file in one linear pass.
+
+    Each line is read once, its depth computed with ``compute_depth``, and
+    only lines at a depth where a field, row or item can start are looked at
+    further. Content nested inside array items is not indexed by path.
+
+    Args:
+        path: TOON file to index
+        options: Optional decoding options (``indent`` and ``strict`` are used)
+        stride: Rows or items between array checkpoints
+
+    Returns:
+        ToonIndex for the file
+
+    Raises:
+        ValueError: If stride is not positive
+        ToonDecodeError: If indentation is invalid in strict mode
+    """
+    if stride <= 0:
+        raise ValueError("stride must be positive")
+    if options is None:
+        options = DecodeOptions()
+    indent, strict = options.indent, options.strict
+
+    entries: Dict[str, IndexEntry] = {}
+    stack: List[_OpenEntry] = []
+    done = False
+    offset = 0
+    line_number = 0
+
+    with open(path, "rb") as f:
+        for raw in f:
+            line_number += 1
+            line_offset = offset
+            offset += len(raw)
+            if done:
+                continue
+            text = raw.decode("utf-8").rstrip("\r\n")
+            content = text.strip()
+            if not content:
+                continue
+            depth = compute_depth(text, indent, strict)
+
+            while stack and depth < stack[-1].child_depth:
+                stack.pop().close(line_offset, line_number)
+
+            if not stack:
+                if entries:
+                    # Content after the root value is ignored by the decoder
+                    done = True
+                    continue
+                stack.append(_open_root(entries, content, line_offset, line_number, depth))
+                if stack[-1].role != _OBJECT:
+                    continue
+
+            top = stack[-1]
+            if depth != top.child_depth:
+                # Nested inside a value, a row or an item
+                continue
+            if top.role == _OBJECT:
+                opened = _open_field(entries, top.path, content, line_offset, line_number, depth)
+                if opened is not None:
+                    stack.append(opened)
+            elif top.role == _TABLE:
+                if is_row_line(content, top.delimiter):
+                    top.add_item(line_offset, stride)
+            elif top.role == _LIST and content.startswith(LIST_ITEM_MARKER):
+                top.add_item(line_offset, stride)
+
+    while stack:
+        stack.pop().close(offset, line_number + 1)
+    return ToonIndex(path, entries, offset, indent, stride)
+
+
+_OBJECT = "object"
+_TABLE = "table"
+_LIST = "list"
+_VALUE = "value"
+
+
+class _OpenEntry:
+    """An index entry whose end has not been seen yet."""
+
+    __slots__ = ("path", "entry", "role", "child_depth", "delimiter")
+
+    def __init__(
+        self, path: str, entry: IndexEntry, role: str, child_depth: int, delimiter: str = ""
+    ) -> None:
+        self.path = path
+        self.entry = entry
+        self.role = role
+        self.child_depth = child_depth
+        self.delimiter = delimiter
+
+    def add_item(self, offset: int, stride: int) -> None:
+        entry = self.entry
+        if entry.count % stride == 0:
+            entry.checkpoints.append(offset)
+        entry.count += 1
+
+    def close(self, offset: int, line_number: int) -> None:
+        self.entry.end_offset = offset
+        self.entry.end_line = line_number
+
+
+def _open_array(
+    path: str,
+    content: str,
+    header_info: Tuple[Optional[str], int, str, Optional[List[str]]],
+    offset: int,
+    line_number: int,
+    depth: int,
+) -> _OpenEntry:
+    _, length, delimiter, fields = header_info
+    entry = IndexEntry("array", offset, line_number, depth, length)
+    if _header_inline_content(content):
+        entry.count = length
+        return _OpenEntry(path, entry, _VALUE, depth + 1)
+    role = _TABLE if fields is not None else _LIST
+    return _OpenEntry(path, entry, role, depth + 1, delimiter)
+
+
+def _open_root(
+    entries: Dict[str, IndexEntry], content: str, offset: int, line_number: int, depth: int
+) -> _OpenEntry:
+    """Create the entry for the document root from its first line."""
+    header_info = parse_header(content)
+    if header_info is not None and header_info[0] is None:
+        root = _open_array("", content, header_info, offset, line_number, depth)
+    else:
+        # Root object: its fields are at the depth of the first line
+        root = _OpenEntry("", IndexEntry("object", offset, line_number, depth), _OBJECT, depth)
+    entries[""] = root.entry
+    return root
+
+
+def _open_field(
+    entries: Dict[str, IndexEntry],
+    parent_path: str,
+    content: str,
+    offset: int,
+    line_number: int,
+    depth: int,
+) -> Optional[_OpenEntry]:
+    """Create the entry for an object field line, or None if it is not one."""
+    header_info = parse_header(content)
+    if header_info is not None and header_info[0] is not None:
+        path = f"{parent_path}.{header_info[0]}" if parent_path else header_info[0]
+        opened = _open_array(path, content, header_info, offset, line_number, depth)
+    else:
+        try:
+            key_str, value_str = split_key_value(content)
+        except ToonDecodeError:
+            # Not a field; decoding this region reports the error
+            return None
+        key = parse_key(key_str)
+        path = f"{parent_path}.{key}" if parent_path else key
+        kind, role = (_VALUE, _VALUE) if value_str else (_OBJECT, _OBJECT)
+        opened = _OpenEntry(path, IndexEntry(kind, offset, line_number, depth), role, depth + 1)
+    entries[path] = opened.entry
+    return opened
+
+
+def _line_at(buffer: mmap.mmap, offset: int) -> bytes:
+    end = buffer.find(b"\n", offset)
+    return buffer[offset:end if end != -1 else len(buffer)]
+
+
+def _lines_from(buffer: mmap.mmap, start: int, end: int) -> Iterator[bytes]:
+    """Yield the lines of ``buffer[start:end]`` without line terminators."""
+    position = start
+    while position < end:
+        newline = buffer.find(b"\n", position, end)
+        if newline == -1:
+            newline = end
+        yield buffer[position:newline].rstrip(b"\r")
+        position = newline + 1
+
+
+def _leading_spaces(line: bytes) -> int:
+    return len(line) - len(line.lstrip(b" "))
+
+
+def _nth_item(lines: Iterator[bytes], n: int, item_spaces: int, tabular: bool) -> List[bytes]:
+    """Return the lines of the ``n``-th row or list item in ``lines``."""
+    marker = LIST_ITEM_MARKER.encode()
+    seen = -1
+    collected: List[bytes] = []
+    for line in lines:
+        if not line.strip():
+            continue
+        spaces = _leading_spaces(line)
+        starts_item = spaces == item_spaces and (tabular or line[spaces:].startswith(marker))
+        if starts_item:
+            seen += 1
+            if seen > n:
+                break
+        elif spaces < item_spaces:
+            break
+        if seen == n:
+            collected.append(line)
+            if tabular:
+                break
+    if not collected:
+        raise IndexError("array index out of range")
+    return collected
+
+
+def _dedent(data: bytes, spaces: int) -> str:
+    """Decode a byte slice and remove ``spaces`` columns of indentation."""
+    prefix = " " * spaces
+    return "\n".join(
+        line[spaces:] if line.startswith(prefix) else line.lstrip(" ")
+        for line in data.decode("utf-8").split("\n")
+    )
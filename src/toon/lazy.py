@@ -0,0 +1,267 @@
+"""Lazy decoding: subtrees are decoded only when they are accessed."""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union, overload
+
+from .constants import LIST_ITEM_MARKER
+from .decoder import (
+    LINE_FIELD,
+    LINE_HEADER,
+    LINE_TEXT,
+    DecodeContext,
+    Line,
+    LineReader,
+    ToonDecodeError,
+    _iter_lines,
+    _split_lines,
+    decode_inline_array,
+    decode_list_array,
+    decode_tabular_array,
+    parse_key,
+    parse_primitive,
+    split_key_value,
+)
+from .types import DecodeOptions
+
+
+def decode_lazy(input_str: str, options: Optional[DecodeOptions] = None) -> Any:
+    """Decode a TOON string into proxies that decode subtrees on access.
+
+    A single pass computes the depth of every line and where each line's
+    subtree ends. Objects are returned as read-only ``Mapping`` proxies and
+    list-format arrays as ``Sequence`` proxies; a field or item is decoded
+    the first time it is accessed and then cached, so reading
+    ``doc["meta"]["version"]`` costs about the size of ``meta`` rather than
+    the whole document. Tabular and inline arrays are decoded in full into
+    plain lists when first accessed. Proxies compare equal to the plain
+    values ``decode()`` returns.
+
+    Args:
+        input_str: TOON-formatted string
+        options: Optional decoding options
+
+    Returns:
+        ``LazyObject``, ``LazyArray``, list or primitive
+
+    Raises:
+        ToonDecodeError: If indentation is invalid (on the initial scan), or
+            if a subtree is malformed (when it is accessed)
+    """
+    if options is None:
+        options = DecodeOptions()
+
+    document = _Document(input_str, options)
+    count = len(document.contents)
+    if not count:
+        if options.strict:
+            raise ToonDecodeError("Empty input")
+        return None
+
+    kind, header_info, _ = document.line(0).field_info()
+    if kind == LINE_HEADER and header_info[0] is None:
+        return document.array(0)
+
+    if kind == LINE_TEXT and count == 1:
+        return parse_primitive(document.contents[0])
+
+    return LazyObject(document, 0, count, document.depths[0])
+
+
+class _Document:
+    """Non-blank lines of a document plus the end of every line's subtree.
+
+    Lines are kept as a list of content strings with parallel ``array('I')``
+    tables for depth, line number and subtree end; ``Line`` objects are only
+    built for the lines a subtree decode actually reads.
+    """
+
+    def __init__(self, input_str: str, options: DecodeOptions) -> None:
+        self.strict = options.strict
+        self.context = DecodeContext.from_options(options)
+        self.contents: List[str] = []
+        self.depths = array("I")
+        self.numbers = array("I")
+        for line in _iter_lines(_split_lines(input_str), options.indent, options.strict):
+            if not line.is_blank:
+                self.contents.append(line.content)
+                self.depths.append(line.depth)
+                self.numbers.append(line.line_number)
+
+        # ends[i] is the index of the first line after i that is not nested under it
+        count = len(self.contents)
+        depths = self.depths
+        self.ends = array("I", [count]) * count
+        stack: List[int] = []
+        for i, depth in enumerate(depths):
+            while stack and depths[stack[-1]] >= depth:
+                self.ends[stack.pop()] = i
+            stack.append(i)
+
+    def line(self, index: int) -> Line:
+        return Line(self.contents[index], self.depths[index], self.numbers[index])
+
+    def reader(self, start: int, end: int) -> LineReader:
+        return LineReader(self.line(i) for i in range(start, end))
+
+    def array(self, index: int) -> Union[List[Any], "LazyArray"]:
+        """Decode the array whose header is at ``index``."""
+        line = self.line(index)
+        _, header_info, inline_content = line.field_info()
+        _, length, delimiter, fields = header_info
+        if inline_content:
+            return decode_inline_array(inline_content, delimiter, length, self.strict)
+        if fields is not None:
+            reader = self.reader(index + 1, self.ends[index])
+            return decode_tabular_array(
+                reader, line.depth, fields, delimiter, length, self.strict, self.context.table
+            )
+        return LazyArray(self, index, delimiter, length)
+
+
+class LazyObject(Mapping[str, Any]):
+    """Read-only mapping over the lines of a TOON object.
+
+    Keys are indexed on first use by jumping from field to field; values are
+    decoded and cached on first access.
+    """
+
+    def __init__(self, document: _Document, start: int, end: int, depth: int) -> None:
+        self._document = document
+        self._start = start
+        self._end = end
+        self._depth = depth
+        self._fields: Optional[Dict[str, int]] = None
+        self._values: Dict[str, Any] = {}
+
+    def _index(self) -> Dict[str, int]:
+        if self._fields is None:
+            document = self._document
+            depths, ends = document.depths, document.ends
+            fields: Dict[str, int] = {}
+            i = self._start
+            while i < self._end:
+                if depths[i] == self._depth:
+                    line = document.line(i)
+                    kind, first, _ = line.field_info()
+                    if kind == LINE_FIELD:
+                        fields[first] = i
+                    elif kind == LINE_HEADER and first[0] is not None:
+                        fields[first[0]] = i
+                    elif kind == LINE_HEADER:
+                        # A keyless header inside an object reads as a "[N]" key
+                        key_str, _ = split_key_value(line.content)
+                        fields[parse_key(key_str)] = i
+                    elif document.strict:
+                        raise ToonDecodeError("Missing colon after key")
+                # Skip the field's subtree (or an over-indented orphan line)
+                i = ends[i]
+            self._fields = fields
+        return self._fields
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        index = self._index()[key]
+
+        document = self._document
+        line = document.line(index)
+        kind, first, value_str = line.field_info()
+        value: Any
+        if kind == LINE_HEADER and first[0] is not None:
+            value = document.array(index)
+        else:
+            if kind == LINE_HEADER:
+                _, value_str = split_key_value(line.content)
+            if value_str:
+                value = parse_primitive(value_str)
+            else:
+                value = LazyObject(document, index + 1, document.ends[index], line.depth + 1)
+
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index()
+
+    def __repr__(self) -> str:
+        return f"LazyObject({list(self._index())!r})"
+
+
+class LazyArray(Sequence[Any]):
+    """Read-only sequence over the items of a list-format TOON array.
+
+    Item positions are indexed on first use; each item is decoded and cached
+    on first access.
+    """
+
+    def __init__(self, document: _Document, header_index: int, delimiter: str, length: int) -> None:
+        self._document = document
+        self._header_index = header_index
+        self._delimiter = delimiter
+        self._length = length
+        self._positions: Optional[List[int]] = None
+        self._items: Dict[int, Any] = {}
+
+    def _index(self) -> List[int]:
+        if self._positions is None:
+            document = self._document
+            contents, depths, ends = document.contents, document.depths, document.ends
+            item_depth = depths[self._header_index] + 1
+            positions = []
+            i = self._header_index + 1
+            end = ends[self._header_index]
+            while i < end:
+                if depths[i] < item_depth or not contents[i].startswith(LIST_ITEM_MARKER):
+                    break
+                positions.append(i)
+                i = ends[i]
+            if document.strict and len(positions) != self._length:
+                raise ToonDecodeError(
+                    f"Expected {self._length} items, but got {len(positions)}"
+                )
+            self._positions = positions
+        return self._positions
+
+    def _item(self, position: int) -> Any:
+        if position not in self._items:
+            document = self._document
+            start = self._index()[position]
+            header_depth = document.depths[self._header_index]
+            reader = document.reader(start, document.ends[start])
+            self._items[position] = decode_list_array(
+                reader, header_depth, self._delimiter, 1, document.strict, document.context
+            )[0]
+        return self._items[position]
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        positions = self._index()
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(positions)))]
+        if index < 0:
+            index += len(positions)
+        if not 0 <= index < len(positions):
+            raise IndexError("LazyArray index out of range")
+        return self._item(index)
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyArray)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyArray(len={len(self)})"
@@ -0,0 +1,330 @@
+"""Parallel decoding of large tabular arrays across worker processes."""
+
+import re
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional
+
+from .constants import LIST_ITEM_MARKER
+from .decoder import (
+    INFERENCE_ROWS,
+    DecodeContext,
+    Line,
+    LineReader,
+    ParsedColumns,
+    ToonDecodeError,
+    _column_converters,
+    _convert_string,
+    _decode_root,
+    _header_inline_content,
+    _iter_lines,
+    _split_lines,
+    compute_depth,
+    parse_header,
+    parse_key,
+    parse_primitive,
+    split_row,
+)
+from .profiling import count_nodes
+from .types import DecodeOptions, JsonValue
+
+# Tables declaring fewer rows than this are decoded in-process
+PARALLEL_MIN_ROWS = 10000
+
+# Characters whose newlines are counted at once when skipping row lines
+_SCAN_BLOCK = 1 << 16
+
+# Lines that may be the header of a tabular array: "...]{fields}:" at the end
+_TABLE_HEADER_CANDIDATE = re.compile(r'\]\{[^\n]*\}:[ \t]*$', re.MULTILINE)
+
+
+class _Fallback(Exception):
+    """A planned table is not what the in-process decoder would read."""
+
+
+class _PlannedTable:
+    """A tabular array whose row lines are decoded by worker processes.
+
+    ``start`` and ``end`` delimit its row lines in the text and ``number``
+    is the line number of its header. ``chunks`` are the pending results of
+    each worker's share of the rows, in row order.
+    """
+
+    __slots__ = (
+        "number", "start", "end", "length", "delimiter", "width", "row_depth",
+        "converters", "intern", "chunks",
+    )
+
+    def __init__(
+        self,
+        number: int,
+        start: int,
+        end: int,
+        length: int,
+        delimiter: str,
+        width: int,
+        row_depth: int,
+    ) -> None:
+        self.number = number
+        self.start = start
+        self.end = end
+        self.length = length
+        self.delimiter = delimiter
+        self.width = width
+        self.row_depth = row_depth
+        self.converters: List[Callable[[str], Any]] = []
+        self.intern: Any = None
+        self.chunks: List[Future[Optional[List[List[Any]]]]] = []
+
+    def result(self) -> ParsedColumns:
+        """Merge the workers' columns in row order.
+
+        Raises:
+            _Fallback: If a worker found a line the in-process decoder would
+                read differently
+        """
+        columns: List[List[Any]] = [[] for _ in range(self.width)]
+        for future in self.chunks:
+            part = future.result()
+            if part is None:
+                raise _Fallback()
+            for column, values in zip(columns, part):
+                column.extend(values)
+        if self.intern is not None:
+            # Share strings as _column_converters(..., intern) does
+            columns = [
+                list(map(self.intern, column))
+                if convert is _convert_string or convert is parse_primitive
+                else column
+                for convert, column in zip(self.converters, columns)
+            ]
+        return ParsedColumns(columns, self.length)
+
+
+def decode_parallel(input_str: str, options: DecodeOptions, workers: int) -> JsonValue:
+    """Decode ``input_str`` with large tabular arrays split across ``workers`` processes.
+
+    A pre-scan finds tabular arrays declaring at least ``PARALLEL_MIN_ROWS``
+    rows. Their row lines are cut into one chunk per worker; each worker
+    splits and converts its rows with the column types inferred from the
+    table's leading rows, as the in-process decoder does, and returns one
+    list per column. Meanwhile the rest of the document is decoded in this
+    process, skipping the planned row lines, and each table's columns are
+    merged in order when its header is reached.
+
+    Planned tables are checked, not trusted: if a row line is not a
+    full-width row at the row depth, or a planned header is not decoded as
+    a tabular array, the whole input is decoded again in-process, so the
+    result (or error) is always the single-process one.
+
+    Raises:
+        ToonDecodeError: If input is malformed
+    """
+    profiler = options.profiler
+    if profiler is None:
+        return _decode_planned(input_str, options, workers)
+    with profiler.call("decode", {"parse_key": parse_key}):
+        with profiler.phase("decode.parallel"):
+            result = _decode_planned(input_str, options, workers)
+        profiler.count("decode.nodes", count_nodes(result))
+    return result
+
+
+def _decode_planned(input_str: str, options: DecodeOptions, workers: int) -> JsonValue:
+    plan = _plan_tables(input_str, options)
+    if not plan:
+        return _decode_serial(input_str, options)
+
+    context = DecodeContext.from_options(options)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for table in plan:
+            table.intern = context.intern_values
+            _submit(executor, input_str, table, options, workers)
+        context.parallel = {table.number: table for table in plan}
+        lines = _iter_unplanned_lines(input_str, plan, options.indent, options.strict)
+        try:
+            result = _decode_root(LineReader(lines), options.strict, None, context)
+            if context.parallel:
+                # A planned header was not decoded as a tabular array
+                raise _Fallback()
+        except (_Fallback, ToonDecodeError):
+            for table in plan:
+                for future in table.chunks:
+                    future.cancel()
+            return _decode_serial(input_str, options)
+    return context.finish(result)
+
+
+def _decode_serial(input_str: str, options: DecodeOptions) -> JsonValue:
+    context = DecodeContext.from_options(options)
+    lines = _iter_lines(_split_lines(input_str), options.indent, options.strict)
+    return context.finish(_decode_root(LineReader(lines), options.strict, None, context))
+
+
+def _plan_tables(input_str: str, options: DecodeOptions) -> List[_PlannedTable]:
+    """Find the tabular arrays large enough to decode in worker processes."""
+    plan: List[_PlannedTable] = []
+    position = 0
+    number = 1
+    for match in _TABLE_HEADER_CANDIDATE.finditer(input_str):
+        line_start = input_str.rfind("\n", 0, match.start()) + 1
+        if line_start < position:
+            # Inside the rows of the previous planned table
+            continue
+        raw = input_str[line_start:match.end()]
+        content = raw.strip()
+        if content.startswith(LIST_ITEM_MARKER):
+            content = content[len(LIST_ITEM_MARKER):].strip()
+        try:
+            header_info = parse_header(content)
+        except ToonDecodeError:
+            continue
+        if header_info is None:
+            continue
+        _, length, delimiter, fields = header_info
+        if fields is None or length < PARALLEL_MIN_ROWS or _header_inline_content(content):
+            continue
+
+        try:
+            row_depth = compute_depth(raw, options.indent, options.strict) + 1
+        except ToonDecodeError:
+            continue
+        start = match.end() + 1
+        end = _end_of_lines(input_str, start, length)
+        if end is None or _continues_table(input_str, end, row_depth, delimiter, options):
+            continue
+
+        number += input_str.count("\n", position, line_start)
+        plan.append(
+            _PlannedTable(number, start, end, length, delimiter, len(fields), row_depth)
+        )
+        number += 1 + length
+        position = end
+    return plan
+
+
+def _end_of_lines(text: str, start: int, count: int) -> Optional[int]:
+    """Return the offset just past ``count`` lines from ``start``, or None if fewer remain."""
+    position = start
+    # Skip whole blocks by counting their newlines, then find the last few
+    while True:
+        block_end = position + _SCAN_BLOCK
+        newlines = text.count("\n", position, block_end)
+        if newlines >= count or block_end >= len(text):
+            break
+        count -= newlines
+        position = block_end
+    for _ in range(count):
+        if position >= len(text):
+            return None
+        newline = text.find("\n", position)
+        position = len(text) if newline == -1 else newline + 1
+    return position
+
+
+def _continues_table(
+    text: str, end: int, row_depth: int, delimiter: str, options: DecodeOptions
+) -> bool:
+    """Whether the in-process decoder could read past ``end`` as more rows."""
+    while end < len(text):
+        newline = text.find("\n", end)
+        if newline == -1:
+            newline = len(text)
+        raw = text[end:newline]
+        end = newline + 1
+        content = raw.strip()
+        if content:
+            try:
+                depth = compute_depth(raw, options.indent, options.strict)
+            except ToonDecodeError:
+                return True
+            return depth == row_depth and split_row(content, delimiter) is not None
+    return False
+
+
+def _submit(
+    executor: Executor, text: str, table: _PlannedTable, options: DecodeOptions, workers: int
+) -> None:
+    """Infer the table's column types and send its row lines to the workers."""
+    sample_end = min(_end_of_lines(text, table.start, INFERENCE_ROWS) or table.end, table.end)
+    samples = []
+    for raw in text[table.start:sample_end].split("\n"):
+        tokens = split_row(raw.strip(), table.delimiter) if raw.strip() else None
+        if tokens is not None:
+            samples.append(tokens)
+    table.converters = _column_converters(samples[:INFERENCE_ROWS], table.width)
+
+    # Cut the rows into one chunk per worker, at line ends near equal sizes
+    position = table.start
+    for i in range(1, workers + 1):
+        end = table.start + (table.end - table.start) * i // workers
+        newline = text.find("\n", end - 1, table.end) if i < workers else -1
+        end = table.end if newline == -1 else newline + 1
+        if end <= position:
+            continue
+        chunk = executor.submit(
+            _decode_rows,
+            text[position:end],
+            table.delimiter,
+            table.width,
+            table.row_depth,
+            options.indent,
+            options.strict,
+            table.converters,
+        )
+        table.chunks.append(chunk)
+        position = end
+
+
+def _decode_rows(
+    chunk: str,
+    delimiter: str,
+    width: int,
+    row_depth: int,
+    indent_size: int,
+    strict: bool,
+    converters: List[Callable[[str], Any]],
+) -> Optional[List[List[Any]]]:
+    """Worker: convert the row lines in ``chunk`` into one list per column.
+
+    Returns None as soon as a line is not a full-width row at ``row_depth``,
+    leaving it to the in-process decoder to read (or reject) the input.
+    """
+    if chunk.endswith("\n"):
+        chunk = chunk[:-1]
+    rows = []
+    for raw in chunk.split("\n"):
+        content = raw.strip()
+        if not content:
+            return None
+        try:
+            if compute_depth(raw, indent_size, strict) != row_depth:
+                return None
+        except ToonDecodeError:
+            return None
+        tokens = split_row(content, delimiter)
+        if tokens is None or len(tokens) != width:
+            return None
+        rows.append(tokens)
+    try:
+        return [list(map(convert, column)) for convert, column in zip(converters, zip(*rows))]
+    except ToonDecodeError:
+        return None
+
+
+def _iter_unplanned_lines(
+    text: str, plan: List[_PlannedTable], indent_size: int, strict: bool
+) -> Iterator[Line]:
+    """Yield the lines of ``text`` except the row lines of planned tables.
+
+    Line numbers are those of the full text.
+    """
+    position = 0
+    offset = 0
+    for table in plan + [None]:  # type: ignore[operator]
+        segment = text[position:] if table is None else text[position:table.start]
+        for line in _iter_lines(_split_lines(segment), indent_size, strict):
+            line.line_number += offset
+            yield line
+        if table is not None:
+            offset += segment.count("\n") + table.length
+            position = table.end
@@ -1,6 +1,7 @@
 """Primitive encoding utilities."""
 
 import re
+from functools import lru_cache
 from typing import List, Optional
 
 from .constants import (
@@ -130,6 +131,7 @@ def encode_string_literal(value: str, delimiter: str = COMMA) -> str:
     return f'{DOUBLE_QUOTE}{escape_string(value)}{DOUBLE_QUOTE}'
 
 
+@lru_cache(maxsize=4096)
 def encode_key(key: str) -> str:
     """Encode an object key.
 
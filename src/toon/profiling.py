@@ -0,0 +1,135 @@
+"""Optional phase-level profiling for encode and decode."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class Profiler:
+    """Collects per-phase wall time, node counts, array shapes and cache stats.
+
+    Pass an instance through ``EncodeOptions["profiler"]`` or
+    ``DecodeOptions(profiler=...)``. Numbers accumulate across calls until
+    ``reset()`` is called. If a ``callback`` is given, it receives a dict
+    with the numbers of each individual call as soon as that call finishes,
+    which makes it easy to forward them to a metrics pipeline.
+
+    Phase names are prefixed with the operation:
+
+    - ``encode.model_comments``, ``encode.normalize``, ``encode.encode_value``,
+      ``encode.join``
+    - ``decode.scan`` (line splitting and ``compute_depth``),
+      ``decode.headers``, ``decode.build``; ``decode_stream`` and
+      ``decode_file`` interleave these and report a single ``decode.stream``
+      or ``decode.file`` phase
+
+    Counters include ``<op>.calls``, ``<op>.nodes`` and
+    ``<op>.arrays.<shape>`` where shape is ``tabular``, ``inline``, ``list``,
+    ``empty`` or ``nested`` (arrays of arrays; encode only, the decoder
+    counts them as ``list``). Cache statistics come from the module-level
+    ``lru_cache`` helpers and are shared process-wide, so concurrent calls
+    in other threads are included in the deltas.
+
+    When no profiler is passed, none of this bookkeeping runs.
+    """
+
+    def __init__(self, callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> None:
+        """Initialize the profiler.
+
+        Args:
+            callback: Optional callable invoked with the numbers of every call
+        """
+        self.callback = callback
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all accumulated numbers."""
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.caches: Dict[str, List[int]] = {}
+        self._call: Optional[Dict[str, Any]] = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block and add the elapsed wall time to ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add ``seconds`` of wall time measured elsewhere to ``name``."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        if self._call is not None:
+            call_phases = self._call["phases"]
+            call_phases[name] = call_phases.get(name, 0.0) + seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to the counter ``name``."""
+        self.counters[name] = self.counters.get(name, 0) + n
+        if self._call is not None:
+            call_counters = self._call["counters"]
+            call_counters[name] = call_counters.get(name, 0) + n
+
+    def cache_hit_rate(self, name: str) -> float:
+        """Return the hit rate of a cache, or 0.0 if it was never used."""
+        hits, misses = self.caches.get(name, (0, 0))
+        total = hits + misses
+        return hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the accumulated numbers as plain dicts."""
+        return {
+            "phases": dict(self.phases),
+            "counters": dict(self.counters),
+            "caches": {
+                name: {"hits": hits, "misses": misses, "hit_rate": self.cache_hit_rate(name)}
+                for name, (hits, misses) in self.caches.items()
+            },
+        }
+
+    @contextmanager
+    def call(self, operation: str, caches: Dict[str, Any]) -> Iterator[None]:
+        """Track one encode or decode call.
+
+        Args:
+            operation: "encode" or "decode"
+            caches: Mapping from cache name to an ``lru_cache``-wrapped function
+        """
+        self._call = {"operation": operation, "phases": {}, "counters": {}, "caches": {}}
+        before = {name: _cache_counts(func) for name, func in caches.items()}
+        self.count(f"{operation}.calls")
+        try:
+            yield
+        finally:
+            call = self._call
+            self._call = None
+            for name, func in caches.items():
+                hits, misses = _cache_counts(func)
+                delta = (hits - before[name][0], misses - before[name][1])
+                totals = self.caches.setdefault(name, [0, 0])
+                totals[0] += delta[0]
+                totals[1] += delta[1]
+                call["caches"][name] = {"hits": delta[0], "misses": delta[1]}
+            if self.callback is not None:
+                self.callback(call)
+
+
+def _cache_counts(func: Any) -> Tuple[int, int]:
+    info = func.cache_info()
+    return info.hits, info.misses
+
+
+def count_nodes(value: Any) -> int:
+    """Count every value in a JSON-like tree, containers included."""
+    count = 0
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        count += 1
+        if isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return count
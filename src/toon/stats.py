@@ -0,0 +1,155 @@
+"""Per-path size accounting for TOON encoding."""
+
+from typing import Dict, List, Optional, Tuple
+
+from .tokens import TokenCounter, estimate_tokens
+from .types import Depth
+from .writer import LineWriter
+
+
+class PathSize:
+    """Byte, token and line counts attributed to one dotted path."""
+
+    __slots__ = ("bytes", "tokens", "lines")
+
+    def __init__(self, bytes: int = 0, tokens: int = 0, lines: int = 0) -> None:
+        self.bytes = bytes
+        self.tokens = tokens
+        self.lines = lines
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"bytes": self.bytes, "tokens": self.tokens, "lines": self.lines}
+
+    def __repr__(self) -> str:
+        return f"PathSize(bytes={self.bytes}, tokens={self.tokens}, lines={self.lines})"
+
+
+class SizeReport:
+    """Sizes of the encoded output broken down by dotted key path.
+
+    Every output line is attributed to the path of the value it belongs to
+    (tabular rows to their array, ``key: value`` lines to their field).
+    ``paths`` holds inclusive totals: a path's size includes everything
+    nested under it. Items of list-format arrays share the path of their
+    array, so ``items.id`` covers the ``id`` field of every item. Tabular
+    arrays are reported only at the array path: their rows are not split
+    per column, so ``orders`` has no ``orders.id`` entry.
+    """
+
+    def __init__(self) -> None:
+        self.total = PathSize()
+        self._own: Dict[str, PathSize] = {}
+        self._paths: Optional[Dict[str, PathSize]] = None
+
+    def record(self, path: str, size_bytes: int, tokens: int) -> None:
+        """Attribute one output line to a path.
+
+        Args:
+            path: Dotted key path ("" for the document root)
+            size_bytes: UTF-8 bytes of the line, including its newline
+            tokens: Estimated tokens of the line, including its newline
+        """
+        entry = self._own.get(path)
+        if entry is None:
+            entry = self._own[path] = PathSize()
+        entry.bytes += size_bytes
+        entry.tokens += tokens
+        entry.lines += 1
+        self.total.bytes += size_bytes
+        self.total.tokens += tokens
+        self.total.lines += 1
+        self._paths = None
+
+    @property
+    def paths(self) -> Dict[str, PathSize]:
+        """Inclusive sizes for every non-root path, keyed by dotted path."""
+        if self._paths is None:
+            rolled: Dict[str, PathSize] = {}
+            for path, own in self._own.items():
+                parts = path.split(".") if path else []
+                for end in range(1, len(parts) + 1):
+                    prefix = ".".join(parts[:end])
+                    entry = rolled.get(prefix)
+                    if entry is None:
+                        entry = rolled[prefix] = PathSize()
+                    entry.bytes += own.bytes
+                    entry.tokens += own.tokens
+                    entry.lines += own.lines
+            self._paths = rolled
+        return self._paths
+
+    def top(self, limit: int = 10, by: str = "bytes") -> List[Tuple[str, PathSize]]:
+        """Return the largest paths.
+
+        Args:
+            limit: Maximum number of entries
+            by: Sort key: "bytes", "tokens" or "lines"
+
+        Returns:
+            List of (path, size) pairs, largest first
+        """
+        if by not in PathSize.__slots__:
+            raise ValueError(f"Unknown sort key: {by}")
+        ranked = sorted(self.paths.items(), key=lambda item: getattr(item[1], by), reverse=True)
+        return ranked[:limit]
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Return the report as plain dicts, with the whole document under "$"."""
+        result = {"$": self.total.to_dict()}
+        for path, size in self.paths.items():
+            result[path] = size.to_dict()
+        return result
+
+    def format(self, limit: int = 20, by: str = "bytes") -> str:
+        """Render the largest paths as a text table.
+
+        Args:
+            limit: Maximum number of paths to list
+            by: Sort key: "bytes", "tokens" or "lines"
+
+        Returns:
+            Table with one row per path
+        """
+        rows = [("$", self.total)] + self.top(limit, by)
+        width = max(len(path) for path, _ in rows)
+        lines = [f"{'path':<{width}}  {'bytes':>10}  {'tokens':>8}  {'lines':>7}  {'share':>6}"]
+        total_bytes = self.total.bytes or 1
+        for path, size in rows:
+            share = 100.0 * size.bytes / total_bytes
+            lines.append(
+                f"{path:<{width}}  {size.bytes:>10}  {size.tokens:>8}  "
+                f"{size.lines:>7}  {share:>5.1f}%"
+            )
+        return "\n".join(lines)
+
+
+class StatsWriter(LineWriter):
+    """Line writer that records per-path sizes while it writes."""
+
+    def __init__(self, indent_size: int, token_counter: Optional[TokenCounter] = None) -> None:
+        """Initialize the stats writer.
+
+        Args:
+            indent_size: Number of spaces per indentation level
+            token_counter: Callable returning the token count of a string
+                (default: estimate_tokens)
+        """
+        super().__init__(indent_size)
+        self.report = SizeReport()
+        self._count = token_counter or estimate_tokens
+        self._last_parts: Optional[List[str]] = None
+        self._last_path = ""
+
+    def push(self, depth: Depth, content: str, path_parts: Optional[List[str]] = None) -> None:
+        line = f"{self._indentation_string * depth}{content}"
+        # Separator newline is attributed to every line but the first
+        separator = 1 if self._lines else 0
+        self._lines.append(line)
+
+        # Tabular rows and list items reuse the same path list
+        if path_parts is not self._last_parts:
+            self._last_parts = path_parts
+            self._last_path = ".".join(path_parts) if path_parts else ""
+
+        size = len(line) if line.isascii() else len(line.encode("utf-8"))
+        self.report.record(self._last_path, size + separator, self._count(line) + separator)
@@ -0,0 +1,29 @@
+"""Offline token estimation for TOON and other text formats."""
+
+import re
+from typing import Callable
+
+# Approximates a BPE tokenizer: short letter runs (with an optional leading
+# space), groups of up to three digits, single punctuation characters,
+# whitespace runs and newlines each count as one token. Long words are split
+# into several pieces by the bounded repetition.
+_TOKEN_PATTERN = re.compile(r" ?[A-Za-z]{1,6}| ?\d{1,3}|[^\sA-Za-z\d]| +|\n|\s")
+
+TokenCounter = Callable[[str], int]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a string.
+
+    The estimate is a fast, offline approximation of common BPE tokenizers.
+    It is meant for budgeting and relative comparisons, not exact billing.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count
+    """
+    if not text:
+        return 0
+    return len(_TOKEN_PATTERN.findall(text))
@@ -0,0 +1,394 @@
+"""Typed decoding: build dataclasses and Pydantic models while decoding."""
+
+import collections.abc
+import dataclasses
+import enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from .constants import NULL_LITERAL
+from .decoder import (
+    _BOOL_TOKENS,
+    _FLOAT_TOKEN,
+    _INT_TOKEN,
+    _PLAIN_TOKEN,
+    TableBuilder,
+    ToonDecodeError,
+    _rows_table,
+    parse_primitive,
+)
+
+try:  # ``int | None`` unions (Python 3.10+)
+    from types import UnionType
+except ImportError:  # pragma: no cover
+    UnionType = None  # type: ignore[assignment,misc]
+
+Converter = Callable[[Any], Any]
+
+
+class _RawTable:
+    """A tabular array kept as tokens until its target type is known.
+
+    With ``into``, tables are not converted while the document is built:
+    a table that lands in a list of models is mapped column by column onto
+    the model's fields, anything else is built as the options ask.
+    """
+
+    __slots__ = ("fields", "token_rows", "build")
+
+    def __init__(self, fields: List[str], token_rows: List[List[str]], build: TableBuilder) -> None:
+        self.fields = fields
+        self.token_rows = token_rows
+        self.build = build
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return _rows_table(self.fields, self.token_rows)
+
+    def materialize(self) -> Any:
+        return self.build(self.fields, self.token_rows)
+
+
+def raw_tables(build: TableBuilder) -> TableBuilder:
+    """Return a table builder that defers ``build`` until the target type is known."""
+    return lambda fields, token_rows: _RawTable(fields, list(token_rows), build)
+
+
+@lru_cache(maxsize=None)
+def compile_converter(target: Any) -> Converter:
+    """Return the converter from decoded values to ``target``, compiled once per type.
+
+    Supported targets are dataclasses, Pydantic models (v2 or v1), ``int``,
+    ``float``, ``str``, ``bool``, ``None``, enums, ``List[T]``,
+    ``Dict[str, T]``, ``Optional``/``Union`` and ``Any``.
+
+    Raises:
+        TypeError: If ``target`` is not a supported type
+    """
+    if target is Any or target is object:
+        return _plain
+    if target is None or target is type(None):
+        return _expect_none
+    if target in _SCALARS:
+        return _SCALARS[target]
+    if isinstance(target, type) and issubclass(target, enum.Enum):
+        return _enum_converter(target)
+    if _is_model(target):
+        return _ModelConverter(target)
+
+    origin, args = get_origin(target), get_args(target)
+    if _is_union(origin):
+        return _union_converter(args)
+    if target in (list, List, Sequence) or origin in (list, collections.abc.Sequence):
+        return _list_converter(args[0] if args else Any)
+    if target in (dict, Dict) or origin is dict:
+        return _dict_converter(args[1] if args else Any)
+    raise TypeError(f"Cannot decode into {target!r}")
+
+
+def _mismatch(expected: str, value: Any) -> ToonDecodeError:
+    if isinstance(value, _RawTable):
+        value = "a tabular array"
+    return ToonDecodeError(f"Expected {expected}, got {value!r}")
+
+
+def _plain(value: Any) -> Any:
+    """Return ``value`` with its deferred tables built, for ``Any`` targets."""
+    if isinstance(value, _RawTable):
+        return value.materialize()
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list, _RawTable)):
+                value[key] = _plain(item)
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, (dict, list, _RawTable)):
+                value[i] = _plain(item)
+    return value
+
+
+def _expect_none(value: Any) -> None:
+    if value is not None:
+        raise _mismatch("null", value)
+
+
+def _to_int(value: Any) -> int:
+    if value.__class__ is not int:
+        raise _mismatch("int", value)
+    return value
+
+
+def _to_float(value: Any) -> float:
+    if value.__class__ is not float and value.__class__ is not int:
+        raise _mismatch("float", value)
+    return float(value)
+
+
+def _to_str(value: Any) -> str:
+    if value.__class__ is not str:
+        raise _mismatch("str", value)
+    return value
+
+
+def _to_bool(value: Any) -> bool:
+    if value.__class__ is not bool:
+        raise _mismatch("bool", value)
+    return value
+
+
+_SCALARS: Dict[Any, Converter] = {int: _to_int, float: _to_float, str: _to_str, bool: _to_bool}
+
+
+def _enum_converter(cls: Any) -> Converter:
+    def convert(value: Any) -> Any:
+        try:
+            return cls(value)
+        except ValueError:
+            raise _mismatch(cls.__name__, value) from None
+    return convert
+
+
+def _is_union(origin: Any) -> bool:
+    return origin is Union or (UnionType is not None and origin is UnionType)
+
+
+def _union_converter(args: Tuple[Any, ...]) -> Converter:
+    nullable = type(None) in args
+    members = [arg for arg in args if arg is not type(None)]
+    if len(members) == 1:
+        inner = compile_converter(members[0])
+        if not nullable:
+            return inner
+        return lambda value: None if value is None else inner(value)
+
+    converters = [compile_converter(member) for member in members]
+    expected = " or ".join(getattr(member, "__name__", repr(member)) for member in members)
+
+    def convert(value: Any) -> Any:
+        if value is None and nullable:
+            return None
+        for member in converters:
+            try:
+                return member(value)
+            except ToonDecodeError:
+                continue
+        raise _mismatch(expected, value)
+    return convert
+
+
+def _list_converter(item_type: Any) -> Converter:
+    convert_item = compile_converter(item_type)
+    model = convert_item if isinstance(convert_item, _ModelConverter) else None
+
+    def convert(value: Any) -> List[Any]:
+        if isinstance(value, _RawTable):
+            if model is not None:
+                return model.table(value)
+            value = value.rows()
+        if not isinstance(value, list):
+            raise _mismatch("list", value)
+        return [convert_item(item) for item in value]
+    return convert
+
+
+def _dict_converter(value_type: Any) -> Converter:
+    convert_value = compile_converter(value_type)
+
+    def convert(value: Any) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            raise _mismatch("object", value)
+        return {key: convert_value(item) for key, item in value.items()}
+    return convert
+
+
+# (name, annotation, required) of every field a model is constructed from
+FieldSpec = Tuple[str, Any, bool]
+
+
+def _is_model(cls: Any) -> bool:
+    """Whether ``cls`` is a dataclass or a Pydantic (v2 or v1) model class."""
+    return isinstance(cls, type) and (
+        dataclasses.is_dataclass(cls)
+        or isinstance(getattr(cls, "model_fields", None), dict)
+        or (isinstance(getattr(cls, "__fields__", None), dict) and hasattr(cls, "construct"))
+    )
+
+
+def _model_fields(cls: Any) -> List[FieldSpec]:
+    """Return the fields of a dataclass or Pydantic model class."""
+    if dataclasses.is_dataclass(cls):
+        hints = get_type_hints(cls)
+        return [
+            (
+                f.name,
+                hints.get(f.name, Any),
+                f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING,
+            )
+            for f in dataclasses.fields(cls)
+            if f.init
+        ]
+    model_fields = getattr(cls, "model_fields", None)
+    if isinstance(model_fields, dict):  # Pydantic v2
+        return [(name, info.annotation, info.is_required()) for name, info in model_fields.items()]
+    # Pydantic v1
+    return [(name, info.outer_type_, info.required) for name, info in cls.__fields__.items()]
+
+
+def _model_constructor(cls: Any) -> Callable[..., Any]:
+    """Return how to build ``cls`` from already-converted keyword arguments.
+
+    Pydantic models are built with ``model_construct`` (``construct`` on
+    v1): every field value has been converted to its declared type, so the
+    second validation pass is skipped.
+    """
+    if dataclasses.is_dataclass(cls):
+        return cast(Callable[..., Any], cls)
+    return getattr(cls, "model_construct", None) or cls.construct
+
+
+class _ModelConverter:
+    """Converter for one dataclass or Pydantic model.
+
+    Field converters are compiled on first use, so self-referencing models
+    (``children: List["Node"]``) compile without recursing forever.
+    """
+
+    __slots__ = ("cls", "_fields", "_construct", "_token_parsers")
+
+    def __init__(self, cls: Any) -> None:
+        self.cls = cls
+        self._fields: Optional[List[Tuple[str, Converter, bool]]] = None
+        self._construct = _model_constructor(cls)
+        self._token_parsers: Dict[str, Callable[[str], Any]] = {}
+
+    def fields(self) -> List[Tuple[str, Converter, bool]]:
+        if self._fields is None:
+            specs = _model_fields(self.cls)
+            self._fields = [
+                (name, compile_converter(annotation), required)
+                for name, annotation, required in specs
+            ]
+            self._token_parsers = {
+                name: _token_parser(annotation) for name, annotation, _ in specs
+            }
+        return self._fields
+
+    def __call__(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise _mismatch(f"{self.cls.__name__} object", value)
+        kwargs = {}
+        for name, convert, required in self.fields():
+            if name in value:
+                try:
+                    kwargs[name] = convert(value[name])
+                except ToonDecodeError as e:
+                    raise ToonDecodeError(f"{self.cls.__name__}.{name}: {e}") from None
+            elif required:
+                raise ToonDecodeError(f"Missing field {name!r} for {self.cls.__name__}")
+        return self._construct(**kwargs)
+
+    def table(self, raw: _RawTable) -> List[Any]:
+        """Build one instance per row, converting each column by its field's type."""
+        index = {field: j for j, field in enumerate(raw.fields)}
+        token_rows = raw.token_rows
+        width = len(raw.fields)
+        if any(len(tokens) != width for tokens in token_rows):
+            # Ragged rows (non-strict mode): missing cells read as null
+            padding = [NULL_LITERAL] * width
+            token_rows = [(tokens + padding)[:width] for tokens in token_rows]
+
+        names = []
+        columns = []
+        for name, _, required in self.fields():
+            j = index.get(name)
+            if j is None:
+                if required:
+                    raise ToonDecodeError(f"Missing field {name!r} for {self.cls.__name__}")
+                continue
+            parse = self._token_parsers[name]
+            try:
+                columns.append(list(map(parse, [tokens[j] for tokens in token_rows])))
+            except ToonDecodeError as e:
+                raise ToonDecodeError(f"{self.cls.__name__}.{name}: {e}") from None
+            names.append(name)
+
+        construct = self._construct
+        if not names:
+            return [construct() for _ in token_rows]
+        return [construct(**dict(zip(names, values))) for values in zip(*columns)]
+
+
+def _parse_int(token: str) -> int:
+    token = token.strip()
+    if _INT_TOKEN.fullmatch(token):
+        return int(token)
+    raise _mismatch("int", token)
+
+
+def _parse_float(token: str) -> float:
+    token = token.strip()
+    if _FLOAT_TOKEN.fullmatch(token) or _INT_TOKEN.fullmatch(token):
+        return float(token)
+    raise _mismatch("float", token)
+
+
+def _parse_bool(token: str) -> bool:
+    token = token.strip()
+    value = _BOOL_TOKENS.get(token)
+    if value is None:
+        raise _mismatch("bool", token)
+    return value
+
+
+def _parse_str(token: str) -> str:
+    # Only tokens that parse_primitive reads as a string, as for other values
+    token = token.strip()
+    if _PLAIN_TOKEN.fullmatch(token) and token != NULL_LITERAL and token not in _BOOL_TOKENS:
+        return token
+    return _to_str(parse_primitive(token))
+
+
+_TOKEN_PARSERS: Dict[Any, Callable[[str], Any]] = {
+    int: _parse_int,
+    float: _parse_float,
+    bool: _parse_bool,
+    str: _parse_str,
+}
+
+
+def _token_parser(annotation: Any) -> Callable[[str], Any]:
+    """Return the parser from a tabular cell token to a field of type ``annotation``.
+
+    Scalar fields parse the token as their declared type directly instead
+    of guessing it with ``parse_primitive``; other fields parse the token
+    and then convert the value. Either way a cell is accepted exactly when
+    the same value outside a table would be, so an unquoted ``42`` is not a
+    ``str``.
+    """
+    nullable = False
+    target = annotation
+    if _is_union(get_origin(annotation)):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            nullable = len(members) != len(get_args(annotation))
+            target = members[0]
+
+    parse = _TOKEN_PARSERS.get(target)
+    if parse is None:
+        convert = compile_converter(annotation)
+        return lambda token: convert(parse_primitive(token))
+    if nullable:
+        return lambda token: None if token.strip() == NULL_LITERAL else parse(token)
+    return parse
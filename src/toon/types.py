@@ -1,6 +1,8 @@
 """Type definitions for pytoon."""
 
-from typing import Any, Dict, List, Literal, TypedDict, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypedDict, Union
+
+from .profiling import Profiler
 
 # JSON-compatible types
 JsonPrimitive = Union[str, int, float, bool, None]
@@ -12,6 +14,15 @@ JsonValue = Union[JsonPrimitive, JsonArray, JsonObject]
 Delimiter = str
 DelimiterKey = Literal["comma", "tab", "pipe"]
 
+# Output form of tabular arrays when decoding
+TabularOutput = Literal["rows", "columns", "numpy", "pandas"]
+
+# Row type of tabular arrays decoded as rows: a built-in name, or a callable
+# receiving the header fields and one row's values
+RowFactory = Union[
+    Literal["dict", "tuple", "namedtuple"], Callable[[Tuple[str, ...], Tuple[Any, ...]], Any]
+]
+
 
 class EncodeOptions(TypedDict, total=False):
     """Options for TOON encoding.
@@ -23,6 +34,7 @@ class EncodeOptions(TypedDict, total=False):
         comments: Optional mapping from dotted paths to comment text
         commentPrefix: Prefix for comment lines (default: '#')
         modelComments: Auto-extract comments from Pydantic BaseModel (default: True)
+        profiler: Optional Profiler that records phase timings and counters
     """
 
     indent: int
@@ -31,6 +43,7 @@ class EncodeOptions(TypedDict, total=False):
     comments: Dict[str, str]
     commentPrefix: str
     modelComments: bool
+    profiler: Profiler
 
 
 class ResolvedEncodeOptions:
@@ -43,12 +56,73 @@ class ResolvedEncodeOptions:
         length_marker: Literal["#", False] = False,
         comments: Dict[str, str] | None = None,
         comment_prefix: str = "#",
+        profiler: Optional[Profiler] = None,
     ) -> None:
         self.indent = indent
         self.delimiter = delimiter
         self.lengthMarker = length_marker
         self.comments: Dict[str, str] = comments or {}
         self.commentPrefix = comment_prefix
+        self.profiler = profiler
+
+
+class DecodeOptions:
+    """Options for TOON decoding.
+
+    Attributes:
+        indent: Number of spaces per indentation level (default: 2)
+        strict: Enable strict validation (default: True)
+        profiler: Optional Profiler that records phase timings and counters
+        tabular: Output form of tabular arrays: "rows" (list of dicts, the
+            default), "columns" (dict of lists), "numpy" (structured array,
+            needs NumPy) or "pandas" (DataFrame, needs pandas)
+        row_factory: Row type when ``tabular`` is "rows": "dict" (the
+            default), "tuple" (tuples in a ``TupleRows`` list carrying the
+            fields), "namedtuple" (one class per distinct header), or a
+            callable ``(fields, values) -> row``
+        intern_keys: Share equal object keys through a bounded intern table
+            (default: True)
+        intern_values: Also share equal short string values, e.g. the
+            categories of a status column (default: False)
+        object_hook: Called with every decoded object (a dict); its return
+            value is used in place of the dict, as in ``json.loads``
+        object_pairs_hook: Called with every decoded object as a list of
+            ``(key, value)`` pairs in document order; takes priority over
+            ``object_hook``
+        array_factory: Called with every decoded array (a list); its return
+            value is used in place of the list
+        trusted: Skip all validation, for input produced by ``encode``:
+            indentation, blank lines, row widths and declared lengths are
+            not checked, and tabular arrays are read as exactly their
+            declared number of rows. Behaviour on malformed input is
+            undefined (default: False)
+    """
+
+    def __init__(
+        self,
+        indent: int = 2,
+        strict: bool = True,
+        profiler: Optional[Profiler] = None,
+        tabular: TabularOutput = "rows",
+        row_factory: RowFactory = "dict",
+        intern_keys: bool = True,
+        intern_values: bool = False,
+        object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        object_pairs_hook: Optional[Callable[[List[Tuple[str, Any]]], Any]] = None,
+        array_factory: Optional[Callable[[List[Any]], Any]] = None,
+        trusted: bool = False,
+    ) -> None:
+        self.indent = indent
+        self.strict = strict
+        self.profiler = profiler
+        self.tabular = tabular
+        self.row_factory = row_factory
+        self.intern_keys = intern_keys
+        self.intern_values = intern_values
+        self.object_hook = object_hook
+        self.object_pairs_hook = object_pairs_hook
+        self.array_factory = array_factory
+        self.trusted = trusted
 
 
 # Depth type for tracking indentation level
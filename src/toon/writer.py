@@ -1,8 +1,10 @@
 """Line writer for managing indented output."""
 
-from typing import List
+from typing import List, Optional
 
-from .types import Depth
+from .primitives import format_header
+from .tokens import TokenCounter, estimate_tokens
+from .types import Depth, ResolvedEncodeOptions
 
 
 class LineWriter:
@@ -17,16 +19,62 @@ class LineWriter:
         self._lines: List[str] = []
         self._indentation_string = " " * indent_size
 
-    def push(self, depth: Depth, content: str) -> None:
+    def push(self, depth: Depth, content: str, path_parts: Optional[List[str]] = None) -> None:
         """Add a line with appropriate indentation.
 
         Args:
             depth: Indentation depth level
             content: Content to add
+            path_parts: Key path of the value the line belongs to
         """
         indent = self._indentation_string * depth
         self._lines.append(f"{indent}{content}")
 
+    def push_comment(
+        self, depth: Depth, content: str, path_parts: Optional[List[str]] = None
+    ) -> None:
+        """Add a comment line.
+
+        Structure-aware writers override this; the default just pushes the line.
+
+        Args:
+            depth: Indentation depth level
+            content: Comment line content, including its prefix
+            path_parts: Key path of the commented value
+        """
+        self.push(depth, content, path_parts)
+
+    def push_object_header(
+        self, depth: Depth, content: str, path_parts: Optional[List[str]] = None
+    ) -> None:
+        """Add a ``key:`` line that opens a nested object.
+
+        Args:
+            depth: Indentation depth level
+            content: Encoded key followed by a colon
+            path_parts: Key path of the object
+        """
+        self.push(depth, content, path_parts)
+
+    def push_tabular_header(
+        self,
+        depth: Depth,
+        content: str,
+        key: Optional[str],
+        fields: List[str],
+        path_parts: Optional[List[str]] = None,
+    ) -> None:
+        """Add the header line of a tabular array.
+
+        Args:
+            depth: Indentation depth level
+            content: Formatted header line
+            key: Optional key name of the array
+            fields: Field names of the table
+            path_parts: Key path of the array
+        """
+        self.push(depth, content, path_parts)
+
     def to_string(self) -> str:
         """Return all lines joined with newlines.
 
@@ -34,3 +82,179 @@ class LineWriter:
             Complete output string
         """
         return "\n".join(self._lines)
+
+
+class _ChunkLine:
+    """A buffered line of the chunk being built."""
+
+    __slots__ = ("depth", "content", "kind", "key", "fields", "rows")
+
+    def __init__(
+        self,
+        depth: Depth,
+        content: str,
+        kind: str,
+        key: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> None:
+        self.depth = depth
+        self.content = content
+        self.kind = kind
+        self.key = key
+        self.fields = fields
+        self.rows = 0
+
+    def copy(self) -> "_ChunkLine":
+        return _ChunkLine(self.depth, self.content, self.kind, self.key, self.fields)
+
+
+# Line kinds that can be repeated at the top of a new chunk
+_CONTEXT_KINDS = ("object", "table")
+
+
+class ChunkWriter(LineWriter):
+    """Splits encoder output into self-contained, token-bounded chunks.
+
+    Lines are grouped while they are pushed. When the next line would exceed
+    the budget, the current chunk is closed and a new one is opened that
+    repeats the enclosing ``key:`` lines and tabular header, so every chunk
+    decodes on its own. Tabular headers are re-rendered with the number of
+    rows that ended up in each chunk. A ``key:`` line or tabular header that
+    would end a chunk before any of its content moves to the next chunk, so
+    no chunk decodes to a spurious empty container.
+
+    Chunks are only split between fields of an object and between rows of
+    a tabular array. Content nested under list-format arrays is kept
+    together, so a single chunk may exceed the budget when one such unit
+    is larger than ``max_tokens``.
+    """
+
+    def __init__(
+        self,
+        options: ResolvedEncodeOptions,
+        max_tokens: int,
+        token_counter: Optional[TokenCounter] = None,
+    ) -> None:
+        """Initialize the chunk writer.
+
+        Args:
+            options: Resolved encoding options
+            max_tokens: Token budget per chunk
+            token_counter: Callable returning the token count of a string
+                (default: estimate_tokens)
+        """
+        super().__init__(options.indent)
+        self._options = options
+        self._max_tokens = max_tokens
+        self._count = token_counter or estimate_tokens
+        self._chunks: List[str] = []
+        self._buffer: List[_ChunkLine] = []
+        self._stack: List[_ChunkLine] = []
+        self._tokens = 0
+        self._after_comment = False
+
+    def push(self, depth: Depth, content: str, path_parts: Optional[List[str]] = None) -> None:
+        self._add(_ChunkLine(depth, content, "other"))
+
+    def push_comment(
+        self, depth: Depth, content: str, path_parts: Optional[List[str]] = None
+    ) -> None:
+        self._add(_ChunkLine(depth, content, "comment"))
+
+    def push_object_header(
+        self, depth: Depth, content: str, path_parts: Optional[List[str]] = None
+    ) -> None:
+        self._add(_ChunkLine(depth, content, "object"))
+
+    def push_tabular_header(
+        self,
+        depth: Depth,
+        content: str,
+        key: Optional[str],
+        fields: List[str],
+        path_parts: Optional[List[str]] = None,
+    ) -> None:
+        self._add(_ChunkLine(depth, content, "table", key, fields))
+
+    def chunks(self) -> List[str]:
+        """Close the current chunk and return all chunks.
+
+        Returns:
+            List of TOON-formatted strings
+        """
+        self._flush()
+        return self._chunks
+
+    def to_string(self) -> str:
+        return "\n".join(self.chunks())
+
+    def _cost(self, line: _ChunkLine) -> int:
+        # +1 for the newline that joins it to the next line
+        return self._count(f"{self._indentation_string * line.depth}{line.content}") + 1
+
+    def _split_point(self) -> Optional[int]:
+        """Return how many buffered lines close the chunk, or None to keep it open."""
+        if self._after_comment:
+            return None
+        if not all(entry.kind in _CONTEXT_KINDS for entry in self._stack):
+            return None
+        # Ancestors of the next line that end the buffer have no content in
+        # this chunk yet; leave them to the context of the next one
+        end = len(self._buffer)
+        depth = len(self._stack)
+        while depth and end and self._buffer[end - 1] is self._stack[depth - 1]:
+            end -= 1
+            depth -= 1
+        if 0 < end < len(self._buffer) and self._buffer[end - 1].kind == "comment":
+            return None
+        # Nothing but the ancestors of the next line: splitting gains nothing
+        context = {id(entry) for entry in self._stack}
+        if all(id(entry) in context for entry in self._buffer[:end]):
+            return None
+        return end
+
+    def _add(self, line: _ChunkLine) -> None:
+        while self._stack and self._stack[-1].depth >= line.depth:
+            self._stack.pop()
+
+        cost = self._cost(line)
+        if self._tokens + cost > self._max_tokens:
+            end = self._split_point()
+            if end is not None:
+                del self._buffer[end:]
+                self._flush()
+                self._open_chunk()
+
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None and parent.kind == "table" and line.kind != "comment":
+            parent.rows += 1
+
+        self._buffer.append(line)
+        self._stack.append(line)
+        self._tokens += cost
+        self._after_comment = line.kind == "comment"
+
+    def _open_chunk(self) -> None:
+        context = [entry.copy() for entry in self._stack]
+        self._buffer = list(context)
+        self._stack = context
+        self._tokens = sum(self._cost(entry) for entry in context)
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        lines = []
+        for entry in self._buffer:
+            content = entry.content
+            if entry.kind == "table":
+                content = format_header(
+                    entry.key,
+                    entry.rows,
+                    entry.fields,
+                    self._options.delimiter,
+                    self._options.lengthMarker,
+                )
+            lines.append(f"{self._indentation_string * entry.depth}{content}")
+        self._chunks.append("\n".join(lines))
+        self._buffer = []
+        self._tokens = 0
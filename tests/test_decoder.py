@@ -1,8 +1,33 @@
 """Tests for TOON decoder."""
 
+import enum
+import io
+import itertools
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
 import pytest
 
-from toon import ToonDecodeError, decode
+from toon import (
+    LazyArray,
+    LazyObject,
+    Profiler,
+    ToonDecodeError,
+    ToonIndex,
+    ToonParser,
+    TupleRows,
+    build_index,
+    decode,
+    decode_file,
+    decode_lazy,
+    decode_stream,
+    encode,
+    iterparse,
+    row_class,
+)
+from toon.cli import main
 from toon.types import DecodeOptions
 
 
@@ -245,6 +270,19 @@ class TestEdgeCases:
         with pytest.raises(ToonDecodeError, match="Invalid escape"):
             decode(toon)
 
+    def test_unescape_string(self):
+        """Test escape handling with and without backslashes."""
+        from toon.decoder import unescape_string
+
+        plain = "no escapes, just: text"
+        assert unescape_string(plain) is plain
+        assert unescape_string(r'a\\n\"b\"\tc\r\n') == 'a\\n"b"\tc\r\n'
+        assert unescape_string(r"\\\\") == "\\\\"
+        with pytest.raises(ToonDecodeError, match=r"Invalid escape sequence: \\u"):
+            unescape_string(r"\\\u0041")
+        with pytest.raises(ToonDecodeError, match="Unterminated"):
+            unescape_string("ends with \\")
+
     def test_unterminated_string(self):
         """Test that unterminated strings error."""
         toon = 'text: "unterminated'
@@ -348,3 +386,1036 @@ class TestRoundtrip:
         toon = encode(original)
         decoded = decode(toon)
         assert decoded == original
+
+    def test_roundtrip_arrays_in_mixed_list(self):
+        """Test primitive arrays nested in a list-format array."""
+        from toon import encode
+
+        # Empty inline arrays are written as "- [0,]:" with nothing after the colon
+        assert decode("items[2]:\n  - [0,]:\n  - [1,]: x") == {"items": [[], ["x"]]}
+        original = {"items": [1, [2, 3], {"id": 4}, []]}
+        assert decode(encode(original)) == original
+
+
+class TestProfiler:
+    """Test decode phase profiling."""
+
+    toon = """meta:
+  version: 1
+orders[2,]{id,sku}:
+  1,A1
+  2,A2
+tags[2]: a,b
+items[2]:
+  - id: 1
+  - name: x"""
+
+    def test_result_unchanged(self):
+        options = DecodeOptions(profiler=Profiler())
+        assert decode(self.toon, options) == decode(self.toon)
+
+    def test_phases_and_counters(self):
+        profiler = Profiler()
+        decode(self.toon, DecodeOptions(profiler=profiler))
+        assert set(profiler.phases) == {"decode.scan", "decode.headers", "decode.build"}
+        assert profiler.counters["decode.arrays.tabular"] == 1
+        assert profiler.counters["decode.arrays.inline"] == 1
+        assert profiler.counters["decode.arrays.list"] == 1
+        assert profiler.counters["decode.nodes"] == 18
+        assert "parse_key" in profiler.caches
+
+    def test_errors_match_plain_decode(self):
+        # The header error comes before the bad indentation on the next line
+        toon = "a: 1\nb[1]{a: 2\n   c: 3"
+        with pytest.raises(ToonDecodeError, match="Unterminated fields"):
+            decode(toon)
+        with pytest.raises(ToonDecodeError, match="Unterminated fields"):
+            decode(toon, DecodeOptions(profiler=Profiler()))
+
+    def test_trusted_input(self):
+        profiler = Profiler()
+        options = DecodeOptions(trusted=True, profiler=profiler)
+        assert decode(self.toon, options) == decode(self.toon)
+        assert profiler.counters["decode.arrays.tabular"] == 1
+
+    def test_header_errors_surface_in_build_phase(self):
+        with pytest.raises(ToonDecodeError, match="Unterminated fields"):
+            decode("items[1]{a,b:\n  1,2", DecodeOptions(profiler=Profiler()))
+
+
+class TestDecodeStream:
+    """Test decoding from files and line iterators."""
+
+    toon = """meta:
+  version: 1
+orders[2,]{id,sku}:
+  1,A1
+  2,A2
+items[3]:
+  -
+  - id: 1
+    note: "a: b"
+  - [2,]: 1,2
+"""
+
+    def test_matches_decode(self):
+        expected = decode(self.toon)
+        assert decode_stream(io.StringIO(self.toon)) == expected
+        assert decode_stream(line for line in self.toon.splitlines()) == expected
+        assert decode_stream(io.BytesIO(self.toon.encode("utf-8"))) == expected
+
+    def test_file(self, tmp_path):
+        path = tmp_path / "data.toon"
+        path.write_text(self.toon, encoding="utf-8")
+        with open(path, encoding="utf-8") as f:
+            assert decode_stream(f) == decode(self.toon)
+
+    def test_lone_list_marker_and_quoted_colon(self):
+        assert decode(self.toon)["items"] == [{}, {"id": 1, "note": "a: b"}, [1, 2]]
+
+    def test_options_and_errors(self):
+        lenient = DecodeOptions(strict=False)
+        assert decode_stream(["items[1]: a,b"], lenient) == {"items": ["a", "b"]}
+        with pytest.raises(ToonDecodeError, match="Expected 1 values"):
+            decode_stream(["items[1]: a,b"])
+        with pytest.raises(ToonDecodeError, match="Empty input"):
+            decode_stream([])
+
+    @pytest.mark.parametrize(
+        "options",
+        [DecodeOptions(), DecodeOptions(tabular="columns"), DecodeOptions(row_factory="tuple")],
+    )
+    def test_table_rows_converted_while_read(self, monkeypatch, options):
+        """Tables are converted in batches, without holding every row's tokens."""
+        import toon.decoder as decoder
+
+        monkeypatch.setattr(decoder, "TABLE_BATCH_ROWS", 10)
+        lines = ["t[100]{a,b}:"] + [f"  {i},x{i}" for i in range(100)]
+        read = []
+        converted_at = []
+
+        def source():
+            for line in lines:
+                read.append(line)
+                yield line
+
+        original = decoder._convert_int
+
+        def counting(token):
+            converted_at.append(len(read))
+            return original(token)
+
+        monkeypatch.setattr(decoder, "_convert_int", counting)
+        result = decode_stream(source(), options)
+        assert result == decode("\n".join(lines), options)
+        # The first values are converted once the sample rows have been read
+        assert converted_at[0] <= decoder.INFERENCE_ROWS + 2
+        assert converted_at[-1] == len(lines)
+
+    def test_ragged_batches_non_strict(self, monkeypatch):
+        import toon.decoder as decoder
+
+        monkeypatch.setattr(decoder, "TABLE_BATCH_ROWS", 4)
+        rows = [f"  {i},{i}" if i % 9 else f"  {i}" for i in range(50)]
+        toon = "t[50]{a,b}:\n" + "\n".join(rows)
+        options = DecodeOptions(strict=False)
+        assert decode(toon, options)["t"] == [
+            {"a": i, "b": i} if i % 9 else {"a": i} for i in range(50)
+        ]
+        assert decode(toon, DecodeOptions(strict=False, tabular="columns"))["t"] == {
+            "a": list(range(50)),
+            "b": [i if i % 9 else None for i in range(50)],
+        }
+
+    def test_profiler(self):
+        profiler = Profiler()
+        decode_stream(io.StringIO(self.toon), DecodeOptions(profiler=profiler))
+        assert "decode.stream" in profiler.phases
+        assert profiler.counters["decode.calls"] == 1
+
+
+def _build(events):
+    """Rebuild a value from iterparse events."""
+    stack = [[]]
+    keys = []
+    for event, value in events:
+        if event in ("start_object", "start_array"):
+            stack.append({} if event == "start_object" else [])
+            continue
+        if event == "key":
+            keys.append(value)
+            continue
+        if event in ("end_object", "end_array"):
+            value = stack.pop()
+        container = stack[-1]
+        if isinstance(container, dict):
+            container[keys.pop()] = value
+        else:
+            container.append(value)
+    return stack[0][0]
+
+
+class TestIterparse:
+    """Test the pull-parser event API."""
+
+    toon = """meta:
+  version: 1
+  owner:
+    name: Ada
+orders[2,]{id,sku}:
+  1,A1
+  2,A2
+items[4]:
+  -
+  - id: 1
+    tags[2]: a,b
+  - [2,]: 1,2
+  - plain"""
+
+    def test_events_rebuild_decode_result(self):
+        assert _build(iterparse(self.toon)) == decode(self.toon)
+        assert _build(iterparse("[3]: 1,2,3")) == [1, 2, 3]
+        assert _build(iterparse("hello")) == "hello"
+
+    def test_tabular_rows_are_streamed(self):
+        events = iterparse(self.toon)
+        for event, value in events:
+            if event == "start_array":
+                assert value == {"length": 2, "delimiter": ",", "fields": ["id", "sku"]}
+                break
+        assert next(events) == ("row", {"id": 1, "sku": "A1"})
+
+    def test_file_source(self):
+        assert _build(iterparse(io.StringIO(self.toon))) == decode(self.toon)
+
+    def test_errors_raised_when_reached(self):
+        events = iterparse("items[3,]{a}:\n  1\n  2")
+        first = [e for e, _ in itertools.islice(events, 4)]
+        assert first == ["start_object", "key", "start_array", "row"]
+        with pytest.raises(ToonDecodeError, match="Expected 3 rows, but got 2"):
+            list(events)
+
+    def test_deep_nesting_is_iterative(self):
+        depth = 10_000
+        options = DecodeOptions(indent=1)
+        toon = "\n".join(" " * i + f"k{i}:" for i in range(depth)) + "\n" + " " * depth + "v: 1"
+        node = _build(iterparse(toon, options))
+        for i in range(depth):
+            node = node[f"k{i}"]
+        assert node == {"v": 1}
+
+        lines = ["a0[1]:"] + [" " * i + f"- a{i}[1]:" for i in range(1, depth)]
+        toon = "\n".join(lines) + "\n" + " " * depth + "- leaf"
+        node = _build(iterparse(toon, options))
+        for i in range(depth):
+            node = node[f"a{i}"][0]
+        assert node == "leaf"
+
+
+class TestToonParser:
+    """Test the incremental push parser."""
+
+    toon = TestIterparse.toon + "\nstatus: done\n"
+
+    @pytest.mark.parametrize("step", [1, 5, 1000])
+    def test_chunked_feed_matches_decode(self, step):
+        parser = ToonParser()
+        for i in range(0, len(self.toon), step):
+            parser.feed(self.toon[i:i + step])
+        assert parser.close() == decode(self.toon)
+
+    def test_partial_includes_completed_rows(self):
+        parser = ToonParser()
+        parser.feed("orders[3]{id,sku}:\n  1,A1\n  2,A")
+        assert parser.partial() == {"orders": [{"id": 1, "sku": "A1"}]}
+        parser.feed("2\n  3,A3")
+        assert parser.partial() == {"orders": [{"id": 1, "sku": "A1"}, {"id": 2, "sku": "A2"}]}
+        assert parser.close()["orders"][-1] == {"id": 3, "sku": "A3"}
+
+    def test_incomplete_input_raises_on_close(self):
+        parser = ToonParser()
+        parser.feed("orders[3]{id,sku}:\n  1,A1\n")
+        assert parser.partial() == {"orders": [{"id": 1, "sku": "A1"}]}
+        with pytest.raises(ToonDecodeError, match="Expected 3 rows, but got 1"):
+            parser.close()
+
+    def test_non_strict_close(self):
+        parser = ToonParser(DecodeOptions(strict=False))
+        parser.feed("orders[3]{id,sku}:\n  1,A1\n")
+        assert parser.close() == {"orders": [{"id": 1, "sku": "A1"}]}
+
+    def test_root_forms(self):
+        for text in ["hello", "[3]: 1,2,3", "items[2]:\n  - 1\n  - x"]:
+            parser = ToonParser()
+            parser.feed(text)
+            assert parser.close() == decode(text)
+        with pytest.raises(ToonDecodeError, match="Empty input"):
+            ToonParser().close()
+
+    def test_feed_after_close(self):
+        parser = ToonParser()
+        parser.feed("a: 1")
+        parser.close()
+        with pytest.raises(ValueError):
+            parser.feed("b: 2")
+
+
+class TestDecodeLazy:
+    """Test lazy, on-access decoding."""
+
+    toon = TestToonParser.toon
+
+    def test_equals_decode(self):
+        assert decode_lazy(self.toon) == decode(self.toon)
+        assert decode_lazy("[3]: 1,2,3") == [1, 2, 3]
+        assert decode_lazy("hello") == "hello"
+
+    def test_proxies(self):
+        doc = decode_lazy(self.toon)
+        assert isinstance(doc, LazyObject)
+        assert list(doc) == ["meta", "orders", "items", "status"]
+        assert doc["meta"]["owner"]["name"] == "Ada"
+        assert doc["meta"] is doc["meta"]
+        assert doc["orders"][1] == {"id": 2, "sku": "A2"}
+        items = doc["items"]
+        assert isinstance(items, LazyArray)
+        assert len(items) == 4
+        assert items[-1] == "plain"
+        assert items[1:3] == [{"id": 1, "tags": ["a", "b"]}, [1, 2]]
+
+    def test_untouched_subtrees_are_not_decoded(self):
+        doc = decode_lazy("meta:\n  version: 1\nbroken:\n  x: \"unterminated\nrows[1]{a}:\n  1,2")
+        assert doc["meta"]["version"] == 1
+        with pytest.raises(ToonDecodeError, match="Unterminated string"):
+            doc["broken"]["x"]
+        with pytest.raises(ToonDecodeError, match="Expected 1 values"):
+            doc["rows"]
+
+
+class TestStructuralIndex:
+    """Test the structural line index and random access reads."""
+
+    data = {
+        "meta": {"version": 3, "owner": {"name": "Ada"}},
+        "orders": [{"id": i, "sku": f"S{i}"} for i in range(250)],
+        "items": [{"x": i, "tags": ["a", "b"]} if i % 2 else i for i in range(30)],
+        "tags": ["a", "b"],
+    }
+
+    @pytest.fixture
+    def toon_file(self, tmp_path):
+        path = tmp_path / "data.toon"
+        path.write_text(encode(self.data), encoding="utf-8")
+        return path
+
+    def test_entries(self, toon_file):
+        index = build_index(toon_file, stride=100)
+        assert set(index.entries) == {
+            "", "meta", "meta.version", "meta.owner", "meta.owner.name", "orders", "items", "tags",
+        }
+        orders = index["orders"]
+        assert (orders.kind, orders.depth, orders.length, orders.count) == ("array", 0, 250, 250)
+        assert len(orders.checkpoints) == 3
+        assert index["meta.owner"].line == 3
+        with open(toon_file, "rb") as f:
+            f.seek(orders.offset)
+            assert f.readline().startswith(b"orders[250")
+
+    def test_decode_path(self, toon_file):
+        index = build_index(toon_file)
+        assert index.decode_path("meta.owner") == {"name": "Ada"}
+        assert index.decode_path("orders") == self.data["orders"]
+        assert index.decode_path("") == self.data
+
+    def test_decode_item(self, toon_file):
+        index = build_index(toon_file, stride=16)
+        for position in [0, 15, 16, 17, 249, -1]:
+            assert index.decode_item("orders", position) == self.data["orders"][position]
+        for position in [0, 1, 16, 29]:
+            assert index.decode_item("items", position) == self.data["items"][position]
+        assert index.decode_item("tags", 1) == "b"
+        with pytest.raises(IndexError):
+            index.decode_item("orders", 250)
+        with pytest.raises(TypeError):
+            index.decode_item("meta", 0)
+
+    def test_root_array(self, tmp_path):
+        path = tmp_path / "rows.toon"
+        rows = [{"a": i} for i in range(10)]
+        path.write_text(encode(rows), encoding="utf-8")
+        index = build_index(path, stride=4)
+        assert index.decode_item("", 9) == {"a": 9}
+        assert index.decode_path("") == rows
+
+    def test_sidecar_roundtrip_and_staleness(self, toon_file, tmp_path):
+        build_index(toon_file).save(tmp_path / "data.toon.idx")
+        index = ToonIndex.load(tmp_path / "data.toon.idx")
+        assert index.decode_item("orders", 123) == {"id": 123, "sku": "S123"}
+        toon_file.write_text("changed: 1\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="changed"):
+            index.decode_path("meta")
+
+
+class TestDecodeFile:
+    """Test decoding files, memory-mapped or streamed."""
+
+    toon = TestToonParser.toon
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_matches_decode(self, tmp_path, use_mmap):
+        path = tmp_path / "data.toon"
+        path.write_bytes(self.toon.encode("utf-8"))
+        assert decode_file(path, mmap=use_mmap) == decode(self.toon)
+
+    def test_utf8_crlf_and_options(self, tmp_path):
+        path = tmp_path / "data.toon"
+        path.write_bytes("name: Zoë\r\ntags[2]: é,ü\r\nnested:\r\n   x: 1\r\n".encode())
+        expected = {"name": "Zoë", "tags": ["é", "ü"], "nested": {"x": 1}}
+        assert decode_file(path, DecodeOptions(strict=False)) == expected
+        with pytest.raises(ToonDecodeError, match="exact multiple"):
+            decode_file(path)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.toon"
+        path.write_bytes(b"")
+        with pytest.raises(ToonDecodeError, match="Empty input"):
+            decode_file(path)
+        assert decode_file(path, DecodeOptions(strict=False)) is None
+
+    def test_cli_decodes_toon_file(self, tmp_path, capsys):
+        path = tmp_path / "data.toon"
+        path.write_text(self.toon, encoding="utf-8")
+        assert main([str(path)]) == 0
+        assert json.loads(capsys.readouterr().out) == decode(self.toon)
+
+
+class TestSelect:
+    """Test projection decoding with select=."""
+
+    toon = """meta:
+  version: 3
+  owner:
+    name: Ada
+users[3,]{id,name,city}:
+  1,Ada,Paris
+  2,Bob,Tokyo
+  3,Cy,Rome
+items[4]:
+  - id: 1
+    meta:
+      owner: x
+      score: 0.5
+  - plain
+  -
+    id: 2
+    tags[2]: a,b
+  - [2,]: 1,2
+logs[2]:
+  - text: skipped
+  - text: also skipped"""
+
+    def test_paths(self):
+        result = decode(self.toon, select=["users[*].id", "meta.version"])
+        assert result == {"meta": {"version": 3}, "users": [{"id": 1}, {"id": 2}, {"id": 3}]}
+
+    def test_subtree_and_list_items(self):
+        result = decode(self.toon, select=["meta.owner", "items.id", "items.meta.score"])
+        assert result == {
+            "meta": {"owner": {"name": "Ada"}},
+            "items": [{"id": 1, "meta": {"score": 0.5}}, {"id": 2}],
+        }
+
+    def test_whole_document_and_nothing(self):
+        assert decode(self.toon, select=[""]) == decode(self.toon)
+        assert decode(self.toon, select=["users"])["users"] == decode(self.toon)["users"]
+        assert decode(self.toon, select=[]) == {}
+
+    def test_unselected_subtrees_are_not_parsed(self):
+        toon = 'meta:\n  version: 1\nbroken:\n  x: "unterminated\nrows[1]{a,b}:\n  1,"oops'
+        assert decode(toon, select=["meta"]) == {"meta": {"version": 1}}
+        assert decode(toon, select=["rows.a"]) == {"rows": [{"a": 1}]}
+
+    def test_root_array_and_stream(self):
+        assert decode("[2]{a,b}:\n  1,2\n  3,4", select=["[*].b"]) == [{"b": 2}, {"b": 4}]
+        selected = decode_stream(io.StringIO(self.toon), select=["meta.version"])
+        assert selected == {"meta": {"version": 3}}
+
+    def test_strict_row_counts_still_checked(self):
+        with pytest.raises(ToonDecodeError, match="Expected 2 rows"):
+            decode("rows[2]{a}:\n  1", select=["rows.a"])
+
+
+class TestScaling:
+    """Test that decoding is iterative and linear in the number of lines."""
+
+    depth = 10_000
+
+    def test_deeply_nested_objects(self):
+        lines = [" " * i + f"k{i}:" for i in range(self.depth)]
+        toon = "\n".join(lines) + "\n" + " " * self.depth + "leaf: 1"
+        node = decode(toon, DecodeOptions(indent=1))
+        for i in range(self.depth):
+            node = node[f"k{i}"]
+        assert node == {"leaf": 1}
+
+    def test_deeply_nested_list_items(self):
+        lines = ["a0[1]:"] + [" " * i + f"- a{i}[1]:" for i in range(1, self.depth)]
+        toon = "\n".join(lines) + "\n" + " " * self.depth + "- leaf"
+        node = decode(toon, DecodeOptions(indent=1))
+        for i in range(self.depth):
+            node = node[f"a{i}"][0]
+        assert node == "leaf"
+
+    @staticmethod
+    def _document(blocks):
+        """Ten lines per block: a chain of nested objects with a tabular leaf."""
+        block = (
+            "b{i}:\n  c:\n    c:\n      c:\n        v: {i}\n        t[3]{{x,y}}:\n"
+            "          1,2\n          3,4\n          5,6\n  w: 1"
+        )
+        return "\n".join(block.format(i=i) for i in range(blocks))
+
+    def test_work_per_line_is_constant(self, monkeypatch):
+        """Each line is advanced past once and classified at most once, at any size."""
+        import toon.decoder as decoder
+
+        counts = {"advance": 0, "classify": 0}
+        advance, classify = decoder.LineReader.advance, decoder.classify_line
+
+        def counting_advance(reader):
+            counts["advance"] += 1
+            advance(reader)
+
+        def counting_classify(content, list_items=True):
+            counts["classify"] += 1
+            return classify(content, list_items)
+
+        monkeypatch.setattr(decoder.LineReader, "advance", counting_advance)
+        monkeypatch.setattr(decoder, "classify_line", counting_classify)
+
+        work = []
+        for blocks in (1_000, 10_000):
+            counts.update(advance=0, classify=0)
+            result = decode(self._document(blocks))
+            assert len(result) == blocks
+            assert result[f"b{blocks - 1}"]["c"]["c"]["c"]["v"] == blocks - 1
+            assert counts["advance"] == blocks * 10
+            work.append(dict(counts))
+        # 10x the lines is exactly 10x the work
+        assert work[1] == {key: count * 10 for key, count in work[0].items()}
+
+
+class TestLineClassification:
+    """Test that each line is classified once and its pieces are reused."""
+
+    def test_classify_line_kinds(self):
+        from toon.decoder import LINE_FIELD, LINE_HEADER, LINE_ITEM, LINE_TEXT, classify_line
+
+        assert classify_line("name: Ada") == (LINE_FIELD, "name", "Ada")
+        assert classify_line('"a:b": 1') == (LINE_FIELD, "a:b", "1")
+        assert classify_line("tags[2]: x,y") == (LINE_HEADER, ("tags", 2, ",", None), "x,y")
+        assert classify_line("- id: 1") == (LINE_ITEM, (LINE_FIELD, "id", "1"), "id: 1")
+        assert classify_line("-") == (LINE_ITEM, None, "")
+        assert classify_line("1,2") == (LINE_TEXT, None, None)
+
+    def test_each_line_classified_once(self, monkeypatch):
+        import toon.decoder as decoder
+
+        calls = []
+        original = decoder.classify_line
+
+        def counting(content, list_items=True):
+            if list_items:  # Item content is classified as part of its line
+                calls.append(content)
+            return original(content, list_items)
+
+        monkeypatch.setattr(decoder, "classify_line", counting)
+        toon = "a:\n  b: 1\n  c[2]:\n    - x: 1\n      y: 2\n    - 3\nd: '4'"
+        assert decode(toon) == {"a": {"b": 1, "c": [{"x": 1, "y": 2}, 3]}, "d": "'4'"}
+        assert sorted(calls) == sorted(line.strip() for line in toon.split("\n"))
+
+        calls.clear()
+        decode(toon, DecodeOptions(profiler=Profiler()))
+        assert len(calls) == len(toon.split("\n"))
+
+
+class TestLineMemory:
+    """Test the compact line representations."""
+
+    def test_line_has_no_instance_dict(self):
+        from toon.decoder import Line
+
+        line = Line("a: 1", 0, 1)
+        assert not hasattr(line, "__dict__")
+        assert not line.is_blank and Line("", 0, 2).is_blank
+
+    def test_split_lines_matches_str_split(self):
+        from toon.decoder import _split_lines
+
+        for text in ["", "a", "a\n", "a\n\nb", "\n"]:
+            assert list(_split_lines(text)) == text.split("\n")
+
+    def test_lazy_document_uses_array_tables(self):
+        doc = decode_lazy("a:\n  b: 1\nc[2]:\n  - x\n  - y")
+        document = doc._document
+        assert document.depths.typecode == "I" and document.ends.typecode == "I"
+        assert list(document.ends) == [2, 2, 5, 4, 5]
+        assert doc == {"a": {"b": 1}, "c": ["x", "y"]}
+
+
+class TestRowTokenizer:
+    """Test the fused row classification and splitting."""
+
+    def test_split_row(self):
+        from toon.decoder import split_row
+
+        assert split_row("1,Ada,true", ",") == ["1", "Ada", "true"]
+        assert split_row('1,"a,b",c', ",") == ["1", '"a,b"', "c"]
+        assert split_row('"x:y",2', ",") == ['"x:y"', "2"]
+        assert split_row('"a\\"b,c",d', ",") == ['"a\\"b,c"', "d"]
+        assert split_row("1,12:30", ",") == ["1", "12:30"]
+        assert split_row("a|b,c", "|") == ["a", "b,c"]
+        assert split_row("a\tb", "\t") == ["a", "b"]
+        assert split_row("key: 1,2", ",") is None
+        assert split_row('key: "a,b"', ",") is None
+        assert split_row("a,b", "|") == ["a,b"]
+
+    def test_quoted_rows_decode(self):
+        toon = 't[3]{a,b}:\n  "x,y","p:q"\n  "",\n  1,"say \\"hi\\", ok"\nafter: 1'
+        assert decode(toon) == {
+            "t": [{"a": "x,y", "b": "p:q"}, {"a": "", "b": ""}, {"a": 1, "b": 'say "hi", ok'}],
+            "after": 1,
+        }
+
+
+class TestColumnInference:
+    """Test per-column type inference for tabular arrays."""
+
+    def test_mismatches_fall_back_to_generic_parsing(self):
+        rows = [f"  {i},{i}.5,true,name{i}" for i in range(40)]
+        rows += ['  05,1e3,null,"quoted, text"', "  x,7,false,42", "  -0,-2.5,true,null"]
+        result = decode(f"t[{len(rows)}]{{a,b,c,d}}:\n" + "\n".join(rows))["t"]
+
+        assert result[0] == {"a": 0, "b": 0.5, "c": True, "d": "name0"}
+        assert result[40] == {"a": "05", "b": 1000.0, "c": None, "d": "quoted, text"}
+        assert result[41] == {"a": "x", "b": 7, "c": False, "d": 42}
+        assert result[42] == {"a": 0, "b": -2.5, "c": True, "d": None}
+        assert all(type(row["a"]) is int for row in result[:40])
+
+    def test_ragged_rows_non_strict(self):
+        toon = "t[3]{a,b}:\n  1,2\n  3\n  4,5,6"
+        result = decode(toon, DecodeOptions(strict=False))
+        assert result == {"t": [{"a": 1, "b": 2}, {"a": 3}, {"a": 4, "b": 5}]}
+
+    def test_streaming_rows_match_decode(self):
+        toon = 't[3]{a,b}:\n  1,"x"\n  2.5,y\n  true,null'
+        rows = [value for event, value in iterparse(toon) if event == "row"]
+        assert rows == decode(toon)["t"]
+
+
+class TestTabularOutput:
+    """Test the columnar forms of tabular arrays."""
+
+    toon = (
+        'users[3]{id,name,score}:\n  1,Ada,9.5\n  2,Bob,null\n  3,"C, D",7\n'
+        "meta:\n  runs[1]{n}:\n    4"
+    )
+
+    def test_columns(self):
+        result = decode(self.toon, DecodeOptions(tabular="columns"))
+        assert result == {
+            "users": {"id": [1, 2, 3], "name": ["Ada", "Bob", "C, D"], "score": [9.5, None, 7]},
+            "meta": {"runs": {"n": [4]}},
+        }
+
+    def test_columns_everywhere(self, tmp_path):
+        options = DecodeOptions(tabular="columns")
+        expected = decode(self.toon, options)
+        path = tmp_path / "doc.toon"
+        path.write_text(self.toon)
+
+        assert decode_stream(io.StringIO(self.toon), options) == expected
+        assert decode_file(path, options) == expected
+        assert decode_lazy(self.toon, options) == expected
+        assert decode(self.toon, DecodeOptions(tabular="columns", profiler=Profiler())) == expected
+        selected = decode(self.toon, options, select=["users.name"])
+        assert selected == {"users": {"name": ["Ada", "Bob", "C, D"]}}
+
+    def test_columns_pad_short_rows(self):
+        result = decode("t[2]{a,b}:\n  1\n  2,3,4", DecodeOptions(strict=False, tabular="columns"))
+        assert result == {"t": {"a": [1, 2], "b": [None, 3]}}
+
+    def test_empty_table(self):
+        assert decode("t[0]{a,b}:", DecodeOptions(tabular="columns")) == {"t": {"a": [], "b": []}}
+
+    def test_unknown_output(self):
+        with pytest.raises(ValueError, match="Unknown tabular output"):
+            decode(self.toon, DecodeOptions(tabular="frames"))
+
+    def test_missing_dependency(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        with pytest.raises(ImportError, match="requires numpy"):
+            decode(self.toon, DecodeOptions(tabular="numpy"))
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+        result = decode(self.toon, DecodeOptions(tabular="numpy"))["users"]
+        assert result.dtype["id"] == np.int64 and result.dtype["name"] == np.dtype(object)
+        assert result["id"].tolist() == [1, 2, 3]
+        assert result[2]["name"] == "C, D"
+
+    def test_pandas(self):
+        pd = pytest.importorskip("pandas")
+        frame = decode(self.toon, DecodeOptions(tabular="pandas"))["users"]
+        assert isinstance(frame, pd.DataFrame)
+        assert list(frame.columns) == ["id", "name", "score"]
+        assert frame["id"].tolist() == [1, 2, 3]
+
+
+class TestRowFactory:
+    """Test tabular rows built as tuples, namedtuples or by a callable."""
+
+    toon = "a[2]{id,name}:\n  1,Ada\n  2,Bob\nb[1]{id,name}:\n  3,Cy\nc[1]{x,class}:\n  4,5"
+
+    def test_tuple(self):
+        result = decode(self.toon, DecodeOptions(row_factory="tuple"))
+        assert isinstance(result["a"], TupleRows)
+        assert result["a"] == [(1, "Ada"), (2, "Bob")]
+        assert result["a"].fields == ("id", "name")
+
+    def test_namedtuple_class_shared_per_header(self):
+        result = decode(self.toon, DecodeOptions(row_factory="namedtuple"))
+        first, second = result["a"][0], result["b"][0]
+        assert (first.id, first.name) == (1, "Ada")
+        assert type(first) is type(second) is row_class(("id", "name"))
+        # Keywords and invalid identifiers are renamed positionally
+        assert result["c"][0]._fields == ("x", "_1")
+        assert result["c"][0] == (4, 5)
+
+    def test_callable(self):
+        calls = []
+
+        def factory(fields, values):
+            calls.append(fields)
+            return dict(zip(fields, values), n=len(calls))
+
+        result = decode(self.toon, DecodeOptions(row_factory=factory))
+        assert result["a"] == [{"id": 1, "name": "Ada", "n": 1}, {"id": 2, "name": "Bob", "n": 2}]
+        assert calls[0] is calls[1]
+
+    def test_list_items_stay_dicts(self):
+        toon = "items[2]:\n  - id: 1\n  - rows[1]{a}:\n    7"
+        expected = {"items": [{"id": 1}, {"rows": [(7,)]}]}
+        assert decode(toon, DecodeOptions(row_factory="tuple")) == expected
+
+    def test_unknown_factory(self):
+        with pytest.raises(ValueError, match="Unknown row factory"):
+            decode(self.toon, DecodeOptions(row_factory="record"))
+
+
+class TestInterning:
+    """Test the bounded intern table for keys and values."""
+
+    toon = (
+        "t[4]{id,status}:\n  1,active\n  2,closed\n  3,active\n  4,closed\n"
+        "items[2]:\n  - kind: widget\n  - kind: widget"
+    )
+
+    def test_values_shared_when_enabled(self):
+        result = decode(self.toon, DecodeOptions(intern_values=True))
+        assert result["t"][0]["status"] is result["t"][2]["status"]
+        assert result["items"][0]["kind"] is result["items"][1]["kind"]
+
+        result = decode(self.toon)
+        assert result["t"][0]["status"] is not result["t"][2]["status"]
+
+    def test_columnar_and_tuple_outputs_intern(self):
+        columns = decode(self.toon, DecodeOptions(tabular="columns", intern_values=True))["t"]
+        assert columns["status"][1] is columns["status"][3]
+        rows = decode(self.toon, DecodeOptions(row_factory="tuple", intern_values=True))["t"]
+        assert rows[1][1] is rows[3][1]
+
+    def test_saved_bytes_reported(self):
+        profiler = Profiler()
+        decode(self.toon, DecodeOptions(intern_values=True, profiler=profiler))
+        assert profiler.counters["decode.intern.hits"] == 3
+        assert profiler.counters["decode.intern.saved_bytes"] > 0
+
+    def test_table_is_bounded(self):
+        from toon.decoder import InternTable
+
+        intern = InternTable(max_size=1, max_length=4)
+        first, second = "".join(["a", "b"]), "".join(["c", "d"])
+        assert intern(first) is first
+        assert intern(second) is second
+        assert intern("".join(["a", "b"])) is first
+        assert intern("".join(["c", "d"])) is not second
+        long_value = "".join(["abc", "de"])
+        assert intern(long_value) is long_value
+        assert intern(7) == 7
+        assert (intern.hits, intern.max_size) == (1, 1)
+
+
+class Status(enum.Enum):
+    PAID = "paid"
+    SHIPPED = "shipped"
+
+
+@dataclass
+class LineItem:
+    sku: str
+    qty: int
+    price: float
+
+
+@dataclass
+class Order:
+    id: str
+    status: Status
+    items: List[LineItem]
+    note: Optional[str] = None
+
+
+@dataclass
+class TreeNode:
+    name: str
+    children: List["TreeNode"] = field(default_factory=list)
+
+
+class TestTypedDecode:
+    """Test decoding into dataclasses with into=."""
+
+    def test_nested_models(self):
+        toon = (
+            "orders[1]:\n"
+            "  - id: A1\n"
+            "    status: paid\n"
+            "    items[2]{sku,qty,price}:\n"
+            "      007,2,3\n"
+            "      \"X,Y\",1,1.5"
+        )
+        result = decode(toon, into=Dict[str, List[Order]])
+        order = result["orders"][0]
+        assert order == Order("A1", Status.PAID, [LineItem("007", 2, 3.0), LineItem("X,Y", 1, 1.5)])
+        # Cells are parsed as the declared field type, not guessed
+        assert isinstance(order.items[0].sku, str) and isinstance(order.items[0].price, float)
+
+    def test_matches_plain_decode(self):
+        rows = [{"sku": f"S{i}", "qty": i, "price": i / 4} for i in range(50)]
+        toon = encode(rows)
+        assert decode(toon, into=List[LineItem]) == [LineItem(**row) for row in decode(toon)]
+
+    def test_self_referencing_model(self):
+        toon = encode({"name": "root", "children": [{"name": "leaf", "children": []}]})
+        assert decode(toon, into=TreeNode) == TreeNode("root", [TreeNode("leaf")])
+
+    def test_any_fields_keep_configured_tables(self):
+        toon = "meta:\n  t[2]{a}:\n    1\n    2"
+        assert decode(toon, into=Dict[str, Any]) == {"meta": {"t": [{"a": 1}, {"a": 2}]}}
+        result = decode(toon, DecodeOptions(tabular="columns"), into=Dict[str, Dict[str, Any]])
+        assert result == {"meta": {"t": {"a": [1, 2]}}}
+
+    def test_optional_and_defaults(self):
+        toon = "[2]{id,status,items,note}:\n  A,paid,null,null\n  B,shipped,null,hi"
+        with pytest.raises(ToonDecodeError, match="Order.items: Expected list"):
+            decode(toon, into=List[Order])
+        toon = "id: A\nstatus: shipped\nitems[0]:"
+        assert decode(toon, into=Order) == Order("A", Status.SHIPPED, [])
+
+    @pytest.mark.parametrize(
+        "toon,into,message",
+        [
+            ("[1]{sku,qty,price}:\n  a,x,1", List[LineItem], "LineItem.qty: Expected int"),
+            ("[1]{sku,price}:\n  a,1", List[LineItem], "Missing field 'qty'"),
+            ("[1]{sku,qty,price}:\n  null,1,1", List[LineItem], "LineItem.sku: Expected str"),
+            ("[1]{sku,qty,price}:\n  42,1,1", List[LineItem], "LineItem.sku: Expected str"),
+            ("[1]{sku,qty,price}:\n  true,1,1", List[LineItem], "LineItem.sku: Expected str"),
+            ("sku: 42\nqty: 1\nprice: 1", LineItem, "LineItem.sku: Expected str"),
+            ("id: A\nstatus: lost\nitems[0]:", Order, "Order.status: Expected Status"),
+            ("a: true", Dict[str, int], "Expected int, got True"),
+        ],
+    )
+    def test_mismatch_raises(self, toon, into, message):
+        with pytest.raises(ToonDecodeError, match=message):
+            decode(toon, into=into)
+
+    def test_cells_are_stripped(self):
+        toon = '[2]{sku,qty,price}:\n  a , 1 , 2.5\n  "b" ,2, 3'
+        expected = [LineItem("a", 1, 2.5), LineItem("b", 2, 3.0)]
+        assert decode(toon, into=List[LineItem]) == expected
+        assert [LineItem(**row) for row in decode(toon)] == expected
+
+    def test_stream_and_file(self, tmp_path):
+        toon = encode([{"sku": "A", "qty": 1, "price": 2.5}])
+        path = tmp_path / "items.toon"
+        path.write_text(toon, encoding="utf-8")
+        expected = [LineItem("A", 1, 2.5)]
+        assert decode_stream(io.StringIO(toon), into=List[LineItem]) == expected
+        assert decode_file(path, into=List[LineItem]) == expected
+        assert decode_file(path, mmap=False, into=List[LineItem]) == expected
+
+    def test_unsupported_target(self):
+        with pytest.raises(TypeError, match="Cannot decode into"):
+            decode("a: 1", into=set)
+
+
+class TestDecodeHooks:
+    """Test object_hook, object_pairs_hook and array_factory."""
+
+    toon = (
+        "a:\n  b: 1\n  c[2]: 1,2\n"
+        "l[3]:\n  - x: 1\n    y:\n      z: 2\n  - [2]: 3,4\n  - 5\n"
+        "t[2]{p,q}:\n  1,2\n  3,4"
+    )
+
+    @staticmethod
+    def frozen(value):
+        """Convert plain decoded values the way the hooks below build them."""
+        if isinstance(value, dict):
+            return tuple((key, TestDecodeHooks.frozen(item)) for key, item in value.items())
+        if isinstance(value, list):
+            return tuple(TestDecodeHooks.frozen(item) for item in value)
+        return value
+
+    def test_hooks_replace_every_container(self):
+        options = DecodeOptions(object_hook=lambda obj: tuple(obj.items()), array_factory=tuple)
+        assert decode(self.toon, options) == self.frozen(decode(self.toon))
+
+    def test_pairs_hook_takes_priority(self):
+        calls = []
+        options = DecodeOptions(object_hook=calls.append, object_pairs_hook=lambda pairs: pairs)
+        result = decode(self.toon, options)
+        assert not calls
+        assert result[0] == ("a", [("b", 1), ("c", [1, 2])])
+        assert result[2][1] == [[("p", 1), ("q", 2)], [("p", 3), ("q", 4)]]
+
+    def test_root_arrays_and_streams(self):
+        options = DecodeOptions(array_factory=tuple)
+        assert decode("[2]: 1,2", options) == (1, 2)
+        assert decode("[2]:\n  - a: 1\n  - 2", options) == ({"a": 1}, 2)
+        assert decode_stream(io.StringIO(self.toon), options) == decode(self.toon, options)
+
+    def test_selection(self):
+        options = DecodeOptions(object_hook=lambda obj: tuple(obj.items()), array_factory=tuple)
+        result = decode(self.toon, options, select=["l", "t.p"])
+        assert result == self.frozen(decode(self.toon, select=["l", "t.p"]))
+
+    def test_non_dict_rows_only_get_array_factory(self):
+        toon = "t[2]{p,q}:\n  1,2\n  3,4"
+        options = DecodeOptions(row_factory="tuple", object_hook=dict.copy, array_factory=tuple)
+        assert decode(toon, options) == {"t": ((1, 2), (3, 4))}
+        options = DecodeOptions(tabular="columns", array_factory=tuple)
+        assert decode(toon, options) == {"t": {"p": [1, 3], "q": [2, 4]}}
+
+
+class TestParallelDecode:
+    """Test decode(workers=k) against single-process decode."""
+
+    @pytest.fixture(autouse=True)
+    def small_tables(self, monkeypatch):
+        import toon.parallel
+
+        monkeypatch.setattr(toon.parallel, "PARALLEL_MIN_ROWS", 20)
+
+    rows = [
+        {
+            "id": i,
+            "name": ["a", "b c", "d,e", 'q"x'][i % 4],
+            "score": i / 8,
+            "n": None if i % 7 else i,
+        }
+        for i in range(60)
+    ]
+
+    @pytest.mark.parametrize(
+        "toon",
+        [
+            encode({"a": rows, "meta": {"x": 1}, "b": [{"k": rows[:30]}, 3], "c": rows[:5]}),
+            encode(rows, {"delimiter": "|"}),
+            "x:\n  t[30]{a}:\n" + "\n".join(f"    {i}" for i in range(30)) + "\n  y: 2\nz: 3",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "options",
+        [
+            DecodeOptions(),
+            DecodeOptions(strict=False),
+            DecodeOptions(tabular="columns", intern_values=True),
+            DecodeOptions(row_factory="tuple", array_factory=tuple),
+        ],
+    )
+    def test_matches_single_process(self, toon, options):
+        assert decode(toon, options, workers=2) == decode(toon, options)
+
+    @pytest.mark.parametrize(
+        "toon",
+        [
+            "t[30]{a}:\n" + "\n".join(f"  {i}" for i in range(31)),
+            "t[30]{a}:\n" + "\n".join(f"  {i}" for i in range(29)),
+            "t[30]{a,b}:\n" + "\n".join(f"  {i},{i}" for i in range(15)) + "\n  1\n"
+            + "\n".join(f"  {i},{i}" for i in range(14)),
+        ],
+    )
+    def test_malformed_tables_fall_back(self, toon):
+        with pytest.raises(ToonDecodeError) as expected:
+            decode(toon)
+        with pytest.raises(ToonDecodeError, match=str(expected.value)):
+            decode(toon, workers=2)
+        options = DecodeOptions(strict=False)
+        assert decode(toon, options, workers=2) == decode(toon, options)
+
+    def test_unparsable_header_candidate(self):
+        toon = 'a:\n   b: 1\n"t[30]{a}:\n' + "\n".join(f"  {i}" for i in range(30))
+        with pytest.raises(ToonDecodeError, match="exact multiple"):
+            decode(toon, workers=2)
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            decode("a: 1", workers=0)
+
+
+class TestTrustedDecode:
+    """Test decode with trusted=True on encoder output."""
+
+    rows = [
+        {"id": i, "name": ["a", "b c", "d,e", 'q"x: y'][i % 4], "score": i / 8, "ok": i % 3 == 0}
+        for i in range(12)
+    ]
+    value = {
+        "a": rows,
+        "meta": {"x": 1, "tags": ["p", "q"]},
+        "b": [{"k": rows[:3], "after": 1}, 3, {"deep": {"z": None}}],
+        "c": rows[:2],
+        "tail": "end",
+    }
+
+    @pytest.mark.parametrize(
+        "encode_options",
+        [{}, {"delimiter": "|"}, {"delimiter": "\t"}, {"indent": 4}],
+    )
+    def test_matches_validating_decode(self, encode_options):
+        toon = encode(self.value, encode_options)
+        indent = encode_options.get("indent", 2)
+        expected = decode(toon, DecodeOptions(indent=indent))
+        assert expected == self.value
+        trusted = DecodeOptions(indent=indent, trusted=True)
+        assert decode(toon, trusted) == expected
+        assert decode_stream(io.StringIO(toon), trusted) == expected
+
+    def test_table_options(self):
+        toon = encode(self.value)
+        for options in (
+            DecodeOptions(tabular="columns", intern_values=True),
+            DecodeOptions(row_factory="tuple", array_factory=tuple),
+        ):
+            trusted = DecodeOptions(**{**vars(options), "trusted": True})
+            assert decode(toon, trusted) == decode(toon, options)
+
+    def test_skips_validation(self):
+        assert decode("a[3]: 1,2", DecodeOptions(trusted=True)) == {"a": [1, 2]}
+
+    def test_cli(self, tmp_path, capsys):
+        path = tmp_path / "data.toon"
+        path.write_text(encode(self.value))
+        assert main([str(path), "--decode", "--trusted"]) == 0
+        assert json.loads(capsys.readouterr().out) == self.value
@@ -1,6 +1,12 @@
 """Tests for TOON encoder."""
 
-from toon import encode
+import json
+from typing import Any
+
+import pytest
+
+from toon import Profiler, decode, encode, encode_chunks, encode_with_stats, estimate_tokens
+from toon.cli import main
 
 
 class TestPrimitives:
@@ -163,6 +169,16 @@ class TestMixedArrays:
         assert "- " in result
         assert "[3,]:" in result  # Inner arrays show length with delimiter
 
+    def test_primitive_array_in_mixed_list(self) -> None:
+        result = encode({"items": [1, [2, 3], []]})
+        assert result == "items[3]:\n  - 1\n  - [2,]: 2,3\n  - [0,]:"
+
+    @pytest.mark.parametrize("delimiter", [",", "|", "\t"])
+    def test_primitive_array_in_mixed_list_roundtrip(self, delimiter: str) -> None:
+        data = {"items": [1, [2, "a b"], {"id": 4}, [], ["x"]]}
+        assert decode(encode(data, {"delimiter": delimiter})) == data
+        assert decode(encode([[1, 2], "s", []], {"lengthMarker": "#"})) == [[1, 2], "s", []]
+
 
 class TestObjectsWithArrays:
     """Test objects containing arrays."""
@@ -292,3 +308,160 @@ class TestEdgeCases:
         arr = ["", "hello", ""]
         result = encode(arr)
         assert '""' in result
+
+
+class TestEncodeChunks:
+    """Test token-bounded chunking."""
+
+    data = {
+        "meta": {"version": 1},
+        "orders": [{"id": i, "name": f"item {i}", "price": i * 1.5} for i in range(40)],
+        "tags": ["a", "b"],
+    }
+
+    def test_single_chunk_when_budget_allows(self) -> None:
+        assert encode_chunks(self.data, 10_000) == [encode(self.data)]
+
+    def test_chunks_respect_budget(self) -> None:
+        chunks = encode_chunks(self.data, 50)
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert estimate_tokens(chunk) <= 50
+
+    def test_chunks_repeat_key_path_and_header(self) -> None:
+        chunks = encode_chunks({"shop": self.data}, 50)
+        for chunk in chunks[1:-1]:
+            assert chunk.startswith("shop:\n  orders[")
+            assert "]{id,name,price}:" in chunk
+
+    def test_each_chunk_decodes_on_its_own(self) -> None:
+        chunks = encode_chunks(self.data, 50)
+        decoded = [decode(chunk) for chunk in chunks]
+        rows = [row for part in decoded for row in part.get("orders", [])]
+        assert rows == decode(encode(self.data))["orders"]
+        assert decoded[0]["meta"] == {"version": 1}
+        assert decoded[-1]["tags"] == ["a", "b"]
+
+    def test_headers_are_not_left_without_content(self) -> None:
+        data = {
+            "note": "x y z w",
+            "a": {"b": {"c": 1, "d": 2}},
+            "rows": [{"k": i} for i in range(3)],
+        }
+
+        def has_empty(value: Any) -> bool:
+            if isinstance(value, dict):
+                return not value or any(has_empty(v) for v in value.values())
+            if isinstance(value, list):
+                return not value or any(has_empty(v) for v in value)
+            return False
+
+        for max_tokens in range(1, 40):
+            for chunk in encode_chunks(data, max_tokens):
+                assert not has_empty(decode(chunk)), (max_tokens, chunk)
+
+    def test_root_tabular_array(self) -> None:
+        rows = [{"id": i, "ok": True} for i in range(30)]
+        chunks = encode_chunks(rows, 20)
+        assert len(chunks) > 1
+        assert [row for chunk in chunks for row in decode(chunk)] == rows
+
+    def test_list_items_are_not_split(self) -> None:
+        data = {"items": [{"id": i, "tags": ["x", "y"]} for i in range(10)]}
+        assert encode_chunks(data, 5) == [encode(data)]
+
+    def test_custom_token_counter(self) -> None:
+        chunks = encode_chunks(self.data, 200, token_counter=len)
+        assert all(len(chunk) <= 200 for chunk in chunks)
+
+    def test_invalid_budget(self) -> None:
+        with pytest.raises(ValueError):
+            encode_chunks(self.data, 0)
+
+
+class TestEncodeWithStats:
+    """Test per-path size reporting."""
+
+    data = {
+        "meta": {"version": 1, "author": "Ada"},
+        "orders": [{"id": i, "name": f"item {i}"} for i in range(5)],
+        "items": [{"id": 1, "tags": ["a"]}, {"id": 2, "extra": {"q": 1}}],
+    }
+
+    def test_output_matches_encode(self) -> None:
+        text, _ = encode_with_stats(self.data)
+        assert text == encode(self.data)
+
+    def test_total_matches_output(self) -> None:
+        text, report = encode_with_stats({"name": "café", **self.data})
+        assert report.total.bytes == len(text.encode("utf-8"))
+        assert report.total.lines == len(text.splitlines())
+        assert report.total.tokens == pytest.approx(estimate_tokens(text), rel=0.1)
+
+    def test_paths_are_inclusive(self) -> None:
+        _, report = encode_with_stats(self.data)
+        paths = report.paths
+        assert paths["meta"].lines == 3
+        assert paths["meta.version"].lines == 1
+        assert paths["orders"].lines == 6
+        # Tabular rows are charged to the array, not split per column
+        assert "orders.id" not in paths
+        assert paths["items.extra"].lines == 2
+        assert paths["items.extra.q"].lines == 1
+        assert report.top(1)[0][0] == "orders"
+
+    def test_list_item_fields_include_array_key(self) -> None:
+        options = {"comments": {"items.extra": "Optional payload"}}
+        result = encode(self.data, options)
+        assert "    # Optional payload\n    extra:" in result
+
+    def test_cli_stats(self, tmp_path, capsys) -> None:
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(self.data), encoding="utf-8")
+        assert main(["stats", str(path), "--json"]) == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["$"]["bytes"] == len(encode(self.data).encode("utf-8"))
+        assert "orders" in report
+
+
+class TestProfiler:
+    """Test encode phase profiling."""
+
+    data = {
+        "meta": {"version": 1},
+        "orders": [{"id": i, "sku": f"A{i}"} for i in range(10)],
+        "tags": ["a", "b"],
+        "items": [{"id": 1}, {"name": "x"}],
+        "empty": [],
+    }
+
+    def test_output_unchanged(self) -> None:
+        assert encode(self.data, {"profiler": Profiler()}) == encode(self.data)
+
+    def test_phases_and_counters(self) -> None:
+        profiler = Profiler()
+        encode(self.data, {"profiler": profiler})
+        assert set(profiler.phases) == {
+            "encode.model_comments",
+            "encode.normalize",
+            "encode.encode_value",
+            "encode.join",
+        }
+        counters = profiler.counters
+        assert counters["encode.calls"] == 1
+        assert counters["encode.arrays.tabular"] == 1
+        assert counters["encode.arrays.inline"] == 1
+        assert counters["encode.arrays.list"] == 1
+        assert counters["encode.arrays.empty"] == 1
+        assert counters["encode.nodes"] == 43
+
+    def test_cache_stats_and_callback(self) -> None:
+        calls = []
+        profiler = Profiler(callback=calls.append)
+        encode(self.data, {"profiler": profiler})
+        encode(self.data, {"profiler": profiler})
+        assert profiler.counters["encode.calls"] == 2
+        assert len(calls) == 2
+        assert calls[1]["caches"]["encode_key"]["misses"] == 0
+        assert profiler.cache_hit_rate("encode_key") > 0.5
+        assert profiler.to_dict()["caches"]["encode_key"]["hits"] > 0